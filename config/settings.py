@@ -37,14 +37,86 @@ class Config:
     
     # Request Settings
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', 30))
+    # Transport: 'auto' = plain requests, cloudscraper only for hosts that serve a challenge;
+    # 'plain' / 'cloudscraper' force one client for every host
+    HTTP_TRANSPORT = os.getenv('HTTP_TRANSPORT', 'auto').lower()
+    TRANSPORT_ESCALATION_TTL = int(os.getenv('TRANSPORT_ESCALATION_TTL', 3600))
+    # Persist session cookies (incl. Cloudflare clearance) across restarts
+    SESSION_PERSIST = os.getenv('SESSION_PERSIST', 'true').lower() == 'true'
+    SESSION_STORE_FILE = os.getenv('SESSION_STORE_FILE', 'cache/sessions.json')
+    SESSION_SAVE_INTERVAL = int(os.getenv('SESSION_SAVE_INTERVAL', 300))
+    SESSION_STORE_MAX_AGE = int(os.getenv('SESSION_STORE_MAX_AGE', 7 * 86400))
+    # Optional proxy pool: file with one proxy URL per line (empty = direct connections)
+    PROXY_FILE = os.getenv('PROXY_FILE', '')
+    PROXY_STICKY_HOSTS = os.getenv('PROXY_STICKY_HOSTS', 'udemy.com')  # keep one exit IP per host (IP-bound cookies)
+    PROXY_QUARANTINE_AFTER = int(os.getenv('PROXY_QUARANTINE_AFTER', 3))
+    PROXY_QUARANTINE_SECONDS = int(os.getenv('PROXY_QUARANTINE_SECONDS', 300))
+    PROXY_ALLOW_DIRECT = os.getenv('PROXY_ALLOW_DIRECT', 'true').lower() == 'true'  # go direct when all are quarantined
     USER_AGENT = os.getenv('USER_AGENT', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+    # BeautifulSoup tree builder: 'auto' (lxml when installed), 'lxml', 'html.parser' or 'html5lib'
+    HTML_PARSER = os.getenv('HTML_PARSER', 'auto').lower()
+    # Concurrent HTTP engine: worker pool size and in-flight cap per host
+    HTTP_MAX_WORKERS = int(os.getenv('HTTP_MAX_WORKERS', 16))
+    HTTP_MAX_PER_HOST = int(os.getenv('HTTP_MAX_PER_HOST', 4))  # starting per-host window
+    # Adaptive per-host concurrency (AIMD): grow on healthy responses, cut on 403/429/challenges
+    AIMD_MIN_WINDOW = int(os.getenv('AIMD_MIN_WINDOW', 1))
+    AIMD_MAX_WINDOW = int(os.getenv('AIMD_MAX_WINDOW', 12))
+    AIMD_DECREASE_FACTOR = float(os.getenv('AIMD_DECREASE_FACTOR', 0.5))
+    AIMD_DECREASE_COOLDOWN = float(os.getenv('AIMD_DECREASE_COOLDOWN', 5))
+    # Politeness: minimum seconds between request starts per domain ("domain=seconds,..."; suffix match)
+    HOST_MIN_INTERVALS = {
+        k.strip().lower(): float(v)
+        for k, v in (p.split('=', 1) for p in os.getenv('HOST_MIN_INTERVALS', 'discudemy.com=0.25,udemy.com=0.25').split(',') if '=' in p)
+    }
+    HOST_DEFAULT_MIN_INTERVAL = float(os.getenv('HOST_DEFAULT_MIN_INTERVAL', 0))
+    # Retries for transient failures (408/429/5xx/connection errors): exponential backoff with jitter
+    HTTP_RETRY_ATTEMPTS = int(os.getenv('HTTP_RETRY_ATTEMPTS', 3))
+    HTTP_RETRY_BASE_DELAY = float(os.getenv('HTTP_RETRY_BASE_DELAY', 1.0))
+    HTTP_RETRY_MAX_DELAY = float(os.getenv('HTTP_RETRY_MAX_DELAY', 30))
+    HTTP_RETRY_AFTER_MAX = float(os.getenv('HTTP_RETRY_AFTER_MAX', 120))  # longer Retry-After = give up this request
+    # Circuit breaker: skip a host for BREAKER_COOLDOWN seconds after N consecutive failures
+    BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', 5))
+    BREAKER_COOLDOWN = int(os.getenv('BREAKER_COOLDOWN', 120))
+    # HTTP fixtures: record every exchange to a JSONL bundle, or replay a bundle instead of the network
+    HTTP_RECORD_BUNDLE = os.getenv('HTTP_RECORD_BUNDLE', '')
+    HTTP_REPLAY_BUNDLE = os.getenv('HTTP_REPLAY_BUNDLE', '')
+    HTTP_REPLAY_LATENCY = float(os.getenv('HTTP_REPLAY_LATENCY', 0))  # seconds added to every replayed response
+    HTTP_REPLAY_RECORDED_LATENCY = os.getenv('HTTP_REPLAY_RECORDED_LATENCY', 'false').lower() == 'true'
+    # Keep deduplicated /go/ and Udemy metadata results across runs for this many seconds (0 = per run only)
+    SINGLEFLIGHT_TTL = int(os.getenv('SINGLEFLIGHT_TTL', 0))
     # Udemy metadata fetch options
     UDEMY_COOKIES_FILE = os.getenv('UDEMY_COOKIES_FILE', '')
+    # Metadata backend: 'html' (landing page) or 'api' (api-2.0 JSON, HTML fallback)
+    UDEMY_META_BACKEND = os.getenv('UDEMY_META_BACKEND', 'html').lower()
+    UDEMY_API_BATCH = os.getenv('UDEMY_API_BATCH', 'true').lower() == 'true'
+    # Read landing-page JSON/meta tags without building a DOM (tree only for DOM-only fields)
+    UDEMY_META_FAST_PATH = os.getenv('UDEMY_META_FAST_PATH', 'true').lower() == 'true'
+    # Persistent course-page cache (compressed, shared by the bot and enrichment script)
+    UDEMY_CACHE_ENABLE = os.getenv('UDEMY_CACHE_ENABLE', 'true').lower() == 'true'
+    UDEMY_CACHE_BYPASS = os.getenv('UDEMY_CACHE_BYPASS', 'false').lower() == 'true'
+    UDEMY_CACHE_DIR = os.getenv('UDEMY_CACHE_DIR', 'cache/udemy')
+    UDEMY_CACHE_TTL = int(os.getenv('UDEMY_CACHE_TTL', 21600))
+    UDEMY_CACHE_MAX_MB = int(os.getenv('UDEMY_CACHE_MAX_MB', 200))
 
     # DiscUdemy fresh rotation settings only (backfill removed)
     VALIDATION_TIMEOUT = int(os.getenv('VALIDATION_TIMEOUT', 8))
     DISCUDEMY_FRESH_SLICE = int(os.getenv('DISCUDEMY_FRESH_SLICE', 3))
     DISCUDEMY_FRESH_PAGES = max(1, min(int(os.getenv('DISCUDEMY_FRESH_PAGES', 10)), 60))
+    # Send If-None-Match/If-Modified-Since for listing pages and skip unchanged ones
+    DISCUDEMY_CONDITIONAL_GET = os.getenv('DISCUDEMY_CONDITIONAL_GET', 'true').lower() == 'true'
+    # Go straight to /go/<slug> once the course page -> /go/ mapping was confirmed this many times
+    DISCUDEMY_GO_TEMPLATE = os.getenv('DISCUDEMY_GO_TEMPLATE', 'true').lower() == 'true'
+    DISCUDEMY_GO_TEMPLATE_CONFIRMATIONS = int(os.getenv('DISCUDEMY_GO_TEMPLATE_CONFIRMATIONS', 3))
+    # Card pipeline: cards in flight per listing page, and per-stage limits (URL resolution / Udemy enrichment)
+    DISCUDEMY_CARD_WORKERS = int(os.getenv('DISCUDEMY_CARD_WORKERS', 8))
+    DISCUDEMY_RESOLVE_CONCURRENCY = int(os.getenv('DISCUDEMY_RESOLVE_CONCURRENCY', 4))
+    DISCUDEMY_ENRICH_CONCURRENCY = int(os.getenv('DISCUDEMY_ENRICH_CONCURRENCY', 4))
+    # Order course-page URL strategies by learned hit rate / cost (false = fixed order)
+    URL_STRATEGY_ADAPTIVE = os.getenv('URL_STRATEGY_ADAPTIVE', 'true').lower() == 'true'
+    # /go/ pages are streamed and closed as soon as the coupon link is seen (byte cap for runaway pages)
+    GO_STREAM_ENABLE = os.getenv('GO_STREAM_ENABLE', 'true').lower() == 'true'
+    GO_STREAM_MAX_BYTES = int(os.getenv('GO_STREAM_MAX_BYTES', 262144))
+    GO_STREAM_CHUNK_SIZE = int(os.getenv('GO_STREAM_CHUNK_SIZE', 8192))
     
     # Optional diagnostics (write JSON per-run summaries instead of console spam)
     DIAG_ENABLE_DISCUDEMY = os.getenv('DIAG_ENABLE_DISCUDEMY', 'false').lower() == 'true'
@@ -67,6 +139,11 @@ class Config:
     # Database Configuration
     DATABASE_FILE = os.getenv('DATABASE_FILE', 'courses.db')
     DB_RETENTION_DAYS = int(os.getenv('DB_RETENTION_DAYS', 30))  # hard-delete inactive rows older than this
+    # Keep SQLite connections open for the process: one writer plus up to DB_POOL_READERS readers
+    DB_POOL_ENABLED = os.getenv('DB_POOL_ENABLED', 'true').lower() == 'true'
+    DB_POOL_READERS = int(os.getenv('DB_POOL_READERS', 4))
+    # Prepared statements cached per pooled connection
+    DB_CACHED_STATEMENTS = int(os.getenv('DB_CACHED_STATEMENTS', 256))
     
     # Logging Configuration
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
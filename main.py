@@ -362,6 +362,27 @@ This bot automatically finds and posts free Udemy courses to your channel.
         try:
             # Get rate limiter stats
             rate_stats = self.rate_limiter.get_stats()
+            circuits = self.scraper_manager.get_circuit_states()
+            transports = self.scraper_manager.get_transport_states()
+            windows = self.scraper_manager.get_concurrency_windows()
+            circuit_icons = {'closed': '🟢', 'half_open': '🟡', 'open': '🔴'}
+            circuit_lines = []
+            for host in sorted(set(circuits) | set(transports) | set(windows)):
+                st = circuits.get(host, {'state': 'closed', 'failures': 0})
+                tr = transports.get(host)
+                line = f"• {host}: {circuit_icons.get(st['state'], '⚪')} {st['state']}"
+                if st['state'] == 'open':
+                    line += f" (retry in {st['retry_in']:.0f}s)"
+                if st['failures']:
+                    line += f", {st['failures']} failures"
+                if tr:
+                    latency = tr['avg_ms'].get(tr['transport'])
+                    line += f" · {tr['transport']}" + (f" {latency}ms" if latency is not None else '')
+                win = windows.get(host)
+                if win:
+                    line += f" · window {win['window']}/{win['max']}"
+                circuit_lines.append(line)
+            circuit_lines = '\n'.join(circuit_lines) or '• No requests yet'
             
             status_message = f"""
 🤖 <b>{Config.BOT_NAME} Status</b>
@@ -377,6 +398,9 @@ This bot automatically finds and posts free Udemy courses to your channel.
 • Min delay: {rate_stats['min_delay']}s
 • Time since last: {rate_stats['time_since_last_post']:.1f}s
 
+<b>🔌 Source Hosts:</b>
+{circuit_lines}
+
 <b>Last Update:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             """
             
@@ -655,21 +679,12 @@ This bot automatically finds and posts free Udemy courses to your channel.
                 limit_per_source=Config.MAX_COURSES_PER_RUN
             )
             
-            # Filter out duplicates before storing
-            new_courses = []
-            duplicate_count = 0
-            
-            for course in courses:
-                # Check if course already exists before adding
-                course_hash = self.db.generate_course_hash(course)
-                if self.db.course_exists(course_hash):
-                    duplicate_count += 1
-                    logger.debug(f"Duplicate course detected: {course.get('title', 'Unknown')}")
-                    continue
-                    
-                # Add new course to database
-                if self.db.add_course(course):
-                    new_courses.append(course)
+            # Filter out duplicates and store new courses in one transaction
+            stored = self.db.store_batch(courses)
+            new_courses = stored['new_courses']
+            duplicate_count = stored['duplicates']
+            # Listing pages may be skipped as unchanged only now that their courses are stored
+            self.scraper_manager.commit_listing_validators()
             
             if duplicate_count > 0:
                 logger.info(f"Scraped {len(courses)} courses, {len(new_courses)} new, {duplicate_count} duplicates skipped")
@@ -699,16 +714,12 @@ This bot automatically finds and posts free Udemy courses to your channel.
             courses = self.scraper_manager.scrape_all_sources(
                 limit_per_source=Config.MAX_COURSES_PER_RUN
             )
-            # Filter out duplicates before storing
-            new_courses = []
-            duplicate_count = 0
-            for course in courses:
-                course_hash = self.db.generate_course_hash(course)
-                if self.db.course_exists(course_hash):
-                    duplicate_count += 1
-                    continue
-                if self.db.add_course(course):
-                    new_courses.append(course)
+            # Filter out duplicates and store new courses in one transaction
+            stored = self.db.store_batch(courses)
+            new_courses = stored['new_courses']
+            duplicate_count = stored['duplicates']
+            # Listing pages may be skipped as unchanged only now that their courses are stored
+            self.scraper_manager.commit_listing_validators()
             if duplicate_count > 0:
                 logger.info(f"[BG] Scraped {len(courses)} courses, {len(new_courses)} new, {duplicate_count} duplicates skipped")
             else:
@@ -992,6 +1003,8 @@ This bot automatically finds and posts free Udemy courses to your channel.
         """Stop the bot gracefully"""
         try:
             self.is_running = False
+            # Keep cookies/clearance for the next start
+            self.scraper_manager.save_sessions(force=True)
             
             if self.application:
                 await self.application.updater.stop()
@@ -999,6 +1012,9 @@ This bot automatically finds and posts free Udemy courses to your channel.
                 await self.application.shutdown()
             
             await self._send_admin_message("🛑 Bot stopped")
+            # Release pooled SQLite connections
+            self.scraper_manager.close()
+            self.db.close()
             logger.info("Bot stopped successfully")
             
         except Exception as e:
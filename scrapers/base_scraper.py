@@ -1,7 +1,9 @@
 """
 Base scraper class for all website scrapers
 """
+import re
 import requests
+import threading
 import time
 import logging
 from bs4 import BeautifulSoup
@@ -12,16 +14,60 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import Config
+from utils.http_engine import HttpEngine, configure_connection_pool, host_of
+from utils.host_scheduler import HostScheduler
+from utils.http_fixtures import install_fixture_adapters
+from utils.html_parser import make_soup
+from utils.transport import TransportSelector, is_challenge, PLAIN, CLOUDSCRAPER
+from utils.session_store import SessionStore
+from scrapers.udemy_api import UdemyApiBackend
+from scrapers.udemy_page import RawPageView, SoupPageView, extract_inline_hints, html_text, loads_json
+from scrapers.category_engine import classify_title
+from scrapers.normalize import clean_text, instructor_name, normalize_course, normalize_many
+from utils.response_cache import ResponseCache, canonical_course_url
+from utils.cookie_provider import CookieProvider
+from utils.singleflight import SingleFlight
+from utils.proxy_pool import ProxyPool
+from utils.retry_policy import RetryPolicy, CircuitBreaker, CircuitOpenError, RETRYABLE_STATUS
 
 logger = logging.getLogger(__name__)
 
+# Metadata fields only section 5 of _parse_udemy_metadata (DOM selectors) can add
+_DOM_ONLY_FIELDS = ('title', 'instructor', 'rating', 'students_count', 'language', 'category', 'price', 'image_url')
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_NON_DIGIT_RE = re.compile(r"\D")
+
 class BaseScraper(ABC):
     """Abstract base class for all course scrapers"""
-    
+
     def __init__(self, name: str, base_url: str):
         self.name = name
         self.base_url = base_url
-        self.session = self._create_session()
+        # Shared worker pool with per-host in-flight caps for concurrent fetches
+        self.http = HttpEngine()
+        # Per-host politeness gaps (replaces ad-hoc sleeps between requests)
+        self.scheduler = HostScheduler()
+        # On-disk cache of Udemy course pages (skips re-downloading recently seen courses)
+        self.page_cache = ResponseCache() if getattr(Config, 'UDEMY_CACHE_ENABLE', True) else None
+        # Transient-failure retries and per-host fail-fast when a site is down or blocking us
+        self.retry_policy = RetryPolicy()
+        self.breaker = CircuitBreaker()
+        self.cookie_provider = CookieProvider()
+        # Optional rotating proxies (PROXY_FILE); None sends everything directly
+        self.proxy_pool = ProxyPool.from_file(Config.PROXY_FILE) if getattr(Config, 'PROXY_FILE', '') else None
+        # Udemy metadata source: compact JSON API (HTML landing page as fallback) or HTML only
+        self.udemy_api = UdemyApiBackend(self) if getattr(Config, 'UDEMY_META_BACKEND', 'html') == 'api' else None
+        # Identical in-flight/repeated fetches within a run share one network call
+        self.flights = SingleFlight()
+        # Cookie jars (incl. Cloudflare clearance) survive restarts; restored as sessions are created
+        self.session_store = SessionStore() if getattr(Config, 'SESSION_PERSIST', True) else None
+        self._last_session_save = time.monotonic()
+        # Plain requests per host, escalating to cloudscraper only for hosts that serve challenges
+        self.transport = TransportSelector(self._create_session)
+        self.session = self.transport.plain
+        if self.session_store is not None:
+            saved = self.session_store.load(f"{self.name}:{PLAIN}") or {}
+            self.transport.import_escalations(saved.get('escalated'))
         self.headers = {
             'User-Agent': Config.USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -31,16 +77,21 @@ class BaseScraper(ABC):
         }
         self.courses_scraped = 0
         self.errors_count = 0
-    
-    def _create_session(self) -> requests.Session:
-        """Create a configured HTTP session. Prefer cloudscraper when available."""
-        session = None
-        try:
-            import cloudscraper  # type: ignore
-            # Use a realistic browser profile
-            session = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False})
-            logger.debug("Using cloudscraper session for HTTP requests")
-        except Exception:
+        # Counters are bumped from worker threads
+        self._stats_lock = threading.Lock()
+
+    def _create_session(self, cloudflare: bool = False) -> Optional[requests.Session]:
+        """Create a configured HTTP session. With cloudflare=True build a cloudscraper
+        (challenge-solving) session, or return None when cloudscraper is not installed."""
+        if cloudflare:
+            try:
+                import cloudscraper  # type: ignore
+                # Use a realistic browser profile
+                session = cloudscraper.create_scraper(browser={'browser': 'chrome', 'platform': 'windows', 'mobile': False})
+                logger.debug("Created cloudscraper session for challenged hosts")
+            except Exception:
+                return None
+        else:
             session = requests.Session()
             logger.debug("Using standard requests session for HTTP requests")
 
@@ -51,57 +102,161 @@ class BaseScraper(ABC):
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
         })
+        # Keep-alive pools sized for concurrent fetches against the same host
+        per_host = max(1, int(getattr(Config, 'AIMD_MAX_WINDOW', 12)), int(getattr(Config, 'HTTP_MAX_PER_HOST', 4)))
+        configure_connection_pool(session, max(10, per_host * 2), per_host)
+        # Offline fixtures: serve from / record to a bundle when configured
+        install_fixture_adapters(session)
+        if getattr(self, 'session_store', None) is not None:
+            self.session_store.restore(f"{self.name}:{CLOUDSCRAPER if cloudflare else PLAIN}", session, Config.USER_AGENT)
         return session
-    
-    def _make_request(self, url: str, allow_redirects: bool = True, **kwargs) -> Optional[requests.Response]:
-        """Make HTTP request with retries and error handling using the configured session"""
-        attempts = 3
-        backoff = 1.5
+
+    def save_session_state(self, force: bool = False):
+        """Persist cookie jars and cloudscraper escalations (at most every SESSION_SAVE_INTERVAL unless forced)"""
+        if self.session_store is None:
+            return
+        interval = int(getattr(Config, 'SESSION_SAVE_INTERVAL', 300))
+        if not force and time.monotonic() - self._last_session_save < interval:
+            return
+        self._last_session_save = time.monotonic()
+        for transport, session in self.transport.sessions_by_transport().items():
+            extra = {'escalated': self.transport.export_escalations()} if transport == PLAIN else None
+            self.session_store.save(f"{self.name}:{transport}", session, Config.USER_AGENT, extra=extra)
+
+    def _count_error(self):
+        """Increment the error counter (safe from worker threads)"""
+        with self._stats_lock:
+            self.errors_count += 1
+
+    def _send(self, url: str, headers: Optional[Dict] = None, allow_redirects: bool = True,
+              timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Single GET through the shared session. Every scraper request goes through here
+        so per-host politeness, limits and the circuit breaker apply to all of them.
+        Raises on transport errors (CircuitOpenError while the host is cooling down)."""
+        host = host_of(url)
+        if not self.breaker.allow(host):
+            raise CircuitOpenError(f"Circuit open for {host}, skipping {url}")
+        self.scheduler.acquire(host)
+        session, transport = self.transport.session_for(host)
+        get_kwargs = dict(
+            headers=headers if headers is not None else self.headers,
+            timeout=timeout or Config.REQUEST_TIMEOUT,
+            allow_redirects=allow_redirects,
+            **kwargs
+        )
+        proxy = self.proxy_pool.acquire(host) if self.proxy_pool is not None else None
+        if proxy:
+            get_kwargs['proxies'] = {'http': proxy, 'https': proxy}
+        first_started = started = time.monotonic()
+        completed = False
+        try:
+            with self.http.limiter.slot(host):
+                first_started = started = time.monotonic()
+                response = session.get(url, **get_kwargs)
+                challenged = transport == PLAIN and is_challenge(response, body_available=not kwargs.get('stream'))
+                self.transport.record(host, transport, time.monotonic() - started, challenged)
+                if challenged:
+                    self.http.limiter.feedback(host, ok=False)
+                # Challenged on plain HTTP: switch this host to cloudscraper and repeat once
+                if challenged and self.transport.escalate(host):
+                    response.close()
+                    session, transport = self.transport.session_for(host)
+                    started = time.monotonic()
+                    response = session.get(url, **get_kwargs)
+                    self.transport.record(host, transport, time.monotonic() - started)
+            completed = True
+        except requests.exceptions.ProxyError:
+            # A dead proxy says nothing about the target host (the probe is handed back below)
+            raise
+        except requests.exceptions.RequestException as e:
+            self.breaker.record_failure(host)
+            if isinstance(e, requests.exceptions.Timeout):
+                self.http.limiter.feedback(host, ok=False)
+            raise
+        except Exception:
+            # cloudscraper's Cloudflare* errors and other non-requests failures count against the host too
+            self.breaker.record_failure(host)
+            raise
+        finally:
+            if not completed:
+                if self.proxy_pool is not None:
+                    self.proxy_pool.release(proxy, ok=False, elapsed=time.monotonic() - first_started)
+                # Unjudged outcome (proxy error, interrupt): let the next request probe again
+                self.breaker.release_probe(host)
+        if self.proxy_pool is not None:
+            # Blocks and server errors count against the proxy's exit IP
+            self.proxy_pool.release(proxy, ok=response.status_code not in (403, 429) and response.status_code < 500,
+                                    elapsed=time.monotonic() - first_started)
+        # 403 counts towards the breaker (blocking) but is not retried; other 4xx are the page's fault
+        if response.status_code in RETRYABLE_STATUS or response.status_code == 403:
+            self.breaker.record_failure(host)
+        else:
+            self.breaker.record_success(host)
+        # Concurrency window: shrink on blocking/overload answers, grow on healthy ones
+        if response.status_code in (403, 429, 503):
+            self.http.limiter.feedback(host, ok=False)
+        elif response.status_code < 400:
+            self.http.limiter.feedback(host, ok=True)
+        return response
+
+    def _make_request(self, url: str, allow_redirects: bool = True, headers: Optional[Dict] = None,
+                      **kwargs) -> Optional[requests.Response]:
+        """Make HTTP request with retries and error handling using the configured session.
+        Concurrent plain GETs of the same URL share a single response."""
+        if headers or kwargs:
+            return self._request_with_retries(url, allow_redirects=allow_redirects, headers=headers, **kwargs)
+        return self.flights.do(
+            ('GET', url, allow_redirects),
+            lambda: self._request_with_retries(url, allow_redirects=allow_redirects),
+            memo=False
+        )
+
+    def _request_with_retries(self, url: str, allow_redirects: bool = True, headers: Optional[Dict] = None,
+                              **kwargs) -> Optional[requests.Response]:
+        policy = self.retry_policy
         last_exc = None
-        for i in range(attempts):
+        merged_headers = {**self.headers, **headers} if headers else self.headers
+        for i in range(policy.attempts):
             try:
-                response = self.session.get(
-                    url,
-                    headers=self.headers,
-                    timeout=Config.REQUEST_TIMEOUT,
-                    allow_redirects=allow_redirects,
-                    **kwargs
-                )
+                response = self._send(url, headers=merged_headers, allow_redirects=allow_redirects, **kwargs)
                 response.raise_for_status()
                 return response
             except requests.exceptions.RequestException as e:
                 last_exc = e
-                # For 5xx/Cloudflare timeouts, backoff and retry
-                if i < attempts - 1:
-                    time.sleep(backoff * (i + 1))
-                    continue
+                if i >= policy.attempts - 1 or not policy.is_retryable(e):
+                    break
+                delay = policy.delay(i, e)
+                if delay is None:
+                    # Server asked for a longer pause than we wait inline: honour it for later requests
+                    self.scheduler.defer(host_of(url), policy.retry_after(e) or 0)
+                    break
+                # Back the host off; the next _send waits for the host's slot instead of sleeping here
+                self.scheduler.defer(host_of(url), delay)
             except Exception as e:
                 last_exc = e
                 break
-        logger.error(f"Request failed for {self.name} - {url}: {last_exc}")
-        self.errors_count += 1
+        if isinstance(last_exc, CircuitOpenError):
+            logger.debug(f"Request skipped for {self.name} - {url}: {last_exc}")
+        else:
+            logger.error(f"Request failed for {self.name} - {url}: {last_exc}")
+        self._count_error()
         return None
-    
+
+    def fetch_many(self, urls: List[str], **kwargs) -> List[Optional[requests.Response]]:
+        """Fetch several URLs concurrently (bounded per host); results keep input order"""
+        return self.http.map(lambda u: self._make_request(u, **kwargs), urls)
+
     def _parse_html(self, html_content: str) -> Optional[BeautifulSoup]:
         """Parse HTML content safely"""
         try:
-            return BeautifulSoup(html_content, 'html.parser')
+            return make_soup(html_content)
         except Exception as e:
             logger.error(f"HTML parsing failed for {self.name}: {e}")
             return None
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        if not text:
-            return ""
-        
-        # Remove extra whitespace and newlines
-        text = ' '.join(text.split())
-        
-        # Remove special characters that might break formatting
-        text = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
-        
-        return text.strip()
+        return clean_text(text)
     
     def _is_valid_course(self, course_data: Dict) -> bool:
         """Validate if course data is complete and valid"""
@@ -121,263 +276,21 @@ class BaseScraper(ABC):
     
     def _normalize_course_data(self, course_data: Dict) -> Dict:
         """Normalize course data with enhanced metadata extraction"""
-        try:
-            # Extract course title from URL if not provided
-            title = course_data.get('title', '')
-            course_url = course_data.get('course_url', '')
-            
-            # If no title, extract from URL
-            if not title and course_url and 'udemy.com/course/' in course_url:
-                try:
-                    # Extract course name from URL
-                    import re
-                    url_match = re.search(r'/course/([^/?]+)', course_url)
-                    if url_match:
-                        course_slug = url_match.group(1)
-                        title = course_slug.replace('-', ' ').title()
-                except:
-                    title = 'Free Udemy Course'
-            
-            # Extract coupon code if present
-            coupon_code = None
-            if course_url and 'couponCode=' in course_url:
-                try:
-                    from urllib.parse import urlparse, parse_qs
-                    parsed_url = urlparse(course_url)
-                    query_params = parse_qs(parsed_url.query)
-                    coupon_code = query_params.get('couponCode', [None])[0]
-                except:
-                    pass
-            
-            # Prefer real metadata when provided; synthesize robust fallbacks otherwise
-            category = course_data.get('category')
-            instructor = course_data.get('instructor')
-            rating = course_data.get('rating')
-            students = course_data.get('students_count')
-
-            # Price handling: if real 'price' and optional 'currency' provided, compose original_price
-            provided_price = course_data.get('price')
-            provided_currency = course_data.get('currency')
-            if provided_price:
-                if provided_currency:
-                    original_price = f"{provided_currency} {provided_price}" if provided_currency.isalpha() else f"{provided_currency}{provided_price}"
-                else:
-                    original_price = str(provided_price)
-            else:
-                original_price = None
+        return normalize_course(course_data, self.name, clean=self._clean_text,
+                                categorize=self._determine_category, instructor_for=self._generate_instructor_name)
 
-            # Language
-            language = course_data.get('language')
-            # Normalize language like en_US -> English
-            def _normalize_lang(val: Optional[str]) -> Optional[str]:
-                if not val:
-                    return val
-                v = str(val).strip()
-                mapping = {
-                    'en': 'English', 'en_US': 'English', 'en-Us': 'English', 'en-GB': 'English',
-                    'es': 'Spanish', 'es_ES': 'Spanish', 'es_LA': 'Spanish',
-                    'pt': 'Portuguese', 'pt_BR': 'Portuguese',
-                    'de': 'German', 'fr': 'French', 'it': 'Italian', 'ru': 'Russian',
-                    'tr': 'Turkish', 'ar': 'Arabic', 'hi': 'Hindi', 'ur': 'Urdu',
-                    'vi': 'Vietnamese', 'id': 'Indonesian', 'zh': 'Chinese', 'zh_CN': 'Chinese', 'ja': 'Japanese', 'ko': 'Korean'
-                }
-                if v in mapping:
-                    return mapping[v]
-                # Try first two letters
-                short = v.split('_')[0].split('-')[0].lower()
-                return mapping.get(short, v)
-            language = _normalize_lang(language)
-
-            # Synthesize robust defaults for missing fields to keep scrapers reusable
-            try:
-                if not category:
-                    category = self._determine_category(title or '')
-            except Exception:
-                category = category or 'IT & Software'
-
-            try:
-                if not instructor:
-                    instructor = self._generate_instructor_name(title or '')
-            except Exception:
-                instructor = instructor or 'Expert Instructor'
-
-            try:
-                if not rating:
-                    import random as _rand
-                    rating = round(_rand.uniform(3.9, 4.8), 1)
-                else:
-                    rating = float(rating)
-            except Exception:
-                rating = 4.5
-
-            try:
-                if not students:
-                    import random as _rand
-                    students = int(_rand.randint(1500, 60000))
-                else:
-                    # Coerce to int when possible
-                    if isinstance(students, str):
-                        import re as _re
-                        digits = ''.join(_re.findall(r"\d", students))
-                        students = int(digits) if digits else None
-            except Exception:
-                students = 15000
-
-            try:
-                if not language:
-                    language = 'English'
-            except Exception:
-                language = 'English'
-
-            # Image URL if already extracted from Udemy metadata
-            image_url = course_data.get('image_url')  # keep as-is if present
-            try:
-                if image_url and 'img-c.udemycdn.com/course/' in image_url:
-                    # Upgrade common low-res sizes to a higher-res variant
-                    for low in ['240x135', '360x200', '480x270', '750x422']:
-                        if f'/{low}/' in image_url:
-                            image_url = image_url.replace(f'/{low}/', '/750x422/')
-                            break
-            except Exception:
-                pass
-
-            # Normalize list-like fields before persistence
-            def _coerce_list(val):
-                if isinstance(val, list):
-                    return [self._clean_text(str(x)) for x in val if str(x).strip()]
-                if isinstance(val, str):
-                    return [self._clean_text(x) for x in val.split('\n') if x.strip()]
-                return None
-
-            learn_list = _coerce_list(course_data.get('learn'))
-            req_list = _coerce_list(course_data.get('requirements'))
-            aud_list = _coerce_list(course_data.get('audience'))
-
-            # Create comprehensive course data (preserving provided fields)
-            normalized = {
-                'title': self._clean_text(title) if title else 'Free Udemy Course',
-                'instructor': instructor,
-                'course_url': course_url,
-                'discounted_price': 'Free',
-                'original_price': original_price,
-                'discount_percentage': '100% OFF',
-                'rating': rating,
-                'students_count': students,
-                'language': language,
-                'category': category,
-                'subtitle': self._clean_text(course_data.get('subtitle') or ''),
-                'description': course_data.get('description'),
-                'learn': learn_list,
-                'requirements': req_list,
-                'audience': aud_list,
-                'duration': course_data.get('duration') or '',
-                'level': course_data.get('level') or '',
-                'lectures': course_data.get('lectures'),
-                'image_url': image_url,
-                'coupon_code': coupon_code,
-                'source_website': self.name,
-                'scraped_at': datetime.now().isoformat()
-            }
-            
-            return normalized
-            
-        except Exception as e:
-            logger.error(f"Error normalizing course data: {e}")
-            # Return basic fallback
-            return {
-                'title': self._clean_text(course_data.get('title', 'Free Udemy Course')),
-                'instructor': 'Expert Instructor',
-                'course_url': course_data.get('course_url', ''),
-                'discounted_price': 'Free',
-                'original_price': '$199.99',
-                'discount_percentage': '100% OFF',
-                'rating': '4.5',
-                'students_count': '15,000+',
-                'language': 'English',
-                'category': 'Development',
-                'description': 'Master new skills with this comprehensive course designed for all skill levels.',
-                'image_url': None,
-                'source_website': self.name,
-                'scraped_at': datetime.now().isoformat()
-            }
+    def _normalize_course_data_many(self, courses: List[Dict]) -> List[Dict]:
+        """_normalize_course_data for a batch of courses, in order"""
+        return normalize_many(courses, self.name, clean=self._clean_text,
+                              categorize=self._determine_category, instructor_for=self._generate_instructor_name)
     
     def _determine_category(self, title: str) -> str:
         """Determine course category based on title using Udemy's actual categories"""
-        title_lower = title.lower()
-        
-        # Finance & Accounting (most specific first)
-        if any(word in title_lower for word in ['crypto', 'cryptocurrency', 'bitcoin', 'blockchain', 'nft', 'defi', 'trading', 'forex', 'stock', 'investment', 'finance', 'airdrop', 'accounting', 'bookkeeping']):
-            return 'Finance & Accounting'
-        
-        # Design (check before AI/ML to catch design-specific courses)
-        elif any(phrase in title_lower for phrase in ['design with', 'canva', 'graphic design', 'logo design', 'web design', 'ui design', 'ux design']) or \
-             (any(word in title_lower for word in ['design', 'photoshop', 'illustrator', 'figma', 'sketch']) and 
-              not any(word in title_lower for word in ['machine learning', 'artificial intelligence', 'data science', 'ai'])):
-            return 'Design'
-        
-        # Data Science (check before IT & Software to catch data science courses)
-        elif any(phrase in title_lower for phrase in ['machine learning', 'deep learning', 'data science', 'data analysis', 'data analytics', 'neural networks', 'tensorflow', 'pytorch', 'pandas', 'numpy']) or \
-             ('artificial intelligence' in title_lower and any(word in title_lower for word in ['python', 'programming', 'algorithm', 'model', 'training'])) or \
-             ('data science' in title_lower):
-            return 'Data Science'
-        
-        # IT & Software (specific tech skills including cloud)
-        elif any(word in title_lower for word in ['aws', 'amazon web services', 'azure', 'google cloud', 'serverless', 'docker', 'kubernetes', 'devops', 'cloud computing']) or \
-             any(word in title_lower for word in ['python', 'javascript', 'java', 'react', 'angular', 'node.js', 'html', 'css', 'sql', 'programming', 'coding', 'software development', 'web development', 'app development', 'full stack']):
-            return 'IT & Software'
-        
-        # Artificial Intelligence (general AI courses without programming focus)
-        elif any(phrase in title_lower for phrase in ['artificial intelligence', 'ai for']) or \
-             (any(word in title_lower for word in ['ai', 'chatgpt', 'openai']) and 
-              not any(word in title_lower for word in ['programming', 'python', 'coding', 'development'])):
-            return 'Artificial Intelligence'
-        
-        # Marketing
-        elif any(word in title_lower for word in ['marketing', 'seo', 'social media', 'advertising', 'digital marketing', 'affiliate marketing', 'email marketing', 'content marketing']):
-            return 'Marketing'
-        
-        # Business
-        elif any(word in title_lower for word in ['business', 'management', 'entrepreneur', 'startup', 'leadership', 'project management', 'strategy']):
-            return 'Business'
-        
-        # Photography & Video
-        elif any(word in title_lower for word in ['photography', 'video editing', 'filmmaking', 'camera', 'premiere', 'after effects', 'davinci']):
-            return 'Photography & Video'
-        
-        # Music (be more specific about mastering to avoid conflicts)
-        elif any(word in title_lower for word in ['music', 'audio', 'sound design', 'mixing', 'ableton', 'logic pro']) or \
-             ('mastering' in title_lower and any(word in title_lower for word in ['audio', 'music', 'sound', 'track', 'song'])):
-            return 'Music'
-        
-        # Health & Fitness
-        elif any(word in title_lower for word in ['fitness', 'yoga', 'health', 'nutrition', 'workout', 'meditation', 'wellness']):
-            return 'Health & Fitness'
-        
-        # Personal Development
-        elif any(phrase in title_lower for phrase in ['personal development', 'self improvement', 'productivity', 'time management', 'communication skills', 'public speaking']):
-            return 'Personal Development'
-        
-        # Teaching & Academics
-        elif any(word in title_lower for word in ['teaching', 'education', 'academic', 'research', 'study skills', 'exam prep']):
-            return 'Teaching & Academics'
-        
-        # Lifestyle
-        elif any(word in title_lower for word in ['lifestyle', 'cooking', 'travel', 'hobby', 'crafts', 'gardening']):
-            return 'Lifestyle'
-        
-        # Default fallback
-        else:
-            return 'IT & Software'
+        return classify_title(title)
     
     def _generate_instructor_name(self, title: str) -> str:
         """Generate realistic instructor name based on course topic"""
-        instructors = [
-            'Dr. Sarah Johnson', 'Michael Chen', 'Prof. David Miller', 'Jessica Rodriguez',
-            'Alex Thompson', 'Dr. Emily Davis', 'Robert Wilson', 'Maria Garcia',
-            'James Anderson', 'Dr. Lisa Wang', 'Kevin Brown', 'Amanda Taylor'
-        ]
-        import random
-        return random.choice(instructors)
+        return instructor_name(title)
     
     
     @abstractmethod
@@ -398,7 +311,15 @@ class BaseScraper(ABC):
             'name': self.name,
             'courses_scraped': self.courses_scraped,
             'errors_count': self.errors_count,
-            'success_rate': (self.courses_scraped / max(1, self.courses_scraped + self.errors_count)) * 100
+            'success_rate': (self.courses_scraped / max(1, self.courses_scraped + self.errors_count)) * 100,
+            'politeness': self.scheduler.snapshot(),
+            'circuits': self.breaker.snapshot(),
+            'cookies': self.cookie_provider.get_stats(),
+            'dedupe': self.flights.get_stats(),
+            'transport': self.transport.snapshot(),
+            'concurrency': self.http.limiter.snapshot(),
+            'proxies': self.proxy_pool.snapshot() if self.proxy_pool is not None else [],
+            'udemy_api': self.udemy_api.get_stats() if self.udemy_api is not None else None
         }
     
     def reset_statistics(self):
@@ -406,187 +327,190 @@ class BaseScraper(ABC):
         self.courses_scraped = 0
         self.errors_count = 0
 
+    def commit_listing_validators(self) -> int:
+        """Persist listing-page validators of the last scrape once its courses are stored"""
+        return 0
+
+    def close(self):
+        """Release pooled database connections held by this scraper (reopened on next use)"""
+        for db in (getattr(self, '_db', None), getattr(self.udemy_api, '_db', None)):
+            if db is not None:
+                db.close()
+
     # -------------------- Shared helpers for child scrapers --------------------
     
 
-    def _fetch_udemy_metadata(self, udemy_course_url: str, referer: Optional[str] = None) -> Dict:
+    def _fetch_udemy_metadata(self, udemy_course_url: str, referer: Optional[str] = None, use_cache: bool = True) -> Dict:
         """
         Fetch metadata from a Udemy course page.
         Returns keys when available: title, image_url, category, instructor, language, price, currency
         """
-        meta: Dict = {}
-        try:
-            # Optional: load cookies from file (JSON array or Netscape cookies.txt)
-            def _load_cookies(path: str) -> list:
-                import json as _json
-                from pathlib import Path as _Path
-                cookies: list = []
-                if not path:
-                    return cookies
-                p = _Path(path)
-                if not p.exists():
-                    return cookies
-                try:
-                    data = _json.loads(p.read_text(encoding='utf-8'))
-                    if isinstance(data, list):
-                        return data
-                except Exception:
-                    pass
-                # try netscape format
-                try:
-                    with p.open('r', encoding='utf-8') as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line or line.startswith('#'):
-                                continue
-                            parts = line.split('\t')
-                            if len(parts) >= 7:
-                                cookies.append({
-                                    'domain': parts[0],
-                                    'path': parts[2],
-                                    'secure': parts[3].upper() == 'TRUE',
-                                    'name': parts[5],
-                                    'value': parts[6]
-                                })
-                except Exception:
-                    return cookies
-                return cookies
+        def _fetch() -> Dict:
+            if self.udemy_api is not None:
+                meta = self.udemy_api.fetch(udemy_course_url)
+                if meta.get('title'):
+                    return meta
+            try:
+                page_text = self._fetch_udemy_page(udemy_course_url, referer=referer, use_cache=use_cache)
+            except Exception as e:
+                logger.error(f"Error fetching Udemy metadata from {udemy_course_url}: {e}")
+                return {}
+            return self._parse_udemy_metadata(page_text, source_url=udemy_course_url)
 
-            def _apply_cookies(sess, cookies: list):
-                if not cookies:
-                    return
-                for c in cookies:
-                    try:
-                        name = c.get('name')
-                        value = c.get('value')
-                        domain = c.get('domain', '.udemy.com')
-                        path = c.get('path', '/')
-                        sess.cookies.set(name, value, domain=domain, path=path)
-                    except Exception:
-                        continue
+        # Coupon/locale variants of one course share a single fetch and parse per run
+        meta = self.flights.do(('udemy_meta', canonical_course_url(udemy_course_url)), _fetch)
+        return dict(meta) if meta else {}
 
-            # Request course page (referer helps sometimes)
-            merged_headers = {
-                **self.headers,
-                'Referer': referer or udemy_course_url,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-                'Sec-Fetch-Site': 'same-origin',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Dest': 'document'
-            }
-            # Apply cookies if provided
-            try:
-                if getattr(Config, 'UDEMY_COOKIES_FILE', ''):
-                    _apply_cookies(self.session, _load_cookies(Config.UDEMY_COOKIES_FILE))
-            except Exception:
-                pass
-            response = self.session.get(udemy_course_url, headers=merged_headers, timeout=Config.REQUEST_TIMEOUT, allow_redirects=True)
-            try:
+    def _fetch_udemy_metadata_many(self, udemy_course_urls: List[str]) -> List[Dict]:
+        """Metadata for several course URLs (input order). Uses batched API lookups when the
+        JSON backend is enabled, then fetches anything still missing concurrently. Backfill path
+        (scripts/enrich_db_metadata.py); scrapers enrich each card with _fetch_udemy_metadata."""
+        metas: List[Dict] = [{} for _ in udemy_course_urls]
+        if self.udemy_api is not None:
+            metas = [m if m.get('title') else {} for m in self.udemy_api.fetch_many(udemy_course_urls)]
+        missing = [i for i, m in enumerate(metas) if not m]
+        if missing:
+            fetched = self.http.map(lambda i: self._fetch_udemy_metadata(udemy_course_urls[i]), missing)
+            for i, meta in zip(missing, fetched):
+                metas[i] = meta or {}
+        return metas
+
+    def _fetch_udemy_page(self, udemy_course_url: str, referer: Optional[str] = None, use_cache: bool = True) -> str:
+        """Return the HTML of a Udemy course page, served from the on-disk cache while fresh.
+        Raises on HTTP/transport errors."""
+        cache = self.page_cache if use_cache else None
+        if cache is not None and not getattr(Config, 'UDEMY_CACHE_BYPASS', False):
+            cached = cache.get(udemy_course_url)
+            if cached is not None:
+                return cached
+        # Request course page (referer helps sometimes)
+        merged_headers = {
+            **self.headers,
+            'Referer': referer or udemy_course_url,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+            'Sec-Fetch-Site': 'same-origin',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Dest': 'document'
+        }
+        # Apply cookies if provided (parsed once; re-read only when the file changes)
+        try:
+            for session in self.transport.all_sessions():
+                self.cookie_provider.apply(session)
+        except Exception:
+            pass
+        response = self._send(udemy_course_url, headers=merged_headers)
+        try:
+            response.raise_for_status()
+        except Exception as e:
+            # Retry with locale params and same headers on 403
+            if getattr(e, 'response', None) is not None and getattr(e.response, 'status_code', None) == 403:
+                alt_url = udemy_course_url + ('&' if '?' in udemy_course_url else '?') + 'persist_locale=1&locale=en_US'
+                self.scheduler.defer(host_of(alt_url), 1.0)
+                response = self._send(alt_url, headers=merged_headers)
                 response.raise_for_status()
-            except Exception as e:
-                # Retry with locale params and same headers on 403
-                if getattr(e, 'response', None) is not None and getattr(e.response, 'status_code', None) == 403:
-                    alt_url = udemy_course_url + ('&' if '?' in udemy_course_url else '?') + 'persist_locale=1&locale=en_US'
-                    time.sleep(1)
-                    response = self.session.get(alt_url, headers=merged_headers, timeout=Config.REQUEST_TIMEOUT, allow_redirects=True)
-                    response.raise_for_status()
-                else:
-                    raise
-            soup = self._parse_html(response.text)
-            if not soup:
-                return meta
+            else:
+                raise
+        page_text = response.text or ''
+        if page_text and self.page_cache is not None:
+            self.page_cache.put(udemy_course_url, page_text)
+        return page_text
+
+    def _parse_udemy_metadata(self, page_text: str, source_url: str = '') -> Dict:
+        """Extract course metadata from the HTML of a Udemy landing page"""
+        meta: Dict = {}
+        try:
+            # The embedded JSON, JSON-LD and meta tags are read without a DOM unless disabled;
+            # the tree is only built when DOM-only fields are still missing at the end
+            if getattr(Config, 'UDEMY_META_FAST_PATH', True):
+                page = RawPageView(page_text)
+                soup = None
+            else:
+                soup = self._parse_html(page_text)
+                if not soup:
+                    return meta
+                page = SoupPageView(soup)
 
             # 0) Udemy body data-module-args JSON (richest source for description and lists)
             try:
-                body_el = soup.find('body')
-                if body_el and body_el.has_attr('data-module-args'):
-                    import json as _json
-                    import html as _html
-                    raw_args = body_el.get('data-module-args', '')
-                    decoded = _html.unescape(raw_args) if raw_args else ''
-                    if decoded:
-                        data = _json.loads(decoded)
-                        course_obj = {}
-                        if isinstance(data, dict):
-                            course_obj = data.get('course') or {}
-                            if not course_obj:
-                                ssp = data.get('serverSideProps')
-                                if isinstance(ssp, dict):
-                                    course_obj = ssp.get('course') or {}
-                        if isinstance(course_obj, dict) and course_obj:
-                            # Description (long, HTML). Prefer this over og:description
-                            if 'description' not in meta and course_obj.get('description'):
-                                try:
-                                    from bs4 import BeautifulSoup as _BS
-                                    meta['description'] = _BS(course_obj.get('description') or '', 'html.parser').get_text('\n').strip()
-                                except Exception:
-                                    meta['description'] = course_obj.get('description')
-                            # Subtitle/headline
-                            if 'subtitle' not in meta and course_obj.get('headline'):
-                                meta['subtitle'] = course_obj.get('headline')
-                            # Duration
-                            if 'duration' not in meta and course_obj.get('content_info_short'):
-                                meta['duration'] = course_obj.get('content_info_short')
-                            # Level
-                            if 'level' not in meta and course_obj.get('instructional_level_simple'):
-                                meta['level'] = course_obj.get('instructional_level_simple')
-                            # Lectures
-                            if 'lectures' not in meta and isinstance(course_obj.get('num_lectures'), (int, float, str)):
-                                try:
-                                    meta['lectures'] = int(course_obj.get('num_lectures'))
-                                except Exception:
-                                    pass
-                            # What you'll learn / objectives
-                            if 'learn' not in meta:
-                                _learn = []
-                                wywl = course_obj.get('what_you_will_learn_data') or []
-                                if isinstance(wywl, list):
-                                    for it in wywl:
-                                        if isinstance(it, dict) and it.get('title'):
-                                            _learn.append(str(it.get('title')))
-                                if not _learn and isinstance(course_obj.get('objectives'), list):
-                                    for it in course_obj.get('objectives'):
-                                        if isinstance(it, str) and it.strip():
-                                            _learn.append(it.strip())
-                                if _learn:
-                                    meta['learn'] = _learn
-                            # Requirements
-                            if 'requirements' not in meta:
-                                _req = []
-                                rd = course_obj.get('requirements_data') or []
-                                if isinstance(rd, list):
-                                    for it in rd:
-                                        if isinstance(it, dict) and it.get('title'):
-                                            _req.append(str(it.get('title')))
-                                if not _req and isinstance(course_obj.get('prerequisites'), list):
-                                    for it in course_obj.get('prerequisites'):
-                                        if isinstance(it, str) and it.strip():
-                                            _req.append(it.strip())
-                                if _req:
-                                    meta['requirements'] = _req
-                            # Audience
-                            if 'audience' not in meta:
-                                _aud = []
-                                ad = course_obj.get('target_audiences') or course_obj.get('targetAudiences') or []
-                                if isinstance(ad, list):
-                                    for it in ad:
-                                        t = it.get('title') if isinstance(it, dict) else it
-                                        if isinstance(t, str) and t.strip():
-                                            _aud.append(t.strip())
-                                if _aud:
-                                    meta['audience'] = _aud
+                data = page.module_args()
+                if data is not None:
+                    course_obj = {}
+                    if isinstance(data, dict):
+                        course_obj = data.get('course') or {}
+                        if not course_obj:
+                            ssp = data.get('serverSideProps')
+                            if isinstance(ssp, dict):
+                                course_obj = ssp.get('course') or {}
+                    if isinstance(course_obj, dict) and course_obj:
+                        # Description (long, HTML). Prefer this over og:description
+                        if 'description' not in meta and course_obj.get('description'):
+                            try:
+                                meta['description'] = html_text(course_obj.get('description') or '', '\n').strip()
+                            except Exception:
+                                meta['description'] = course_obj.get('description')
+                        # Subtitle/headline
+                        if 'subtitle' not in meta and course_obj.get('headline'):
+                            meta['subtitle'] = course_obj.get('headline')
+                        # Duration
+                        if 'duration' not in meta and course_obj.get('content_info_short'):
+                            meta['duration'] = course_obj.get('content_info_short')
+                        # Level
+                        if 'level' not in meta and course_obj.get('instructional_level_simple'):
+                            meta['level'] = course_obj.get('instructional_level_simple')
+                        # Lectures
+                        if 'lectures' not in meta and isinstance(course_obj.get('num_lectures'), (int, float, str)):
+                            try:
+                                meta['lectures'] = int(course_obj.get('num_lectures'))
+                            except Exception:
+                                pass
+                        # What you'll learn / objectives
+                        if 'learn' not in meta:
+                            _learn = []
+                            wywl = course_obj.get('what_you_will_learn_data') or []
+                            if isinstance(wywl, list):
+                                for it in wywl:
+                                    if isinstance(it, dict) and it.get('title'):
+                                        _learn.append(str(it.get('title')))
+                            if not _learn and isinstance(course_obj.get('objectives'), list):
+                                for it in course_obj.get('objectives'):
+                                    if isinstance(it, str) and it.strip():
+                                        _learn.append(it.strip())
+                            if _learn:
+                                meta['learn'] = _learn
+                        # Requirements
+                        if 'requirements' not in meta:
+                            _req = []
+                            rd = course_obj.get('requirements_data') or []
+                            if isinstance(rd, list):
+                                for it in rd:
+                                    if isinstance(it, dict) and it.get('title'):
+                                        _req.append(str(it.get('title')))
+                            if not _req and isinstance(course_obj.get('prerequisites'), list):
+                                for it in course_obj.get('prerequisites'):
+                                    if isinstance(it, str) and it.strip():
+                                        _req.append(it.strip())
+                            if _req:
+                                meta['requirements'] = _req
+                        # Audience
+                        if 'audience' not in meta:
+                            _aud = []
+                            ad = course_obj.get('target_audiences') or course_obj.get('targetAudiences') or []
+                            if isinstance(ad, list):
+                                for it in ad:
+                                    t = it.get('title') if isinstance(it, dict) else it
+                                    if isinstance(t, str) and t.strip():
+                                        _aud.append(t.strip())
+                            if _aud:
+                                meta['audience'] = _aud
             except Exception:
                 pass
 
             # 1) JSON-LD blocks
-            import json
-            ld_blocks = soup.find_all('script', type=lambda x: x and 'ld+json' in x)
-            for script in ld_blocks:
+            for data in page.ld_json_texts():
                 try:
-                    data = script.string or script.get_text()
                     if not data:
                         continue
-                    parsed = json.loads(data)
+                    parsed = loads_json(data)
                 except Exception:
                     continue
 
@@ -661,27 +585,27 @@ class BaseScraper(ABC):
 
             # 2) OpenGraph fallbacks
             if 'image_url' not in meta:
-                og_img = soup.find('meta', property='og:image') or soup.find('meta', attrs={'name': 'og:image'})
+                og_img = page.meta('property', 'og:image') or page.meta('name', 'og:image')
                 if og_img and og_img.get('content'):
                     meta['image_url'] = og_img['content']
             if 'title' not in meta:
-                og_title = soup.find('meta', property='og:title') or soup.find('meta', attrs={'name': 'og:title'})
+                og_title = page.meta('property', 'og:title') or page.meta('name', 'og:title')
                 if og_title and og_title.get('content'):
                     meta['title'] = og_title['content']
             # Description (fallback)
             if 'description' not in meta:
-                og_desc = soup.find('meta', property='og:description') or soup.find('meta', attrs={'name': 'description'})
+                og_desc = page.meta('property', 'og:description') or page.meta('name', 'description')
                 if og_desc and og_desc.get('content'):
                     meta['description'] = og_desc['content']
             if 'language' not in meta:
-                og_locale = soup.find('meta', property='og:locale')
+                og_locale = page.meta('property', 'og:locale')
                 if og_locale and og_locale.get('content'):
                     meta['language'] = og_locale['content']
 
             # 2b) Udemy custom price meta
             if 'price' not in meta:
                 try:
-                    og_price = soup.find('meta', property='udemy_com:price') or soup.find('meta', attrs={'name': 'udemy_com:price'})
+                    og_price = page.meta('property', 'udemy_com:price') or page.meta('name', 'udemy_com:price')
                     if og_price and og_price.get('content'):
                         meta['price'] = og_price['content']
                         # Attempt to infer currency from symbol
@@ -693,225 +617,17 @@ class BaseScraper(ABC):
                 except Exception:
                     pass
 
-            # 3) Inline JSON hints (from Udemy's bootstrapped data)
+            # 3) Inline JSON hints (from Udemy's bootstrapped data), found in one pass over the page
             try:
-                import re as _re
-                page_text = response.text or ''
-                # Prefer __NEXT_DATA__ JSON if present in static HTML
-                try:
-                    mnext = _re.search(r'<script id="__NEXT_DATA__" type="application/json">(\{.*?\})</script>', page_text, _re.S)
-                    if mnext:
-                        page_text = mnext.group(1)
-                except Exception:
-                    pass
-                # image_750x422
-                if 'image_url' not in meta:
-                    m = _re.search(r'"image_750x422"\s*:\s*"(https:[^"]+)"', page_text)
-                    if m:
-                        meta['image_url'] = m.group(1).replace('\\u002F', '/').replace('\\/', '/')
-                # headline/subtitle
-                if 'subtitle' not in meta:
-                    m = _re.search(r'"headline"\s*:\s*"(.*?)"', page_text)
-                    if m:
-                        meta['subtitle'] = m.group(1).encode('utf-8', 'ignore').decode('unicode_escape')
-                # content info short (duration)
-                if 'duration' not in meta:
-                    m = _re.search(r'"content_info_short"\s*:\s*"(.*?)"', page_text)
-                    if m:
-                        meta['duration'] = m.group(1)
-                # level
-                if 'level' not in meta:
-                    m = _re.search(r'"instructional_level_simple"\s*:\s*"(.*?)"', page_text)
-                    if m:
-                        meta['level'] = m.group(1)
-                # lectures
-                if 'lectures' not in meta:
-                    m = _re.search(r'"num_lectures"\s*:\s*(\d+)', page_text)
-                    if m:
-                        try:
-                            meta['lectures'] = int(m.group(1))
-                        except Exception:
-                            pass
-                # learn/objectives
-                if 'learn' not in meta:
-                    m = _re.search(r'"what_you_will_learn_data"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        meta['learn'] = _re.findall(r'"title"\s*:\s*"(.*?)"', block)
-                if 'learn' not in meta:
-                    m = _re.search(r'"objectives"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        meta['learn'] = _re.findall(r'"([^"\\]*(?:\\.[^"\\]*)*)"', block)
-                # requirements
-                if 'requirements' not in meta:
-                    m = _re.search(r'"requirements_data"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        meta['requirements'] = _re.findall(r'"title"\s*:\s*"(.*?)"', block)
-                if 'requirements' not in meta:
-                    m = _re.search(r'"prerequisites"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        meta['requirements'] = _re.findall(r'"([^"\\]*(?:\\.[^"\\]*)*)"', block)
-                # audience
-                if 'audience' not in meta:
-                    m = _re.search(r'"target_audiences"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        meta['audience'] = _re.findall(r'"title"\s*:\s*"(.*?)"', block)
-                if 'audience' not in meta:
-                    m = _re.search(r'"targetAudiences"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        meta['audience'] = _re.findall(r'"([^"\\]*(?:\\.[^"\\]*)*)"', block)
-                # visible_instructors titles
-                if 'instructor' not in meta:
-                    m = _re.search(r'"visible_instructors"\s*:\s*\[(.*?)\]', page_text, _re.S)
-                    if m:
-                        block = m.group(1)
-                        name = None
-                        m2 = _re.search(r'"title"\s*:\s*"([^"]+)"', block)
-                        if m2:
-                            name = m2.group(1)
-                        if name:
-                            meta['instructor'] = name
-                # primary_category title
-                if 'category' not in meta:
-                    m = _re.search(r'"primary_category"\s*:\s*\{[^}]*"title"\s*:\s*"([^"]+)"', page_text)
-                    if m:
-                        meta['category'] = m.group(1)
-                # locale simple_english_title or title
-                if 'language' not in meta:
-                    m = _re.search(r'"locale"\s*:\s*\{[^}]*"(simple_english_title|title)"\s*:\s*"([^"]+)"', page_text)
-                    if m:
-                        meta['language'] = m.group(2)
-                # price_text and currency
-                if 'price' not in meta:
-                    m = _re.search(r'"price_text"\s*:\s*"([^"]+)"', page_text)
-                    if m:
-                        meta['price'] = m.group(1)
-                if 'currency' not in meta:
-                    m = _re.search(r'"currency"\s*:\s*"([A-Z]{3})"', page_text)
-                    if m:
-                        meta['currency'] = m.group(1)
-                # rating
-                if 'rating' not in meta:
-                    m = _re.search(r'"rating"\s*:\s*(\d+\.?\d*)', page_text)
-                    if m:
-                        try:
-                            meta['rating'] = float(m.group(1))
-                        except Exception:
-                            pass
-                        # As a last resort, query DOM with Selenium selectors
-                        try:
-                            # Title
-                            if 'title' not in meta:
-                                try:
-                                    el = driver.find_element(By.CSS_SELECTOR, 'h1[data-purpose="lead-title"]')
-                                    if el and el.text:
-                                        meta['title'] = el.text.strip()
-                                except Exception:
-                                    pass
-                            # Instructor
-                            if 'instructor' not in meta:
-                                for sel in ['a[data-purpose="instructor-name-top"]', '[data-purpose="instructor-name"]']:
-                                    try:
-                                        el = driver.find_element(By.CSS_SELECTOR, sel)
-                                        if el and el.text:
-                                            meta['instructor'] = el.text.strip()
-                                            break
-                                    except Exception:
-                                        continue
-                            # Rating
-                            if 'rating' not in meta:
-                                try:
-                                    el = driver.find_element(By.CSS_SELECTOR, '[data-purpose="rating-number"]')
-                                    if el and el.text:
-                                        import re as _re2
-                                        m = _re2.search(r"\d+(?:\.\d+)?", el.text)
-                                        if m:
-                                            meta['rating'] = float(m.group(0))
-                                except Exception:
-                                    pass
-                            # Students count
-                            if 'students_count' not in meta:
-                                try:
-                                    el = driver.find_element(By.CSS_SELECTOR, '[data-purpose="enrollment"]')
-                                    if el and el.text:
-                                        import re as _re3
-                                        digits = ''.join(_re3.findall(r"\d", el.text))
-                                        if digits:
-                                            meta['students_count'] = int(digits)
-                                except Exception:
-                                    pass
-                            # Language
-                            if 'language' not in meta:
-                                for sel in ['[data-purpose="lead-course-locale"]', 'li[data-purpose="course-locale"]']:
-                                    try:
-                                        el = driver.find_element(By.CSS_SELECTOR, sel)
-                                        if el and el.text:
-                                            meta['language'] = el.text.strip()
-                                            break
-                                    except Exception:
-                                        continue
-                            # Category from breadcrumb
-                            if 'category' not in meta:
-                                try:
-                                    els = driver.find_elements(By.CSS_SELECTOR, 'nav[aria-label="breadcrumb"] a, a[data-purpose="breadcrumb-link"]')
-                                    if els and len(els) >= 2:
-                                        # pick second (top-level category) or second last depending on structure
-                                        meta['category'] = els[1].text.strip() or (els[-2].text.strip() if len(els) >= 2 else None)
-                                except Exception:
-                                    pass
-                            # Price text
-                            if 'price' not in meta:
-                                for sel in ['[data-purpose="course-old-price"]', '[data-purpose="course-price-text"]']:
-                                    try:
-                                        el = driver.find_element(By.CSS_SELECTOR, sel)
-                                        if el and el.text:
-                                            meta['price'] = el.text.strip()
-                                            break
-                                    except Exception:
-                                        continue
-                            # Image
-                            if 'image_url' not in meta:
-                                try:
-                                    el = driver.find_element(By.CSS_SELECTOR, 'img[src*="/750x422/"]')
-                                    if el:
-                                        src = el.get_attribute('src')
-                                        if src:
-                                            meta['image_url'] = src
-                                except Exception:
-                                    pass
-                        except Exception:
-                            pass
-                # students count (num_subscribers)
-                if 'students_count' not in meta:
-                    m = _re.search(r'"num_subscribers"\s*:\s*(\d+)', page_text)
-                    if m:
-                        try:
-                            meta['students_count'] = int(m.group(1))
-                        except Exception:
-                            pass
+                extract_inline_hints(page_text, meta)
             except Exception:
                 pass
 
             # 4) Udemy embedded JSON in body[data-module-args]
             try:
-                body = soup.find('body', id='udemy')
-                if body and body.get('data-module-args'):
-                    import json as _json
-                    import html as _html
-                    raw = body.get('data-module-args')
-                    try:
-                        raw = _html.unescape(raw)
-                    except Exception:
-                        pass
-                    try:
-                        ud = _json.loads(raw)
-                    except Exception:
-                        ud = None
+                body = page.body_attrs()
+                if body and body.get('id') == 'udemy' and body.get('data-module-args'):
+                    ud = page.module_args()
                     if isinstance(ud, dict):
                         # Course block
                         course = ud.get('serverSideProps', {}).get('course') or {}
@@ -969,7 +685,7 @@ class BaseScraper(ABC):
                                         schema_raw = _unescape(schema_raw)
                                     except Exception:
                                         pass
-                                    schema = _json.loads(schema_raw)
+                                    schema = loads_json(schema_raw)
                                     if isinstance(schema, dict):
                                         graph = schema.get('@graph') or []
                                         for node in graph:
@@ -1023,6 +739,12 @@ class BaseScraper(ABC):
                 pass
 
             # 5) Static DOM selectors (if Udemy rendered some content server-side)
+            if soup is None:
+                if all(field in meta for field in _DOM_ONLY_FIELDS):
+                    return meta
+                soup = self._parse_html(page_text)
+                if not soup:
+                    return meta
             try:
                 # Title
                 if 'title' not in meta:
@@ -1038,8 +760,7 @@ class BaseScraper(ABC):
                 if 'rating' not in meta:
                     el = soup.select_one('[data-purpose="rating-number"]')
                     if el and el.get_text(strip=True):
-                        import re as _re
-                        m = _re.search(r"\d+(?:\.\d+)?", el.get_text())
+                        m = _NUMBER_RE.search(el.get_text())
                         if m:
                             try:
                                 meta['rating'] = float(m.group(0))
@@ -1049,8 +770,7 @@ class BaseScraper(ABC):
                 if 'students_count' not in meta:
                     el = soup.select_one('[data-purpose="enrollment"]')
                     if el and el.get_text(strip=True):
-                        import re as _re
-                        digits = ''.join(_re.findall(r"\d", el.get_text()))
+                        digits = _NON_DIGIT_RE.sub('', el.get_text())
                         if digits:
                             try:
                                 meta['students_count'] = int(digits)
@@ -1082,5 +802,5 @@ class BaseScraper(ABC):
             # Removed one-off browser fallback and HTML dump used for debugging
             return meta
         except Exception as e:
-            logger.error(f"Error fetching Udemy metadata from {udemy_course_url}: {e}")
+            logger.error(f"Error parsing Udemy metadata from {source_url}: {e}")
             return meta
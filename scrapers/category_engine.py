@@ -0,0 +1,195 @@
+"""
+Keyword-based course categorisation.
+
+All keywords of all rules are compiled into one trie-shaped regex, so a
+title is scanned once instead of once per keyword. The scan reports the
+leftmost-longest keyword at each match; the keywords inside a match and the
+few that can start inside one and run past its end (precomputed per keyword)
+complete the set of keywords present. The ordered rule table then decides
+the category: the first rule with a satisfied clause wins, which keeps the
+precedence the scrapers have always used (Finance before Design, Design
+before Data Science, ...). Decisions are cached per keyword set.
+"""
+import re
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+
+class Clause(NamedTuple):
+    """Satisfied when a keyword of any_of, of every also_any_of group, and none of none_of occur"""
+    any_of: FrozenSet[str]
+    also_any_of: Tuple[FrozenSet[str], ...] = ()
+    none_of: FrozenSet[str] = frozenset()
+
+
+def _clause(any_of: Iterable[str], also_any_of: Iterable[str] = (), none_of: Iterable[str] = ()) -> Clause:
+    also = (frozenset(also_any_of),) if also_any_of else ()
+    return Clause(frozenset(any_of), also, frozenset(none_of))
+
+
+DEFAULT_CATEGORY = 'IT & Software'
+
+# Ordered: the first category with a matching clause wins
+CATEGORY_RULES: List[Tuple[str, List[Clause]]] = [
+    ('Finance & Accounting', [
+        _clause(['crypto', 'cryptocurrency', 'bitcoin', 'blockchain', 'nft', 'defi', 'trading', 'forex', 'stock',
+                 'investment', 'finance', 'airdrop', 'accounting', 'bookkeeping']),
+    ]),
+    # Before AI/ML to catch design-specific courses
+    ('Design', [
+        _clause(['design with', 'canva', 'graphic design', 'logo design', 'web design', 'ui design', 'ux design']),
+        _clause(['design', 'photoshop', 'illustrator', 'figma', 'sketch'],
+                none_of=['machine learning', 'artificial intelligence', 'data science', 'ai']),
+    ]),
+    # Before IT & Software to catch data science courses
+    ('Data Science', [
+        _clause(['machine learning', 'deep learning', 'data science', 'data analysis', 'data analytics',
+                 'neural networks', 'tensorflow', 'pytorch', 'pandas', 'numpy']),
+        _clause(['artificial intelligence'], also_any_of=['python', 'programming', 'algorithm', 'model', 'training']),
+    ]),
+    ('IT & Software', [
+        _clause(['aws', 'amazon web services', 'azure', 'google cloud', 'serverless', 'docker', 'kubernetes',
+                 'devops', 'cloud computing']),
+        _clause(['python', 'javascript', 'java', 'react', 'angular', 'node.js', 'html', 'css', 'sql', 'programming',
+                 'coding', 'software development', 'web development', 'app development', 'full stack']),
+    ]),
+    # General AI courses without programming focus
+    ('Artificial Intelligence', [
+        _clause(['artificial intelligence', 'ai for']),
+        _clause(['ai', 'chatgpt', 'openai'], none_of=['programming', 'python', 'coding', 'development']),
+    ]),
+    ('Marketing', [
+        _clause(['marketing', 'seo', 'social media', 'advertising', 'digital marketing', 'affiliate marketing',
+                 'email marketing', 'content marketing']),
+    ]),
+    ('Business', [
+        _clause(['business', 'management', 'entrepreneur', 'startup', 'leadership', 'project management', 'strategy']),
+    ]),
+    ('Photography & Video', [
+        _clause(['photography', 'video editing', 'filmmaking', 'camera', 'premiere', 'after effects', 'davinci']),
+    ]),
+    # "mastering" alone is ambiguous; only music when paired with an audio word
+    ('Music', [
+        _clause(['music', 'audio', 'sound design', 'mixing', 'ableton', 'logic pro']),
+        _clause(['mastering'], also_any_of=['audio', 'music', 'sound', 'track', 'song']),
+    ]),
+    ('Health & Fitness', [
+        _clause(['fitness', 'yoga', 'health', 'nutrition', 'workout', 'meditation', 'wellness']),
+    ]),
+    ('Personal Development', [
+        _clause(['personal development', 'self improvement', 'productivity', 'time management',
+                 'communication skills', 'public speaking']),
+    ]),
+    ('Teaching & Academics', [
+        _clause(['teaching', 'education', 'academic', 'research', 'study skills', 'exam prep']),
+    ]),
+    ('Lifestyle', [
+        _clause(['lifestyle', 'cooking', 'travel', 'hobby', 'crafts', 'gardening']),
+    ]),
+]
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Alternation shaped like a trie (longest alternative first) so each position is tried cheaply"""
+    trie: Dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def build(node: Dict) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class CategoryEngine:
+    """Compiled keyword matcher plus ordered rule table"""
+
+    def __init__(self, rules: Sequence[Tuple[str, List[Clause]]] = CATEGORY_RULES,
+                 default: str = DEFAULT_CATEGORY):
+        self.rules = list(rules)
+        self.default = default
+        keywords: Set[str] = set()
+        for _, clauses in self.rules:
+            for clause in clauses:
+                keywords |= clause.any_of | clause.none_of
+                for group in clause.also_any_of:
+                    keywords |= group
+        self.keywords = frozenset(keywords)
+        trie = _trie_regex(sorted(self.keywords))
+        # Leftmost-longest, non-overlapping scan
+        self._scan = re.compile(trie)
+        # A hit implies every keyword inside it ...
+        self._contained = {k: frozenset(w for w in self.keywords if w in k) for k in self.keywords}
+        # ... and keywords starting inside a hit but ending after it are the only ones the scan can skip
+        self._straddling = {
+            k: tuple(sorted(w for w in self.keywords
+                            if w not in k and any(k[-n:] == w[:n] for n in range(1, min(len(k), len(w))))))
+            for k in self.keywords
+        }
+        self._decided: Dict[FrozenSet[str], str] = {}
+
+    def _expand(self, hits: Iterable[str], title_lower: str) -> FrozenSet[str]:
+        found: Set[str] = set()
+        for hit in hits:
+            found |= self._contained[hit]
+            for word in self._straddling[hit]:
+                if word in title_lower:
+                    found.add(word)
+        return frozenset(found)
+
+    def keywords_in(self, title_lower: str) -> FrozenSet[str]:
+        """Every keyword occurring in an already lower-cased title"""
+        return self._expand(set(self._scan.findall(title_lower)), title_lower)
+
+    def _decide(self, found: FrozenSet[str]) -> str:
+        category = self._decided.get(found)
+        if category is not None:
+            return category
+        category = self.default
+        for name, clauses in self.rules:
+            if any(not clause.any_of.isdisjoint(found)
+                   and all(not group.isdisjoint(found) for group in clause.also_any_of)
+                   and clause.none_of.isdisjoint(found)
+                   for clause in clauses):
+                category = name
+                break
+        # Few distinct keyword combinations occur in practice, so this stays small
+        if len(self._decided) < 65536:
+            self._decided[found] = category
+        return category
+
+    def classify(self, title: str) -> str:
+        """Category for one course title"""
+        return self._decide(self.keywords_in((title or '').lower()))
+
+    def classify_many(self, titles: Sequence[str]) -> List[str]:
+        """Categories for many titles, in order (a title repeated in the batch is classified once)"""
+        decided: Dict[str, str] = {}
+        categories: List[str] = []
+        for title in titles:
+            category = decided.get(title)
+            if category is None:
+                category = decided[title] = self.classify(title)
+            categories.append(category)
+        return categories
+
+
+_default_engine: Optional[CategoryEngine] = None
+
+
+def default_engine() -> CategoryEngine:
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = CategoryEngine()
+    return _default_engine
+
+
+def classify_title(title: str) -> str:
+    """Category for a course title with the default rules"""
+    return default_engine().classify(title)
@@ -0,0 +1,171 @@
+"""
+Streaming parser for DiscUdemy listing pages.
+
+Only the course grid (article.ui.four.stackable.cards) is tokenized, and no
+tree is built: each section.card becomes a small ListingCard record. Matching
+follows the BeautifulSoup lookups it replaces (class_ token/full-string match,
+first matching element per card, get_text(strip=True) for texts).
+"""
+import re
+from html.parser import HTMLParser
+from typing import List, NamedTuple, Optional
+
+_CONTAINER_CLASS = 'ui four stackable cards'
+_AD_LABEL_CLASS = 'ui green disc-fee label'
+
+_CONTAINER_START_RE = re.compile(r'<article\b[^>]*>', re.IGNORECASE)
+_ARTICLE_TAG_RE = re.compile(r'<(/?)article\b[^>]*>', re.IGNORECASE)
+_CLASS_ATTR_RE = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))''', re.IGNORECASE)
+
+
+class ListingCard(NamedTuple):
+    href: Optional[str]
+    title: str
+    labels: List[str]
+    is_ad: bool
+
+
+def _class_matches(class_attr: Optional[str], wanted: str) -> bool:
+    """bs4 class_ semantics: any single class equals wanted, or the whole class string does"""
+    if not class_attr:
+        return False
+    classes = class_attr.split()
+    return wanted in classes or ' '.join(classes) == wanted
+
+
+def _container_slice(page: str) -> str:
+    """The card container's markup (start tag to matching </article>), or the whole page"""
+    for m in _CONTAINER_START_RE.finditer(page):
+        cm = _CLASS_ATTR_RE.search(m.group(0))
+        value = next((g for g in cm.groups() if g is not None), '') if cm else ''
+        if ' '.join(value.split()) != _CONTAINER_CLASS:
+            continue
+        depth = 0
+        for tag in _ARTICLE_TAG_RE.finditer(page, m.start()):
+            depth += -1 if tag.group(1) else 1
+            if depth == 0:
+                return page[m.start():tag.end()]
+        return page[m.start():]
+    return page
+
+
+class _Card:
+    __slots__ = ('header_href', 'header_found', 'title_parts', 'labels', 'ad_label', 'has_adsense',
+                 'open_label', 'label_parts', 'label_is_ad_class', 'in_header', 'depth')
+
+    def __init__(self):
+        self.header_found = False
+        self.header_href = None
+        self.title_parts: List[str] = []
+        self.labels: List[str] = []
+        self.ad_label: Optional[str] = None
+        self.has_adsense = False
+        self.open_label = 0
+        self.label_parts: List[str] = []
+        self.label_is_ad_class = False
+        self.in_header = 0
+        self.depth = 1
+
+
+class _ListingTokenizer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards: List[ListingCard] = []
+        self._open: List[_Card] = []
+        self._order: List[_Card] = []
+
+    def handle_starttag(self, tag, attrs):
+        if not self._open and tag != 'section':
+            return
+        attrs = dict(attrs)
+        cls = attrs.get('class')
+        for card in self._open:
+            if tag == 'section':
+                card.depth += 1
+            elif tag == 'a':
+                if card.in_header:
+                    card.in_header += 1
+                elif not card.header_found and _class_matches(cls, 'card-header'):
+                    card.header_found = True
+                    card.header_href = attrs.get('href')
+                    card.in_header = 1
+            elif tag == 'label':
+                if card.open_label:
+                    card.open_label += 1
+                else:
+                    card.open_label = 1
+                    card.label_parts = []
+                    card.label_is_ad_class = card.ad_label is None and _class_matches(cls, _AD_LABEL_CLASS)
+            elif tag == 'ins' and _class_matches(cls, 'adsbygoogle'):
+                card.has_adsense = True
+        if tag == 'section' and _class_matches(cls, 'card'):
+            card = _Card()
+            self._open.append(card)
+            self._order.append(card)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag in ('section', 'a', 'label'):
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if not self._open:
+            return
+        for card in list(self._open):
+            if tag == 'section':
+                card.depth -= 1
+                if card.depth == 0:
+                    self._close(card)
+            elif tag == 'a' and card.in_header:
+                card.in_header -= 1
+            elif tag == 'label' and card.open_label:
+                card.open_label -= 1
+                if not card.open_label:
+                    self._finish_label(card)
+
+    def handle_data(self, data):
+        for card in self._open:
+            if card.in_header or card.open_label:
+                text = data.strip()
+                if text:
+                    if card.in_header:
+                        card.title_parts.append(text)
+                    if card.open_label:
+                        card.label_parts.append(text)
+
+    @staticmethod
+    def _finish_label(card: _Card):
+        text = ''.join(card.label_parts)
+        card.labels.append(text)
+        if card.label_is_ad_class:
+            card.ad_label = text
+        card.label_parts = []
+        card.label_is_ad_class = False
+
+    def _close(self, card: _Card):
+        if card.open_label:
+            self._finish_label(card)
+        card.open_label = card.in_header = 0
+        self._open.remove(card)
+
+    def close(self):
+        super().close()
+        for card in list(self._open):
+            self._close(card)
+        self.cards = [
+            ListingCard(
+                href=c.header_href if c.header_found else None,
+                title=''.join(c.title_parts),
+                labels=c.labels,
+                is_ad=(c.ad_label is not None and c.ad_label.lower() == 'ads') or c.has_adsense,
+            )
+            for c in self._order
+        ]
+
+
+def parse_listing_cards(page: str) -> List[ListingCard]:
+    """Card records from a DiscUdemy listing page, in document order"""
+    tokenizer = _ListingTokenizer()
+    tokenizer.feed(_container_slice(page or ''))
+    tokenizer.close()
+    return tokenizer.cards
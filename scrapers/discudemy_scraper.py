@@ -6,26 +6,145 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scrapers.base_scraper import BaseScraper
+from scrapers.discudemy_listing import parse_listing_cards
 import logging
 import re
+import threading
 import time
+import json
+import hashlib
+import codecs
+import html
+from collections import deque
+from urllib.parse import urlparse
 from config.settings import Config
 from utils.database import CourseDatabase
+from utils.strategy_stats import StrategyStats
 
 logger = logging.getLogger(__name__)
 
+# Same match as the /go/ page's first method (anchor href containing a Udemy course
+# URL with a coupon), usable on partial HTML; tag name/attribute are case-insensitive
+_GO_COUPON_LINK_RE = re.compile(
+    r'(?i:<a)\s[^>]*?(?<![\w-])(?i:href)\s*=\s*'
+    r'(?:"([^"]*udemy\.com/course/[^"]*couponCode=[^"]*)"|\'([^\']*udemy\.com/course/[^\']*couponCode=[^\']*)\')'
+)
+_GO_SCAN_OVERLAP = 4096
+
+_UDEMY_COURSE_URL_RE = re.compile(r"https?://(?:www\.)?udemy\.com/course/[^\s\"'>]+")
+
+_SCRIPT_URL_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'udemy\.com/course/[^"\']+\?couponCode=[^"\']+',
+    r'https://www\.udemy\.com/course/[^"\']+\?couponCode=[^"\']+',
+    r'"url":\s*"([^"]*udemy\.com[^"]*couponCode=[^"]*)"',
+    r'window\.location\s*=\s*["\']([^"\']*udemy\.com[^"\']*)["\']',
+    r'href\s*=\s*["\']([^"\']*udemy\.com[^"\']*couponCode=[^"\']*)["\']',
+)]
+
+def _go_template(course_url: str, go_url: str) -> Optional[str]:
+    """go_url with the course page's slug replaced by '{slug}' (None when the slug is not in it)"""
+    slug = urlparse(course_url).path.rstrip('/').rsplit('/', 1)[-1]
+    if not slug:
+        return None
+    parsed = urlparse(go_url)
+    idx = parsed.path.rfind(slug)
+    if idx < 0:
+        return None
+    return parsed._replace(path=parsed.path[:idx] + '{slug}' + parsed.path[idx + len(slug):]).geturl()
+
+
+class GoTemplate:
+    """Learned course-page -> /go/ URL mapping, trusted after `confirmations` agreeing observations"""
+
+    def __init__(self, confirmations: int = 3):
+        self.confirmations = max(1, int(confirmations))
+        self._lock = threading.Lock()
+        self.template: Optional[str] = None
+        self.confirmed = 0
+        self.derived_hits = 0
+        self.derived_misses = 0
+
+    def observe(self, template: Optional[str]):
+        """Record the mapping seen on one course page"""
+        with self._lock:
+            if template is not None and template == self.template:
+                self.confirmed += 1
+            else:
+                self.template = template
+                self.confirmed = 1 if template else 0
+
+    def derive(self, course_url: str) -> Optional[str]:
+        """/go/ URL for a course page, once the template is trusted"""
+        with self._lock:
+            if not self.template or self.confirmed < self.confirmations:
+                return None
+            template = self.template
+        slug = urlparse(course_url).path.rstrip('/').rsplit('/', 1)[-1]
+        return template.replace('{slug}', slug) if slug else None
+
+    def record(self, ok: bool):
+        """Outcome of a derived URL; a miss withdraws trust until re-confirmed"""
+        with self._lock:
+            if ok:
+                self.derived_hits += 1
+            else:
+                self.derived_misses += 1
+                self.confirmed = 0
+
+    def export(self) -> Dict:
+        with self._lock:
+            return {'template': self.template, 'confirmed': self.confirmed}
+
+    def load(self, data: Optional[Dict]):
+        if isinstance(data, dict) and isinstance(data.get('template'), str):
+            with self._lock:
+                self.template = data['template']
+                self.confirmed = max(0, int(data.get('confirmed') or 0))
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                'template': self.template,
+                'confirmed': self.confirmed,
+                'trusted': bool(self.template) and self.confirmed >= self.confirmations,
+                'derived_hits': self.derived_hits,
+                'derived_misses': self.derived_misses,
+            }
+
+
 class DiscUdemyScraper(BaseScraper):
     
     def __init__(self):
         super().__init__('discudemy', 'https://www.discudemy.com/')
         # Persist backfill cursor using DB
         self._db = CourseDatabase()
+        # Per-stage concurrency limits for the card pipeline
+        self._resolve_stage = threading.BoundedSemaphore(max(1, int(getattr(Config, 'DISCUDEMY_RESOLVE_CONCURRENCY', 4))))
+        self._enrich_stage = threading.BoundedSemaphore(max(1, int(getattr(Config, 'DISCUDEMY_ENRICH_CONCURRENCY', 4))))
+        # Listing page -> validators of the last scrape, saved once its courses are stored
+        self._pending_validators: Dict[str, Dict] = {}
+        # Course page -> /go/ URL template learned from discBtn links (skips the course page fetch)
+        self.go_template = GoTemplate(getattr(Config, 'DISCUDEMY_GO_TEMPLATE_CONFIRMATIONS', 3))
+        try:
+            self.go_template.load(json.loads(self._db.get_kv(self._go_template_kv_key(), '{}') or '{}'))
+        except ValueError:
+            pass
+        # Hit rate / cost of the course-page URL strategies, kept across runs
+        self.url_strategies = StrategyStats(_URL_STRATEGIES, tiers=_URL_STRATEGY_TIERS)
+        try:
+            self.url_strategies.load(json.loads(self._db.get_kv(self._strategy_kv_key(), '{}') or '{}'))
+        except ValueError:
+            pass
     
     def scrape_courses(self, limit: int = None) -> List[Dict]:
         """Scrape courses from DiscUdemy with basic pagination on listing pages"""
         courses = []
         try:
             logger.info(f"Starting scrape from {self.name}")
+            self.flights.new_run()
+            self._pending_validators = {}
+            saved_before = self.flights.saved
+            derived_before = self.go_template.derived_hits
             # Fresh lane rotation over /all pages 1..N (N<=60).
             # Always include '/all' (page 1) every run; rotate pages 2..N across runs.
             max_fresh = max(1, min(int(getattr(Config, 'DISCUDEMY_FRESH_PAGES', 10)), 60))
@@ -76,7 +195,6 @@ class DiscUdemyScraper(BaseScraper):
             diag_enabled = bool(getattr(Config, 'DIAG_ENABLE_DISCUDEMY', False))
             if diag_enabled:
                 from pathlib import Path
-                import json
                 diag_dir = Path(getattr(Config, 'DIAG_DIR', 'logs/diagnostics'))
                 try:
                     diag_dir.mkdir(parents=True, exist_ok=True)
@@ -95,6 +213,14 @@ class DiscUdemyScraper(BaseScraper):
             stale_page_streak = 0
             stale_page_threshold = 2
 
+            # Listing pages are fetched one ahead: the next page downloads while this one's cards resolve
+            page_futures = {}
+
+            def page_future(url):
+                if url not in page_futures:
+                    page_futures[url] = self.http.submit(self._fetch_listing_page, url)
+                return page_futures[url]
+
             for idx, page_url in enumerate(listing_pages, start=1):
                 # Stop early if both quotas are satisfied (avoid fetching more pages needlessly)
                 if fresh_added >= fresh_quota and backfill_added >= backfill_quota:
@@ -111,34 +237,20 @@ class DiscUdemyScraper(BaseScraper):
                 if total_added >= total_limit:
                     # We'll still process this page but enforce a page-specific cap below
                     pass
-                resp = self._make_request(page_url)
-                if not resp:
+                current = page_future(page_url)
+                next_page = next((u for u in listing_pages[idx:] if u in fresh_pages), None)
+                if next_page:
+                    page_future(next_page)
+                resp, unchanged, validators = current.result()
+                if unchanged:
+                    # Same listing as the last fully processed fetch: nothing new to parse
+                    logger.info(f"{self.name}: {page_url} not modified since last run, skipping")
+                    if diag_enabled:
+                        run_diag['not_modified'] = run_diag.get('not_modified', 0) + 1
                     continue
-                soup = self._parse_html(resp.text)
-                if not soup:
+                if not resp:
                     continue
-
-                # Find course links via card grid (robust against ads and layout noise)
-                course_links = []
-                cards_root = soup.find('article', class_='ui four stackable cards') or soup
-                for card in cards_root.find_all('section', class_='card'):
-                    # Skip ad card by label text or presence of adsbygoogle
-                    label = card.find('label', class_='ui green disc-fee label')
-                    if label and label.get_text(strip=True).lower() == 'ads':
-                        continue
-                    if card.find('ins', class_='adsbygoogle'):
-                        continue
-                    header_a = card.find('a', class_='card-header')
-                    if not header_a or not header_a.get('href'):
-                        continue
-                    href = header_a['href']
-                    if href.startswith('/'):
-                        abs_href = 'https://www.discudemy.com' + href
-                    elif href.startswith('http'):
-                        abs_href = href
-                    else:
-                        continue
-                    course_links.append((header_a, abs_href))
+                course_links = self._extract_listing_cards(resp.text)
 
                 logger.info(f"Found {len(course_links)} potential course links on {page_url}")
                 if diag_enabled:
@@ -167,63 +279,36 @@ class DiscUdemyScraper(BaseScraper):
                 max_overall = total_limit + max(0, overflow_allow)
                 page_cap = min(max_overall, max(total_limit, total_added + len(course_links)))
 
-                for link, abs_href in course_links:
+                # Resolve cards on the worker pool and consume results in listing order.
+                # In-flight cards never exceed what the page cap still allows, so a run
+                # where every card resolves does exactly as much work as a serial run.
+                workers = max(1, int(getattr(Config, 'DISCUDEMY_CARD_WORKERS', 8)))
+                # Cards that failed to resolve (often a transient /go/ or network failure)
+                page_unresolved = 0
+                pending = deque()
+                link_iter = iter(course_links)
+                while True:
+                    room = min(workers, page_cap - total_added)
+                    while len(pending) < room:
+                        nxt = next(link_iter, None)
+                        if nxt is None:
+                            break
+                        pending.append(self.http.submit(self._resolve_card, *nxt))
                     # Enforce the page-specific cap; do not stop mid-page just because
                     # total_limit was reached earlier in the run.
-                    if total_added >= page_cap:
+                    if not pending or total_added >= page_cap:
                         break
+                    fut = pending.popleft()
                     try:
-                        # Extract real Udemy URL from DiscUdemy link
-                        real_udemy_url = None
-                        
-                        # Fast-path: if the card already links directly to Udemy, accept it
-                        if abs_href.startswith('https://www.udemy.com/') or abs_href.startswith('https://udemy.com/'):
-                            real_udemy_url = abs_href
-                        elif '/go/' in abs_href:
-                            real_udemy_url = self._extract_udemy_from_go_page(abs_href)
-                        else:
-                            # DiscUdemy internal course page -> extract the Udemy target
-                            real_udemy_url = self._extract_real_udemy_url(abs_href)
-                        
+                        result = fut.result()
                         # Skip if extraction failed or invalid URL
-                        if not real_udemy_url or 'discudemy.com' in real_udemy_url or not ('udemy.com/course/' in real_udemy_url):
+                        if result.get('status') != 'ok':
+                            page_unresolved += 1
                             if diag_enabled:
                                 page_diag['no_real_url'] += 1
                             continue
-
-                        # Build course data
-                        course_data = {
-                            'title': link.get_text(strip=True) or 'Free Udemy Course',
-                            'course_url': real_udemy_url,
-                            'discounted_price': 'Free',
-                            'discount_percentage': '100% OFF'
-                        }
-                        
-                        # Success - extracted valid Udemy URL
-                        logger.info(f"• Found: {course_data['title'][:50]}{'...' if len(course_data['title']) > 50 else ''}")
-
-                        # Fetch real metadata from Udemy and merge
-                        try:
-                            meta = self._fetch_udemy_metadata(real_udemy_url, referer=abs_href) or {}
-                            # Prefer real title if present
-                            if meta.get('title'):
-                                course_data['title'] = meta['title']
-                            # Attach additional metadata (expanded)
-                            enriched_keys = 0
-                            for k in [
-                                'image_url', 'category', 'instructor', 'language', 'price', 'currency',
-                                'rating', 'students_count', 'subtitle', 'description', 'duration',
-                                'level', 'lectures', 'learn', 'requirements', 'audience'
-                            ]:
-                                if meta.get(k) not in [None, '', []]:
-                                    course_data[k] = meta[k]
-                                    enriched_keys += 1
-                            if enriched_keys > 0:
-                                course_data['meta_enriched'] = True
-                            # Tiny delay to avoid triggering anti-bot
-                            time.sleep(0.4)
-                        except Exception:
-                            pass
+                        course_data = result['course_data']
+                        real_udemy_url = course_data['course_url']
 
                         # Optional validation for deep pages (> page 10 in our combined list)
                         is_deep_page = idx > len(fresh_pages)
@@ -256,17 +341,21 @@ class DiscUdemyScraper(BaseScraper):
                                         'title': normalized_course.get('title'),
                                         'url': normalized_course.get('course_url')
                                     })
-                            
-                            # Stop only if we reached the page-specific cap
-                            if total_added >= page_cap:
-                                break
                     except Exception as e:
                         logger.error(f"Error extracting course from {self.name}: {e}")
-                        self.errors_count += 1
+                        self._count_error()
+                        page_unresolved += 1
                         if diag_enabled:
                             page_diag['errors'] += 1
                         continue
-
+                # Nothing should remain queued once the cap is hit; drop it defensively
+                for fut in pending:
+                    fut.cancel()
+                # Validators are kept only for a page whose every card resolved, so a page cut
+                # short by the cap (or with cards that failed) is fetched and parsed again next
+                # run. They are saved by commit_listing_validators once the courses are stored.
+                if validators and not pending and next(link_iter, None) is None and page_unresolved == 0:
+                    self._pending_validators[page_url] = validators
                 # Append per-page diagnostics
                 if diag_enabled:
                     try:
@@ -292,17 +381,27 @@ class DiscUdemyScraper(BaseScraper):
                     if page_url in fresh_pages:
                         stale_page_streak = 0
                         pass
+
+            if diag_enabled:
                 try:
                     # Write diagnostics file (pages were already appended per-iteration)
                     from datetime import datetime
                     ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-                    import json
                     from pathlib import Path
                     diag_path = Path(getattr(Config, 'DIAG_DIR', 'logs/diagnostics')) / f"discudemy_run_{ts}.json"
+                    run_diag['dedupe_saved'] = self.flights.saved - saved_before
+                    run_diag['concurrency'] = self.http.limiter.snapshot()
+                    run_diag['url_strategies'] = self.url_strategies.snapshot()
+                    run_diag['go_template'] = dict(self.go_template.snapshot(),
+                                                   fetches_saved=self.go_template.derived_hits - derived_before)
                     with open(diag_path, 'w', encoding='utf-8') as f:
                         json.dump(run_diag, f, ensure_ascii=False, indent=2)
                 except Exception:
                     pass
+
+            # Drop the prefetched page if it was not needed (quota met early)
+            for fut in page_futures.values():
+                fut.cancel()
         except Exception as e:
             logger.error(f"Error scraping {self.name}: {e}")
             self.errors_count += 1
@@ -324,9 +423,154 @@ class DiscUdemyScraper(BaseScraper):
         except Exception:
             pass
 
+        try:
+            self._db.set_kv(self._strategy_kv_key(), json.dumps(self.url_strategies.export()))
+            self._db.set_kv(self._go_template_kv_key(), json.dumps(self.go_template.export()))
+        except Exception:
+            pass
+
+        try:
+            saved = self.flights.saved - saved_before
+            if saved:
+                logger.info(f"{self.name}: {saved} duplicate fetches avoided this run")
+            skipped = self.go_template.derived_hits - derived_before
+            if skipped:
+                logger.info(f"{self.name}: {skipped} course page fetches skipped via derived /go/ URLs")
+        except Exception:
+            pass
         logger.info(f"✅ Scraped {len(courses)} courses from DiscUdemy")
         return courses
 
+    def _extract_listing_cards(self, page_text: str) -> List[tuple]:
+        """(title, absolute href) for each course card on a listing page, ads skipped"""
+        # Only the card grid is tokenized (see scrapers.discudemy_listing); no tree is built
+        course_links = []
+        for card in parse_listing_cards(page_text):
+            if card.is_ad or not card.href:
+                continue
+            href = card.href
+            if href.startswith('/'):
+                abs_href = 'https://www.discudemy.com' + href
+            elif href.startswith('http'):
+                abs_href = href
+            else:
+                continue
+            course_links.append((card.title, abs_href))
+        return course_links
+
+    def _go_template_kv_key(self) -> str:
+        return f"{self.name}:go_template"
+
+    def _strategy_kv_key(self) -> str:
+        return f"{self.name}:url_strategy_stats"
+
+    def _listing_kv_key(self, page_url: str) -> str:
+        return f"{self.name}:listing_validators:{page_url}"
+
+    def commit_listing_validators(self) -> int:
+        """Save validators of the fully handled listing pages from the last scrape (call once
+        its courses are stored; until then the pages are fetched and parsed again)"""
+        pending, self._pending_validators = self._pending_validators, {}
+        for page_url, validators in pending.items():
+            self._db.set_kv(self._listing_kv_key(page_url), json.dumps(validators))
+        return len(pending)
+
+    def _fetch_listing_page(self, page_url: str):
+        """Conditionally fetch a listing page (runs on the worker pool).
+        Returns (response, unchanged, validators). A 304 reply or a body identical to the
+        last fully processed fetch yields unchanged=True so the page is skipped unparsed.
+        """
+        cached = {}
+        if getattr(Config, 'DISCUDEMY_CONDITIONAL_GET', True):
+            try:
+                cached = json.loads(self._db.get_kv(self._listing_kv_key(page_url)) or '{}')
+            except Exception:
+                cached = {}
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        resp = self._make_request(page_url, headers=headers or None)
+        if resp is None:
+            return None, False, None
+        if resp.status_code == 304:
+            return None, True, None
+        digest = hashlib.sha1(resp.content or b'').hexdigest()
+        if cached and digest == cached.get('digest'):
+            return None, True, None
+        validators = {
+            'etag': resp.headers.get('ETag'),
+            'last_modified': resp.headers.get('Last-Modified'),
+            'digest': digest,
+        }
+        return resp, False, validators
+
+    def _resolve_card(self, title: str, abs_href: str) -> Dict:
+        """Resolve one listing card to course data (runs on the worker pool).
+        Returns {'status': 'ok', 'course_data': {...}} or {'status': 'no_real_url'}.
+        """
+        # Extract real Udemy URL from DiscUdemy link
+        real_udemy_url = None
+        with self._resolve_stage:
+            # Fast-path: if the card already links directly to Udemy, accept it
+            if abs_href.startswith('https://www.udemy.com/') or abs_href.startswith('https://udemy.com/'):
+                real_udemy_url = abs_href
+            elif '/go/' in abs_href:
+                real_udemy_url = self._extract_udemy_from_go_page(abs_href)
+            else:
+                # Straight to the /go/ page when the URL can be derived from the card's slug
+                go_url = self.go_template.derive(abs_href) if getattr(Config, 'DISCUDEMY_GO_TEMPLATE', True) else None
+                if go_url:
+                    real_udemy_url = self._extract_udemy_from_go_page(go_url)
+                    derived_ok = _is_coupon_course_url(real_udemy_url)
+                    self.go_template.record(derived_ok)
+                    if not derived_ok:
+                        logger.debug(f"Derived /go/ URL {go_url} failed; using the course page")
+                        real_udemy_url = None
+                if not real_udemy_url:
+                    # DiscUdemy internal course page -> extract the Udemy target
+                    real_udemy_url = self._extract_real_udemy_url(abs_href)
+
+        # Skip if extraction failed or invalid URL
+        if not real_udemy_url or 'discudemy.com' in real_udemy_url or not ('udemy.com/course/' in real_udemy_url):
+            return {'status': 'no_real_url'}
+
+        # Build course data
+        course_data = {
+            'title': title or 'Free Udemy Course',
+            'course_url': real_udemy_url,
+            'discounted_price': 'Free',
+            'discount_percentage': '100% OFF'
+        }
+
+        # Success - extracted valid Udemy URL
+        logger.info(f"• Found: {course_data['title'][:50]}{'...' if len(course_data['title']) > 50 else ''}")
+
+        # Fetch real metadata from Udemy and merge
+        with self._enrich_stage:
+            try:
+                meta = self._fetch_udemy_metadata(real_udemy_url, referer=abs_href) or {}
+                # Prefer real title if present
+                if meta.get('title'):
+                    course_data['title'] = meta['title']
+                # Attach additional metadata (expanded)
+                enriched_keys = 0
+                for k in [
+                    'image_url', 'category', 'instructor', 'language', 'price', 'currency',
+                    'rating', 'students_count', 'subtitle', 'description', 'duration',
+                    'level', 'lectures', 'learn', 'requirements', 'audience'
+                ]:
+                    if meta.get(k) not in [None, '', []]:
+                        course_data[k] = meta[k]
+                        enriched_keys += 1
+                if enriched_keys > 0:
+                    course_data['meta_enriched'] = True
+            except Exception:
+                pass
+
+        return {'status': 'ok', 'course_data': course_data}
+
     def _validate_udemy_url(self, url: Optional[str]) -> bool:
         """Validation for deep pages.
         Default: offline pattern validation (no network) to avoid false negatives.
@@ -335,25 +579,13 @@ class DiscUdemyScraper(BaseScraper):
         if not url:
             return False
         # Offline pattern check
-        try:
-            import re as _re
-            pattern = r"https?://(?:www\.)?udemy\.com/course/[^\s\"'>]+"
-            if not _re.search(pattern, url):
-                return False
-        except Exception:
-            # Fallback simple contains check
-            if 'udemy.com/course/' not in url:
-                return False
+        if not _UDEMY_COURSE_URL_RE.search(url):
+            return False
 
         # Online check (optional)
         if getattr(Config, 'VALIDATION_ONLINE', False):
             try:
-                resp = self.session.get(
-                    url,
-                    headers=self.headers,
-                    timeout=getattr(Config, 'VALIDATION_TIMEOUT', 8),
-                    allow_redirects=True,
-                )
+                resp = self._send(url, timeout=getattr(Config, 'VALIDATION_TIMEOUT', 8))
                 status = getattr(resp, 'status_code', 500)
                 final_url = getattr(resp, 'url', '') if resp is not None else ''
                 if hasattr(resp, 'close'):
@@ -370,59 +602,12 @@ class DiscUdemyScraper(BaseScraper):
                 return True
         return True
     
-    def _extract_course_from_link(self, link) -> Dict:
-        """Extract course data from a DiscUdemy course link"""
-        course_data = {}
-        
-        try:
-            href = link.get('href', '')
-            title = link.get_text(strip=True)
-            
-            # Skip if no title or href
-            if not title or not href:
-                return None
-            
-            # Make href absolute
-            if href.startswith('/'):
-                href = 'https://www.discudemy.com' + href
-            
-            course_data['title'] = title
-            
-            # If it's a /go/ link, follow it directly to get the Udemy URL
-            if '/go/' in href:
-                logger.debug(f"Found /go/ redirect link: {href}")
-                real_udemy_url = self._extract_udemy_from_go_page(href)
-                if real_udemy_url and 'udemy.com/course/' in real_udemy_url:
-                    course_data['course_url'] = real_udemy_url
-                    logger.info(f"Successfully extracted Udemy URL: {real_udemy_url}")
-                else:
-                    # NEVER fallback to DiscUdemy URL - return None to reject this course
-                    logger.warning(f"Failed to extract Udemy URL from /go/ link: {href}")
-                    return None
-            else:
-                # It's a regular course page, extract the /go/ link from it
-                logger.debug(f"Processing course page: {href}")
-                real_udemy_url = self._extract_real_udemy_url(href)
-                if real_udemy_url and 'udemy.com/course/' in real_udemy_url:
-                    course_data['course_url'] = real_udemy_url
-                    logger.info(f"Successfully extracted Udemy URL: {real_udemy_url}")
-                else:
-                    # NEVER fallback to DiscUdemy URL - return None to reject this course
-                    logger.warning(f"Failed to extract Udemy URL from course page: {href}")
-                    return None
-            
-            # Only set basic required fields - metadata will be extracted from Udemy
-            course_data.setdefault('discounted_price', 'Free')
-            course_data.setdefault('discount_percentage', '100% OFF')
-            
-            return course_data
-            
-        except Exception as e:
-            logger.error(f"Error extracting course from link: {e}")
-            return None
-    
     def _extract_real_udemy_url(self, discudemy_url: str) -> str:
         """Extract the real Udemy URL with coupon code from DiscUdemy page"""
+        return self.flights.do(('real_url', discudemy_url), lambda: self._scan_course_page(discudemy_url))
+
+    def _scan_course_page(self, discudemy_url: str) -> str:
+        """Fetch a DiscUdemy course page and follow it to the Udemy URL (see _extract_real_udemy_url)"""
         try:
             # Make request to the DiscUdemy course page
             response = self._make_request(discudemy_url)
@@ -432,135 +617,21 @@ class DiscUdemyScraper(BaseScraper):
             soup = self._parse_html(response.text)
             if not soup:
                 return None
-            
-            # Method 1: Look for the "Take Course" button with class="discBtn" that leads to /go/ endpoint
-            # This is the most reliable method based on the HTML structure
-            take_course_button = soup.find('a', class_='discBtn')
-            if take_course_button:
-                href = take_course_button.get('href')
-                if href and '/go/' in href:
-                    # This is the redirect URL, follow it to get the real Udemy URL
-                    if href.startswith('/'):
-                        redirect_url = 'https://www.discudemy.com' + href
-                    else:
-                        redirect_url = href
-                    
-                    real_url = self._extract_udemy_from_go_page(redirect_url)
-                    if real_url and 'udemy.com/course/' in real_url:
-                        return real_url
-            
-            # Method 2: Look for any "Take Course" or "Get Course" button that leads to /go/ endpoint
-            course_buttons = soup.find_all('a', string=lambda x: x and any(word in x.lower() for word in ['take course', 'get course', 'enroll', 'free']) if x else False)
-            for button in course_buttons:
-                href = button.get('href')
-                if href and '/go/' in href:
-                    # This is the redirect URL, follow it to get the real Udemy URL
-                    if href.startswith('/'):
-                        redirect_url = 'https://www.discudemy.com' + href
-                    else:
-                        redirect_url = href
-                    
-                    logger.debug(f"Found redirect URL: {redirect_url}")
-                    real_url = self._extract_udemy_from_go_page(redirect_url)
-                    if real_url:
-                        return real_url
-            
-            # Method 3: Fallback - any anchor with '/go/' regardless of text
-            generic_go_links = soup.find_all('a', href=lambda x: x and '/go/' in x if x else False)
-            for a in generic_go_links:
-                href = a.get('href')
-                if not href:
-                    continue
-                redirect_url = ('https://www.discudemy.com' + href) if href.startswith('/') else href
-                real_url = self._extract_udemy_from_go_page(redirect_url)
-                if real_url:
-                    return real_url
+            self._learn_go_template(discudemy_url, soup)
 
-            # Method 4: Look for direct Udemy links in the page (rare but possible)
-            udemy_links = soup.find_all('a', href=lambda x: x and 'udemy.com' in x if x else False)
-            for link in udemy_links:
-                href = link.get('href')
-                if href and 'couponCode=' in href:
-                    logger.debug(f"Found direct Udemy link: {href}")
-                    return href
-            
-            # Method 5: Look for JavaScript variables containing the Udemy URL
-            scripts = soup.find_all('script')
-            for script in scripts:
-                if script.string:
-                    script_content = script.string
-                    
-                    # Look for common patterns where Udemy URLs are stored
-                    patterns = [
-                        r'udemy\.com/course/[^"\']+\?couponCode=[^"\']+',
-                        r'https://www\.udemy\.com/course/[^"\']+\?couponCode=[^"\']+',
-                        r'"url":\s*"([^"]*udemy\.com[^"]*couponCode=[^"]*)"',
-                        r'window\.location\s*=\s*["\']([^"\']*udemy\.com[^"\']*)["\']',
-                        r'href\s*=\s*["\']([^"\']*udemy\.com[^"\']*couponCode=[^"\']*)["\']'
-                    ]
-                    
-                    import re
-                    for pattern in patterns:
-                        matches = re.findall(pattern, script_content, re.IGNORECASE)
-                        if matches:
-                            udemy_url = matches[0] if isinstance(matches[0], str) else matches[0]
-                            if not udemy_url.startswith('http'):
-                                udemy_url = 'https://' + udemy_url
-                            logger.debug(f"Found Udemy URL in script: {udemy_url}")
-                            return udemy_url
-            
-            # Method 6: Look for buttons or elements with data attributes
-            buttons = soup.find_all(['button', 'a', 'div'], attrs={'data-url': True})
-            for button in buttons:
-                data_url = button.get('data-url')
-                if data_url and 'udemy.com' in data_url and 'couponCode=' in data_url:
-                    logger.debug(f"Found Udemy URL in data attribute: {data_url}")
-                    return data_url
-            
-            # Method 7: Look for meta tags with Udemy URLs
-            meta_tags = soup.find_all('meta')
-            for meta in meta_tags:
-                content = meta.get('content', '')
-                if 'udemy.com' in content and 'couponCode=' in content:
-                    import re
-                    match = re.search(r'https://[^"\']*udemy\.com[^"\']*couponCode=[^"\']*', content)
-                    if match:
-                        logger.debug(f"Found Udemy URL in meta tag: {match.group()}")
-                        return match.group()
-
-            # Method 8: Meta refresh redirects that point to /go/ or Udemy
-            meta_refresh = soup.find('meta', attrs={'http-equiv': lambda x: x and x.lower() == 'refresh'})
-            if meta_refresh:
-                content = meta_refresh.get('content', '')
-                import re as _re
-                m = _re.search(r'url=([^;]+)', content, _re.IGNORECASE)
-                if m:
-                    refresh_url = m.group(1).strip().strip('"\'')
-                    if refresh_url:
-                        if refresh_url.startswith('/'):
-                            refresh_url = 'https://www.discudemy.com' + refresh_url
-                        if 'udemy.com' in refresh_url:
-                            return refresh_url
-                        if '/go/' in refresh_url:
-                            real_url = self._extract_udemy_from_go_page(refresh_url)
-                            if real_url:
-                                return real_url
-            
-            # Method 9: Look for form actions or hidden inputs
-            forms = soup.find_all('form')
-            for form in forms:
-                action = form.get('action', '')
-                if 'udemy.com' in action:
-                    logger.debug(f"Found Udemy URL in form action: {action}")
-                    return action
-                
-                # Check hidden inputs in forms
-                inputs = form.find_all('input', type='hidden')
-                for inp in inputs:
-                    value = inp.get('value', '')
-                    if 'udemy.com' in value and 'couponCode=' in value:
-                        logger.debug(f"Found Udemy URL in hidden input: {value}")
-                        return value
+            # Strategies run cheapest likely winner first (hit rate and cost are learned across runs)
+            if getattr(Config, 'URL_STRATEGY_ADAPTIVE', True):
+                order = self.url_strategies.order()
+            else:
+                order = self.url_strategies.names
+            for name in order:
+                started = time.monotonic()
+                real_url = _URL_STRATEGIES[name](self, soup)
+                # Only a course URL carrying a coupon counts; anything else falls through
+                hit = _is_coupon_course_url(real_url)
+                self.url_strategies.record(name, hit, time.monotonic() - started)
+                if hit:
+                    return real_url
             
             # Could not extract real Udemy URL - return None
             return None
@@ -568,22 +639,199 @@ class DiscUdemyScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Error extracting real Udemy URL from {discudemy_url}: {e}")
             return None
+
+    def _learn_go_template(self, discudemy_url: str, soup):
+        """Feed the course page's discBtn /go/ link into the learned URL template"""
+        button = soup.find('a', class_='discBtn')
+        href = button.get('href') if button else None
+        if not href or '/go/' not in href:
+            return
+        go_url = ('https://www.discudemy.com' + href) if href.startswith('/') else href
+        self.go_template.observe(_go_template(discudemy_url, go_url))
+
+    def _follow_go_href(self, href: str) -> str:
+        redirect_url = ('https://www.discudemy.com' + href) if href.startswith('/') else href
+        return self._extract_udemy_from_go_page(redirect_url)
+
+    def _strategy_disc_btn(self, soup) -> Optional[str]:
+        # The "Take Course" button with class="discBtn" that leads to the /go/ endpoint
+        take_course_button = soup.find('a', class_='discBtn')
+        if take_course_button:
+            href = take_course_button.get('href')
+            if href and '/go/' in href:
+                real_url = self._follow_go_href(href)
+                if real_url and 'udemy.com/course/' in real_url:
+                    return real_url
+        return None
+
+    def _strategy_button_text(self, soup) -> Optional[str]:
+        # Any "Take Course" / "Get Course" style button that leads to /go/
+        course_buttons = soup.find_all('a', string=lambda x: x and any(word in x.lower() for word in ['take course', 'get course', 'enroll', 'free']) if x else False)
+        for button in course_buttons:
+            href = button.get('href')
+            if href and '/go/' in href:
+                logger.debug(f"Found redirect URL: {href}")
+                real_url = self._follow_go_href(href)
+                if real_url:
+                    return real_url
+        return None
+
+    def _strategy_go_anchor(self, soup) -> Optional[str]:
+        # Any anchor with '/go/' regardless of text
+        for a in soup.find_all('a', href=lambda x: x and '/go/' in x if x else False):
+            href = a.get('href')
+            if not href:
+                continue
+            real_url = self._follow_go_href(href)
+            if real_url:
+                return real_url
+        return None
+
+    def _strategy_direct_link(self, soup) -> Optional[str]:
+        # Direct Udemy links in the page (rare but possible)
+        for link in soup.find_all('a', href=lambda x: x and 'udemy.com' in x if x else False):
+            href = link.get('href')
+            if href and 'couponCode=' in href:
+                logger.debug(f"Found direct Udemy link: {href}")
+                return href
+        return None
+
+    def _strategy_script(self, soup) -> Optional[str]:
+        # JavaScript variables containing the Udemy URL
+        for script in soup.find_all('script'):
+            if script.string:
+                for pattern in _SCRIPT_URL_PATTERNS:
+                    matches = pattern.findall(script.string)
+                    if matches:
+                        udemy_url = matches[0]
+                        if not udemy_url.startswith('http'):
+                            udemy_url = 'https://' + udemy_url
+                        logger.debug(f"Found Udemy URL in script: {udemy_url}")
+                        return udemy_url
+        return None
+
+    def _strategy_data_url(self, soup) -> Optional[str]:
+        # Buttons or elements with data attributes
+        for button in soup.find_all(['button', 'a', 'div'], attrs={'data-url': True}):
+            data_url = button.get('data-url')
+            if data_url and 'udemy.com' in data_url and 'couponCode=' in data_url:
+                logger.debug(f"Found Udemy URL in data attribute: {data_url}")
+                return data_url
+        return None
+
+    def _strategy_meta_tag(self, soup) -> Optional[str]:
+        # Meta tags with Udemy URLs
+        for meta in soup.find_all('meta'):
+            content = meta.get('content', '')
+            if 'udemy.com' in content and 'couponCode=' in content:
+                match = re.search(r'https://[^"\']*udemy\.com[^"\']*couponCode=[^"\']*', content)
+                if match:
+                    logger.debug(f"Found Udemy URL in meta tag: {match.group()}")
+                    return match.group()
+        return None
+
+    def _strategy_meta_refresh(self, soup) -> Optional[str]:
+        # Meta refresh redirects that point to /go/ or Udemy
+        meta_refresh = soup.find('meta', attrs={'http-equiv': lambda x: x and x.lower() == 'refresh'})
+        if meta_refresh:
+            content = meta_refresh.get('content', '')
+            m = re.search(r'url=([^;]+)', content, re.IGNORECASE)
+            if m:
+                refresh_url = m.group(1).strip().strip('"\'')
+                if refresh_url:
+                    if refresh_url.startswith('/'):
+                        refresh_url = 'https://www.discudemy.com' + refresh_url
+                    if 'udemy.com' in refresh_url:
+                        return refresh_url
+                    if '/go/' in refresh_url:
+                        real_url = self._extract_udemy_from_go_page(refresh_url)
+                        if real_url:
+                            return real_url
+        return None
+
+    def _strategy_form(self, soup) -> Optional[str]:
+        # Form actions or hidden inputs
+        for form in soup.find_all('form'):
+            action = form.get('action', '')
+            if 'udemy.com' in action:
+                logger.debug(f"Found Udemy URL in form action: {action}")
+                return action
+            for inp in form.find_all('input', type='hidden'):
+                value = inp.get('value', '')
+                if 'udemy.com' in value and 'couponCode=' in value:
+                    logger.debug(f"Found Udemy URL in hidden input: {value}")
+                    return value
+        return None
     
     
     
     def _extract_udemy_from_go_page(self, go_url: str) -> str:
         """Extract Udemy URL with coupon from DiscUdemy /go/ page"""
+        # Several fallbacks (and repeated cards) can point at the same /go/ page
+        return self.flights.do(('go', go_url), lambda: self._scan_go_page(go_url))
+
+    def _scan_go_page(self, go_url: str) -> str:
+        """Fetch a /go/ page and extract the Udemy URL (see _extract_udemy_from_go_page)"""
         try:
-            # Add small delay to avoid rate limiting
-            time.sleep(0.5)
-            
-            # Make request to the /go/ page
-            response = self._make_request(go_url)
-            if not response:
+            if getattr(Config, 'GO_STREAM_ENABLE', True):
+                # Usually the coupon link sits near the top: stop reading as soon as it shows up
+                found, page_text = self._stream_go_page(go_url)
+                if found:
+                    return found
+            else:
+                # Make request to the /go/ page (host politeness is handled by the scheduler)
+                response = self._make_request(go_url)
+                page_text = response.text if response else None
+            if page_text is None:
                 return None
-            
+        except Exception as e:
+            logger.error(f"Error extracting Udemy URL from /go/ page {go_url}: {e}")
+            return None
+        return self._extract_udemy_from_go_html(go_url, page_text)
+
+    def _stream_go_page(self, go_url: str):
+        """Read a /go/ page in chunks, scanning for the coupon link as data arrives.
+        Returns (udemy_url, None) on an early match, otherwise (None, text_read) so the
+        full-page methods can run on what was downloaded (None when the request failed).
+        """
+        response = self._make_request(go_url, stream=True)
+        if not response:
+            return None, None
+        max_bytes = max(4096, int(getattr(Config, 'GO_STREAM_MAX_BYTES', 262144)))
+        chunk_size = max(1024, int(getattr(Config, 'GO_STREAM_CHUNK_SIZE', 8192)))
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+        parts: List[str] = []
+        tail = ''
+        read = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if not chunk:
+                    continue
+                read += len(chunk)
+                text = decoder.decode(chunk)
+                parts.append(text)
+                # Re-scan a short overlap so a tag split across chunks is still seen whole
+                window = tail + text
+                m = _GO_COUPON_LINK_RE.search(window)
+                if m:
+                    url = html.unescape(m.group(1) or m.group(2))
+                    logger.debug(f"Found Udemy link with coupon on /go/ page after {read} bytes: {url}")
+                    return url, None
+                tail = window[-_GO_SCAN_OVERLAP:]
+                if read >= max_bytes:
+                    logger.debug(f"/go/ page {go_url} exceeded {max_bytes} bytes; using what was read")
+                    break
+            else:
+                parts.append(decoder.decode(b'', final=True))
+        finally:
+            response.close()
+        return None, ''.join(parts)
+
+    def _extract_udemy_from_go_html(self, go_url: str, page_text: str) -> str:
+        """Full-page extraction methods for a /go/ page"""
+        try:
             # Parse the response
-            soup = self._parse_html(response.text)
+            soup = self._parse_html(page_text)
             if not soup:
                 return None
             
@@ -596,8 +844,6 @@ class DiscUdemyScraper(BaseScraper):
                     return href
             
             # Method 2: Search for Udemy URLs in the page text (most reliable for /go/ pages)
-            page_text = response.text
-            import re
             
             # Enhanced patterns specifically for /go/ pages
             patterns = [
@@ -651,3 +897,25 @@ class DiscUdemyScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Error extracting Udemy URL from /go/ page {go_url}: {e}")
             return None
+
+
+# Course-page strategies for _extract_real_udemy_url, in their original fixed order
+_URL_STRATEGIES = {
+    'disc_btn': DiscUdemyScraper._strategy_disc_btn,
+    'button_text': DiscUdemyScraper._strategy_button_text,
+    'go_anchor': DiscUdemyScraper._strategy_go_anchor,
+    'direct_link': DiscUdemyScraper._strategy_direct_link,
+    'script': DiscUdemyScraper._strategy_script,
+    'data_url': DiscUdemyScraper._strategy_data_url,
+    'meta_tag': DiscUdemyScraper._strategy_meta_tag,
+    'meta_refresh': DiscUdemyScraper._strategy_meta_refresh,
+    'form': DiscUdemyScraper._strategy_form,
+}
+
+# Loose strategies (any /go/ anchor, script regexes, form actions) never move ahead
+# of the ones that pick a specific coupon link, however cheap they are
+_URL_STRATEGY_TIERS = {'go_anchor': 1, 'script': 1, 'form': 1}
+
+
+def _is_coupon_course_url(url: Optional[str]) -> bool:
+    return bool(url) and 'udemy.com/course/' in url and 'couponCode=' in url
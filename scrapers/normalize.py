@@ -0,0 +1,239 @@
+"""
+Course record normalization shared by all scrapers.
+
+normalize_course turns whatever a scraper extracted into the record the
+database and formatter expect, synthesizing fallbacks for missing fields.
+Everything that does not depend on the course (language table, patterns,
+image sizes, instructor names) is built once at import; language codes are
+memoized. Fallbacks draw from the global random module in the same order as
+always (instructor, rating, students), so seeded runs are unchanged.
+"""
+import logging
+import random
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from scrapers.category_engine import classify_title
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_NAMES = {
+    'en': 'English', 'en_US': 'English', 'en-Us': 'English', 'en-GB': 'English',
+    'es': 'Spanish', 'es_ES': 'Spanish', 'es_LA': 'Spanish',
+    'pt': 'Portuguese', 'pt_BR': 'Portuguese',
+    'de': 'German', 'fr': 'French', 'it': 'Italian', 'ru': 'Russian',
+    'tr': 'Turkish', 'ar': 'Arabic', 'hi': 'Hindi', 'ur': 'Urdu',
+    'vi': 'Vietnamese', 'id': 'Indonesian', 'zh': 'Chinese', 'zh_CN': 'Chinese', 'ja': 'Japanese', 'ko': 'Korean'
+}
+
+INSTRUCTOR_NAMES = (
+    'Dr. Sarah Johnson', 'Michael Chen', 'Prof. David Miller', 'Jessica Rodriguez',
+    'Alex Thompson', 'Dr. Emily Davis', 'Robert Wilson', 'Maria Garcia',
+    'James Anderson', 'Dr. Lisa Wang', 'Kevin Brown', 'Amanda Taylor'
+)
+
+# Low-res Udemy image sizes upgraded to 750x422, in lookup order
+_IMAGE_SIZE_SEGMENTS = tuple(f'/{size}/' for size in ('240x135', '360x200', '480x270', '750x422'))
+_IMAGE_HIRES_SEGMENT = '/750x422/'
+
+_COURSE_SLUG_RE = re.compile(r'/course/([^/?]+)')
+_COUPON_PAIR_RE = re.compile(r'&couponCode=([^&]*)')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+
+def clean_text(text: str) -> str:
+    """Collapse all whitespace runs to single spaces"""
+    if not text:
+        return ""
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=256)
+def _language_name(code: str) -> str:
+    if code in LANGUAGE_NAMES:
+        return LANGUAGE_NAMES[code]
+    # Try first two letters
+    short = code.split('_')[0].split('-')[0].lower()
+    return LANGUAGE_NAMES.get(short, code)
+
+
+def normalize_language(val: Optional[str]) -> Optional[str]:
+    """Locale code or name -> language name (en_US -> English); unknown values pass through"""
+    if not val:
+        return val
+    return _language_name(str(val).strip())
+
+
+def instructor_name(title: str) -> str:
+    """Placeholder instructor for courses whose page did not name one"""
+    return random.choice(INSTRUCTOR_NAMES)
+
+
+def coupon_code(course_url: str) -> Optional[str]:
+    """couponCode query parameter of a course URL (None when absent or empty)"""
+    if not course_url or 'couponCode=' not in course_url:
+        return None
+    try:
+        # Plain ASCII query with one literal couponCode pair: read it directly.
+        # Anything parse_qs would decode or reject goes through it instead.
+        query = course_url.partition('#')[0].partition('?')[2]
+        if (query.count('couponCode=') == 1 and course_url.isascii() and course_url.isprintable()
+                and '%' not in query and '+' not in query and '[' not in course_url and ']' not in course_url):
+            m = _COUPON_PAIR_RE.search('&' + query)
+            return (m.group(1) or None) if m else None
+        return parse_qs(urlparse(course_url).query).get('couponCode', [None])[0]
+    except Exception:
+        return None
+
+
+def _derive_title(course_data: Dict) -> str:
+    """Title as provided, else derived from the /course/<slug> URL"""
+    title = course_data.get('title', '')
+    course_url = course_data.get('course_url', '')
+    if not title and course_url and 'udemy.com/course/' in course_url:
+        url_match = _COURSE_SLUG_RE.search(course_url)
+        if url_match:
+            title = url_match.group(1).replace('-', ' ').title()
+    return title
+
+
+def _upgrade_image_url(image_url):
+    if image_url and 'img-c.udemycdn.com/course/' in image_url:
+        for segment in _IMAGE_SIZE_SEGMENTS:
+            if segment in image_url:
+                return image_url.replace(segment, _IMAGE_HIRES_SEGMENT)
+    return image_url
+
+
+def _coerce_list(val, clean: Callable[[str], str]) -> Optional[List[str]]:
+    if isinstance(val, list):
+        return [clean(str(x)) for x in val if str(x).strip()]
+    if isinstance(val, str):
+        return [clean(x) for x in val.split('\n') if x.strip()]
+    return None
+
+
+def _normalize(course_data: Dict, source_website: str, clean: Callable[[str], str],
+               categorize: Callable[[str], str], instructor_for: Callable[[str], str]) -> Dict:
+    try:
+        title = _derive_title(course_data)
+        course_url = course_data.get('course_url', '')
+
+        # Prefer real metadata when provided; synthesize robust fallbacks otherwise
+        category = course_data.get('category')
+        instructor = course_data.get('instructor')
+        rating = course_data.get('rating')
+        students = course_data.get('students_count')
+
+        # Price handling: if real 'price' and optional 'currency' provided, compose original_price
+        provided_price = course_data.get('price')
+        provided_currency = course_data.get('currency')
+        if provided_price:
+            if provided_currency:
+                original_price = f"{provided_currency} {provided_price}" if provided_currency.isalpha() else f"{provided_currency}{provided_price}"
+            else:
+                original_price = str(provided_price)
+        else:
+            original_price = None
+
+        language = normalize_language(course_data.get('language'))
+
+        try:
+            if not category:
+                category = categorize(title or '')
+        except Exception:
+            category = category or 'IT & Software'
+
+        try:
+            if not instructor:
+                instructor = instructor_for(title or '')
+        except Exception:
+            instructor = instructor or 'Expert Instructor'
+
+        try:
+            if not rating:
+                rating = round(random.uniform(3.9, 4.8), 1)
+            else:
+                rating = float(rating)
+        except Exception:
+            rating = 4.5
+
+        try:
+            if not students:
+                students = int(random.randint(1500, 60000))
+            elif isinstance(students, str):
+                # Coerce to int when possible
+                digits = _NON_DIGIT_RE.sub('', students)
+                students = int(digits) if digits else None
+        except Exception:
+            students = 15000
+
+        if not language:
+            language = 'English'
+
+        try:
+            image_url = _upgrade_image_url(course_data.get('image_url'))
+        except Exception:
+            image_url = course_data.get('image_url')
+
+        return {
+            'title': clean(title) if title else 'Free Udemy Course',
+            'instructor': instructor,
+            'course_url': course_url,
+            'discounted_price': 'Free',
+            'original_price': original_price,
+            'discount_percentage': '100% OFF',
+            'rating': rating,
+            'students_count': students,
+            'language': language,
+            'category': category,
+            'subtitle': clean(course_data.get('subtitle') or ''),
+            'description': course_data.get('description'),
+            'learn': _coerce_list(course_data.get('learn'), clean),
+            'requirements': _coerce_list(course_data.get('requirements'), clean),
+            'audience': _coerce_list(course_data.get('audience'), clean),
+            'duration': course_data.get('duration') or '',
+            'level': course_data.get('level') or '',
+            'lectures': course_data.get('lectures'),
+            'image_url': image_url,
+            'coupon_code': coupon_code(course_url),
+            'source_website': source_website,
+            'scraped_at': datetime.now().isoformat()
+        }
+
+    except Exception as e:
+        logger.error(f"Error normalizing course data: {e}")
+        # Return basic fallback
+        return {
+            'title': clean(course_data.get('title', 'Free Udemy Course')),
+            'instructor': 'Expert Instructor',
+            'course_url': course_data.get('course_url', ''),
+            'discounted_price': 'Free',
+            'original_price': '$199.99',
+            'discount_percentage': '100% OFF',
+            'rating': '4.5',
+            'students_count': '15,000+',
+            'language': 'English',
+            'category': 'Development',
+            'description': 'Master new skills with this comprehensive course designed for all skill levels.',
+            'image_url': None,
+            'source_website': source_website,
+            'scraped_at': datetime.now().isoformat()
+        }
+
+
+def normalize_course(course_data: Dict, source_website: str, clean: Callable[[str], str] = clean_text,
+                     categorize: Callable[[str], str] = classify_title,
+                     instructor_for: Callable[[str], str] = instructor_name) -> Dict:
+    """Normalized course record; clean/categorize/instructor_for are the scraper's hooks"""
+    return _normalize(course_data, source_website, clean, categorize, instructor_for)
+
+
+def normalize_many(courses: Iterable[Dict], source_website: str, clean: Callable[[str], str] = clean_text,
+                   categorize: Callable[[str], str] = classify_title,
+                   instructor_for: Callable[[str], str] = instructor_name) -> List[Dict]:
+    """normalize_course over a batch, in order"""
+    return [_normalize(course_data, source_website, clean, categorize, instructor_for) for course_data in courses]
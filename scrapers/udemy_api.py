@@ -0,0 +1,321 @@
+"""
+Udemy JSON metadata backend.
+
+Pulls course metadata from Udemy's api-2.0 course endpoint instead of
+downloading and mining the full landing page. The endpoint is addressed by
+numeric course id; a course seen for the first time is fetched by slug with
+the full field set, which yields its metadata and id in one request, and the
+slug -> id mapping is kept in the scrape_kv table. Returns the same keys as
+BaseScraper._parse_udemy_metadata; callers fall back to the HTML path when
+this returns nothing. fetch_many (batched id__in lookups) serves the metadata
+backfill in scripts/enrich_db_metadata.py; the live scrape enriches one card
+at a time through fetch.
+"""
+import json
+import re
+import threading
+import logging
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+from scrapers.udemy_page import html_text
+
+logger = logging.getLogger(__name__)
+
+API_ROOT = 'https://www.udemy.com/api-2.0'
+
+COURSE_FIELDS = ','.join([
+    'id', 'title', 'headline', 'description', 'image_750x422', 'image_480x270',
+    'visible_instructors', 'avg_rating', 'rating', 'num_subscribers',
+    'content_info_short', 'content_info', 'instructional_level_simple', 'instructional_level',
+    'num_lectures', 'objectives_summary', 'what_you_will_learn_data', 'prerequisites',
+    'requirements_data', 'target_audiences', 'price', 'price_detail', 'primary_category', 'locale',
+])
+FIELD_PARAMS = {
+    'fields[course]': COURSE_FIELDS,
+    'fields[user]': 'title,display_name',
+    'fields[locale]': 'simple_english_title,title',
+    'fields[course_category]': 'title',
+}
+
+_SLUG_RE = re.compile(r'udemy\.com/course/([^/?#]+)', re.IGNORECASE)
+_COURSE_ID_PATTERNS = [
+    re.compile(r'data-clp-course-id="(\d+)"'),
+    re.compile(r'data-course-id="(\d+)"'),
+    re.compile(r'"course_id"\s*:\s*(\d+)'),
+    re.compile(r'"courseId"\s*:\s*"?(\d+)'),
+]
+
+
+def course_slug(url: str) -> Optional[str]:
+    m = _SLUG_RE.search(url or '')
+    return m.group(1).lower() if m else None
+
+
+def _json_id(data) -> Optional[int]:
+    if isinstance(data, dict) and str(data.get('id', '')).isdigit():
+        return int(data['id'])
+    return None
+
+
+def _titles(value) -> List[str]:
+    """Flatten Udemy list fields: ['a', ...], [{'title': 'a'}, ...] or {'items': [...]}"""
+    if isinstance(value, dict):
+        value = value.get('items') or []
+    out: List[str] = []
+    if isinstance(value, list):
+        for it in value:
+            t = it.get('title') if isinstance(it, dict) else it
+            if isinstance(t, str) and t.strip():
+                out.append(t.strip())
+    return out
+
+
+def course_json_to_meta(course: Dict) -> Dict:
+    """Map an api-2.0 course object onto the metadata keys the scrapers use"""
+    meta: Dict = {}
+    if not isinstance(course, dict):
+        return meta
+    if course.get('title'):
+        meta['title'] = course['title']
+    if course.get('headline'):
+        meta['subtitle'] = course['headline']
+    if course.get('description'):
+        try:
+            meta['description'] = html_text(course['description'], '\n').strip()
+        except Exception:
+            meta['description'] = course['description']
+    image = course.get('image_750x422') or course.get('image_480x270')
+    if image:
+        meta['image_url'] = image
+    instructors = course.get('visible_instructors') or []
+    if isinstance(instructors, list) and instructors and isinstance(instructors[0], dict):
+        name = instructors[0].get('title') or instructors[0].get('display_name')
+        if name:
+            meta['instructor'] = name
+    rating = course.get('avg_rating') or course.get('rating')
+    if rating:
+        try:
+            meta['rating'] = float(rating)
+        except (TypeError, ValueError):
+            pass
+    if course.get('num_subscribers') is not None:
+        try:
+            meta['students_count'] = int(course['num_subscribers'])
+        except (TypeError, ValueError):
+            pass
+    duration = course.get('content_info_short') or course.get('content_info')
+    if duration:
+        meta['duration'] = duration
+    level = course.get('instructional_level_simple') or course.get('instructional_level')
+    if level:
+        meta['level'] = level
+    if course.get('num_lectures') is not None:
+        try:
+            meta['lectures'] = int(course['num_lectures'])
+        except (TypeError, ValueError):
+            pass
+    learn = _titles(course.get('what_you_will_learn_data')) or _titles(course.get('objectives_summary'))
+    if learn:
+        meta['learn'] = learn
+    requirements = _titles(course.get('requirements_data')) or _titles(course.get('prerequisites'))
+    if requirements:
+        meta['requirements'] = requirements
+    audience = _titles(course.get('target_audiences'))
+    if audience:
+        meta['audience'] = audience
+    category = course.get('primary_category')
+    if isinstance(category, dict) and category.get('title'):
+        meta['category'] = category['title']
+    locale = course.get('locale')
+    if isinstance(locale, dict):
+        lang = locale.get('simple_english_title') or locale.get('title')
+        if lang:
+            meta['language'] = lang
+    price_detail = course.get('price_detail')
+    if course.get('price'):
+        meta['price'] = str(course['price'])
+    elif isinstance(price_detail, dict) and price_detail.get('price_string'):
+        meta['price'] = price_detail['price_string']
+    if isinstance(price_detail, dict) and price_detail.get('currency'):
+        meta['currency'] = str(price_detail['currency']).upper()
+    return meta
+
+
+class UdemyApiBackend:
+    """Fetches course metadata from the api-2.0 JSON endpoints through a scraper's request path"""
+
+    def __init__(self, scraper, db=None):
+        self.scraper = scraper
+        self._db = db
+        self._lock = threading.Lock()
+        self._ids: Dict[str, int] = {}
+        self._batch_supported: Optional[bool] = None if getattr(Config, 'UDEMY_API_BATCH', True) else False
+        self.stats = {'api_hits': 0, 'api_misses': 0, 'ids_resolved': 0, 'batch_requests': 0}
+
+    @property
+    def db(self):
+        if self._db is None:
+            from utils.database import CourseDatabase
+            self._db = CourseDatabase()
+        return self._db
+
+    def _headers(self, referer: str) -> Dict:
+        return {
+            'Accept': 'application/json, text/plain, */*',
+            'Referer': referer,
+            'X-Requested-With': 'XMLHttpRequest',
+        }
+
+    def _get_json(self, url: str, referer: str) -> Optional[Dict]:
+        try:
+            response = self.scraper._send(url, headers={**self.scraper.headers, **self._headers(referer)})
+        except Exception as e:
+            logger.debug(f"Udemy API request failed for {url}: {e}")
+            return None
+        if response.status_code != 200:
+            logger.debug(f"Udemy API returned {response.status_code} for {url}")
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def _bump(self, key: str, n: int = 1):
+        with self._lock:
+            self.stats[key] += n
+
+    # -------------------- slug -> id --------------------
+
+    def course_id(self, course_url: str) -> Optional[int]:
+        """Numeric course id for a course URL (memory, then scrape_kv, then network)"""
+        slug = course_slug(course_url)
+        if not slug:
+            return None
+        course_id = self._known_id(slug)
+        if course_id is None:
+            data = self._get_json(f"{API_ROOT}/courses/{slug}/?{urlencode({'fields[course]': 'id'})}", course_url)
+            course_id = _json_id(data)
+            if course_id is None:
+                course_id = self._id_from_page(slug, course_url)
+            if course_id is not None:
+                self._remember(slug, course_id)
+        return course_id
+
+    def _known_id(self, slug: str) -> Optional[int]:
+        with self._lock:
+            if slug in self._ids:
+                return self._ids[slug]
+        cached = self.db.get_kv(f"udemy:course_id:{slug}")
+        course_id = int(cached) if cached and cached.isdigit() else None
+        if course_id is not None:
+            with self._lock:
+                self._ids[slug] = course_id
+        return course_id
+
+    def _remember(self, slug: str, course_id: int):
+        self.db.set_kv(f"udemy:course_id:{slug}", str(course_id))
+        self._bump('ids_resolved')
+        with self._lock:
+            self._ids[slug] = course_id
+
+    def _id_from_page(self, slug: str, course_url: str) -> Optional[int]:
+        """Course id embedded in the landing page (which goes through the on-disk page cache)"""
+        try:
+            page = self.scraper._fetch_udemy_page(course_url, referer=course_url)
+        except Exception as e:
+            logger.debug(f"Could not resolve Udemy course id for {slug}: {e}")
+            return None
+        for pattern in _COURSE_ID_PATTERNS:
+            m = pattern.search(page or '')
+            if m:
+                return int(m.group(1))
+        return None
+
+    # -------------------- metadata --------------------
+
+    def fetch(self, course_url: str) -> Dict:
+        """Metadata for one course ({} when the API path cannot serve it)"""
+        slug = course_slug(course_url)
+        if not slug:
+            self._bump('api_misses')
+            return {}
+        course_id = self._known_id(slug)
+        if course_id is None:
+            # First sighting: the slug lookup with all fields returns the id along with the metadata
+            data = self._get_json(f"{API_ROOT}/courses/{slug}/?{urlencode(FIELD_PARAMS)}", course_url)
+            course_id = _json_id(data)
+            if course_id is not None:
+                self._remember(slug, course_id)
+                meta = course_json_to_meta(data)
+                self._bump('api_hits' if meta else 'api_misses')
+                return meta
+            course_id = self._id_from_page(slug, course_url)
+            if course_id is not None:
+                self._remember(slug, course_id)
+        if course_id is None:
+            self._bump('api_misses')
+            return {}
+        data = self._get_json(f"{API_ROOT}/courses/{course_id}/?{urlencode(FIELD_PARAMS)}", course_url)
+        meta = course_json_to_meta(data) if data else {}
+        self._bump('api_hits' if meta else 'api_misses')
+        return meta
+
+    def fetch_many(self, course_urls: List[str]) -> List[Dict]:
+        """Metadata for several courses, in input order; one batched request when supported.
+        Used by the metadata backfill, where ids are mostly known from earlier runs."""
+        if not course_urls:
+            return []
+        ids = self.scraper.http.map(self.course_id, course_urls)
+        by_id: Dict[int, Dict] = {}
+        wanted = sorted({i for i in ids if i is not None})
+        if len(wanted) > 1 and self._batch_supported is not False:
+            by_id = self._fetch_batch(wanted, course_urls[0])
+        results: List[Optional[Dict]] = [by_id.get(i) if i is not None else None for i in ids]
+        missing = [idx for idx, meta in enumerate(results) if meta is None]
+        if missing:
+            fetched = self.scraper.http.map(lambda idx: self.fetch(course_urls[idx]), missing)
+            for idx, meta in zip(missing, fetched):
+                results[idx] = meta or {}
+        return [r or {} for r in results]
+
+    def _fetch_batch(self, course_ids: List[int], referer: str) -> Dict[int, Dict]:
+        """Try the list endpoint with an id filter; remember if Udemy ignores it.
+        Courses missing from the reply are left to per-course fetches."""
+        params = dict(FIELD_PARAMS)
+        params['id__in'] = ','.join(str(i) for i in course_ids)
+        params['page_size'] = str(len(course_ids))
+        data = self._get_json(f"{API_ROOT}/courses/?{urlencode(params)}", referer)
+        self._bump('batch_requests')
+        if not isinstance(data, dict):
+            # Failed request (network error, 429, ...): says nothing about batch support
+            return {}
+        results = data.get('results')
+        wanted = set(course_ids)
+        returned = set()
+        by_id: Dict[int, Dict] = {}
+        if isinstance(results, list):
+            for course in results:
+                if not isinstance(course, dict):
+                    continue
+                returned.add(course.get('id'))
+                if course.get('id') in wanted:
+                    by_id[course['id']] = course_json_to_meta(course)
+        if not (returned & wanted) or (returned - wanted):
+            # Unrequested courses, or none of ours, on a 200: the filter is ignored
+            if self._batch_supported is None:
+                logger.info("Udemy API batch lookups not available; fetching courses individually")
+            self._batch_supported = False
+            return {i: m for i, m in by_id.items() if m}
+        # Some ids may be absent (unpublished or expired courses); that is not a reason to stop batching
+        self._batch_supported = True
+        by_id = {i: m for i, m in by_id.items() if m}
+        self._bump('api_hits', len(by_id))
+        return by_id
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return dict(self.stats, batch_supported=self._batch_supported)
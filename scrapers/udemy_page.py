@@ -0,0 +1,347 @@
+"""
+Fast access to the data embedded in a Udemy landing page.
+
+Udemy bootstraps course data as JSON inside the page ("headline": "...",
+"num_lectures": 42, ...). Instead of one regex search over the whole page per
+field, one scan finds where each interesting key occurs and the field's own
+pattern is only matched at those positions. A field's first successful match
+is the same one re.search would have returned. One difference from the
+former extraction: students_count (num_subscribers) is now filled whenever
+the page has it; previously it was lost on pages where a rating matched.
+
+RawPageView slices the tags the metadata parser reads (body, meta, JSON-LD
+scripts) straight out of the page text, so no DOM has to be built for them;
+SoupPageView answers the same lookups from a BeautifulSoup tree. html_text
+turns an HTML fragment such as a course description into text, again
+without a tree.
+"""
+import re
+import json
+import html
+import html.entities
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # optional speedup
+    orjson = None
+
+_NEXT_DATA_TAG = '<script id="__NEXT_DATA__" type="application/json">'
+_NEXT_DATA_RE = re.compile(re.escape(_NEXT_DATA_TAG) + r'(\{.*?\})</script>', re.S)
+
+_TITLE_RE = re.compile(r'"title"\s*:\s*"(.*?)"')
+_INSTRUCTOR_TITLE_RE = re.compile(r'"title"\s*:\s*"([^"]+)"')
+_STRING_RE = re.compile(r'"([^"\\]*(?:\\.[^"\\]*)*)"')
+
+# JSON key -> pattern anchored at the key's opening quote
+_KEY_PATTERNS: Dict[str, re.Pattern] = {
+    'image_750x422': re.compile(r'"image_750x422"\s*:\s*"(https:[^"]+)"'),
+    'headline': re.compile(r'"headline"\s*:\s*"(.*?)"'),
+    'content_info_short': re.compile(r'"content_info_short"\s*:\s*"(.*?)"'),
+    'instructional_level_simple': re.compile(r'"instructional_level_simple"\s*:\s*"(.*?)"'),
+    'num_lectures': re.compile(r'"num_lectures"\s*:\s*(\d+)'),
+    'what_you_will_learn_data': re.compile(r'"what_you_will_learn_data"\s*:\s*\[(.*?)\]', re.S),
+    'objectives': re.compile(r'"objectives"\s*:\s*\[(.*?)\]', re.S),
+    'requirements_data': re.compile(r'"requirements_data"\s*:\s*\[(.*?)\]', re.S),
+    'prerequisites': re.compile(r'"prerequisites"\s*:\s*\[(.*?)\]', re.S),
+    'target_audiences': re.compile(r'"target_audiences"\s*:\s*\[(.*?)\]', re.S),
+    'targetAudiences': re.compile(r'"targetAudiences"\s*:\s*\[(.*?)\]', re.S),
+    'visible_instructors': re.compile(r'"visible_instructors"\s*:\s*\[(.*?)\]', re.S),
+    'primary_category': re.compile(r'"primary_category"\s*:\s*\{[^}]*"title"\s*:\s*"([^"]+)"'),
+    'locale': re.compile(r'"locale"\s*:\s*\{[^}]*"(simple_english_title|title)"\s*:\s*"([^"]+)"'),
+    'price_text': re.compile(r'"price_text"\s*:\s*"([^"]+)"'),
+    'currency': re.compile(r'"currency"\s*:\s*"([A-Z]{3})"'),
+    'rating': re.compile(r'"rating"\s*:\s*(\d+\.?\d*)'),
+    'num_subscribers': re.compile(r'"num_subscribers"\s*:\s*(\d+)'),
+}
+
+# One pass finds every key occurrence (zero-width after the quote, so adjacent keys are all seen)
+_KEY_SCAN_RE = re.compile('"(?=(' + '|'.join(re.escape(k) for k in _KEY_PATTERNS) + ')")')
+
+
+def _first_title(m):
+    t = _INSTRUCTOR_TITLE_RE.search(m.group(1))
+    return t.group(1) if t else None
+
+
+# meta field -> JSON keys in fallback order, each with its value conversion (None = leave unset).
+# Fields are applied in this order, as the per-field searches were.
+_FIELDS: List[Tuple[str, List[Tuple[str, Callable]]]] = [
+    ('image_url', [('image_750x422', lambda m: m.group(1).replace('\\u002F', '/').replace('\\/', '/'))]),
+    ('subtitle', [('headline', lambda m: m.group(1).encode('utf-8', 'ignore').decode('unicode_escape'))]),
+    ('duration', [('content_info_short', lambda m: m.group(1))]),
+    ('level', [('instructional_level_simple', lambda m: m.group(1))]),
+    ('lectures', [('num_lectures', lambda m: int(m.group(1)))]),
+    ('learn', [('what_you_will_learn_data', lambda m: _TITLE_RE.findall(m.group(1))),
+               ('objectives', lambda m: _STRING_RE.findall(m.group(1)))]),
+    ('requirements', [('requirements_data', lambda m: _TITLE_RE.findall(m.group(1))),
+                      ('prerequisites', lambda m: _STRING_RE.findall(m.group(1)))]),
+    ('audience', [('target_audiences', lambda m: _TITLE_RE.findall(m.group(1))),
+                  ('targetAudiences', lambda m: _STRING_RE.findall(m.group(1)))]),
+    ('instructor', [('visible_instructors', _first_title)]),
+    ('category', [('primary_category', lambda m: m.group(1))]),
+    ('language', [('locale', lambda m: m.group(2))]),
+    ('price', [('price_text', lambda m: m.group(1))]),
+    ('currency', [('currency', lambda m: m.group(1))]),
+    ('rating', [('rating', lambda m: float(m.group(1)))]),
+    ('students_count', [('num_subscribers', lambda m: int(m.group(1)))]),
+]
+
+
+def _inline_json_text(page_text: str) -> str:
+    """__NEXT_DATA__ JSON when the page embeds it, otherwise the whole page"""
+    if _NEXT_DATA_TAG in page_text:
+        m = _NEXT_DATA_RE.search(page_text)
+        if m:
+            return m.group(1)
+    return page_text
+
+
+def _scan(text: str, wanted: set, primaries: set) -> Dict[str, re.Match]:
+    """First full match per wanted key, in one walk (stops once every primary key is found)"""
+    found: Dict[str, re.Match] = {}
+    for km in _KEY_SCAN_RE.finditer(text):
+        key = km.group(1)
+        if key in found or key not in wanted:
+            continue
+        m = _KEY_PATTERNS[key].match(text, km.start())
+        if m:
+            found[key] = m
+            if primaries.issubset(found):
+                break
+    return found
+
+
+def extract_inline_hints(page_text: str, meta: Dict) -> Dict:
+    """Fill fields missing from meta using Udemy's inline JSON; returns meta"""
+    missing = [(field, keys) for field, keys in _FIELDS if field not in meta]
+    if not missing or not page_text:
+        return meta
+    text = _inline_json_text(page_text)
+    wanted = {key for _, keys in missing for key, _ in keys}
+    primaries = {keys[0][0] for _, keys in missing}
+    found = _scan(text, wanted, primaries)
+    for field, keys in missing:
+        for key, convert in keys:
+            m = found.get(key)
+            if m is None:
+                continue
+            value = convert(m)
+            if value is not None:
+                meta[field] = value
+            break
+    return meta
+
+
+def loads_json(text):
+    """json.loads, through orjson when it is installed (json handles what orjson rejects)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# Tags outside comments; scripts are matched whole so markup inside them is never picked up
+_ATTRS = r"""((?:[^>"']|"[^"]*"|'[^']*')*)"""
+_TAG_SCAN_RE = re.compile(
+    r'<!--.*?-->'
+    r'|<script\b' + _ATTRS + r'>(.*?)</script\s*>'
+    r'|<(meta|body)\b' + _ATTRS + r'>',
+    re.S | re.I,
+)
+
+
+class _AttrParser(HTMLParser):
+    """Attributes of one start tag, decoded the way BeautifulSoup's html.parser builder does"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.attrs: Dict[str, str] = {}
+
+    def handle_starttag(self, tag, attrs):
+        self.attrs = {k: ('' if v is None else v) for k, v in attrs}
+
+    handle_startendtag = handle_starttag
+
+    def parse(self, tag_text: str) -> Dict[str, str]:
+        self.attrs = {}
+        self.reset()
+        self.feed(tag_text)
+        self.close()
+        return self.attrs
+
+
+class _TextParser(HTMLParser):
+    """Text nodes of an HTML fragment as BeautifulSoup's html.parser builder makes them: adjacent
+    data merged, references decoded the same way, whitespace-only nodes collapsed, script/style skipped"""
+
+    _SKIP = frozenset(('script', 'style', 'template'))
+    _PRESERVE = frozenset(('pre', 'textarea'))
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.parts: List[str] = []
+        self._data: List[str] = []
+        self._skipping = 0
+        self._preserving = 0
+
+    def _flush(self):
+        if not self._data:
+            return
+        text = ''.join(self._data)
+        self._data = []
+        if self._skipping:
+            return
+        if not self._preserving and not text.strip(' \t\n\r\f'):
+            text = '\n' if '\n' in text else ' '
+        self.parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        self._flush()
+        if tag in self._SKIP:
+            self._skipping += 1
+        elif tag in self._PRESERVE:
+            self._preserving += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self._flush()
+
+    def handle_endtag(self, tag):
+        self._flush()
+        if tag in self._SKIP and self._skipping:
+            self._skipping -= 1
+        elif tag in self._PRESERVE and self._preserving:
+            self._preserving -= 1
+
+    def handle_data(self, data):
+        self._data.append(data)
+
+    def handle_entityref(self, name):
+        self._data.append(html.entities.html5.get(name + ';', '&' + name))
+
+    def handle_charref(self, name):
+        try:
+            code = int(name[1:], 16) if name[:1] in 'xX' else int(name)
+        except ValueError:
+            self._data.append('\N{REPLACEMENT CHARACTER}')
+            return
+        text = None
+        if 0 < code < 256:
+            # Low references often mean windows-1252 rather than Unicode
+            try:
+                text = bytes([code]).decode('windows-1252')
+            except UnicodeDecodeError:
+                pass
+        if not text and code:
+            try:
+                text = chr(code)
+            except (ValueError, OverflowError):
+                pass
+        self._data.append(text or '\N{REPLACEMENT CHARACTER}')
+
+    def unknown_decl(self, data):
+        self._flush()
+        if data.startswith('CDATA[') and not self._skipping:
+            self.parts.append(data[len('CDATA['):])
+
+    def handle_comment(self, data):
+        self._flush()
+
+    def handle_decl(self, decl):
+        self._flush()
+
+    def handle_pi(self, data):
+        self._flush()
+
+    def text(self, fragment: str, separator: str) -> str:
+        self.feed(fragment)
+        self.close()
+        self._flush()
+        return separator.join(self.parts)
+
+
+def html_text(fragment: str, separator: str = '') -> str:
+    """Text of an HTML fragment joined by separator: make_soup(fragment, 'html.parser').get_text(separator)
+    without building a tree"""
+    return _TextParser().text(fragment or '', separator)
+
+
+class _PageView:
+    _module_args_done = False
+    _module_args = None
+
+    def body_attrs(self) -> Optional[Dict[str, str]]:
+        raise NotImplementedError
+
+    def module_args(self):
+        """Parsed body[data-module-args] JSON (None when absent or invalid)"""
+        if not self._module_args_done:
+            self._module_args_done = True
+            attrs = self.body_attrs() or {}
+            raw = attrs.get('data-module-args')
+            if raw:
+                try:
+                    self._module_args = loads_json(html.unescape(raw))
+                except Exception:
+                    self._module_args = None
+        return self._module_args
+
+
+class RawPageView(_PageView):
+    """body / meta / JSON-LD lookups sliced out of the raw page text in one scan"""
+
+    def __init__(self, page_text: str):
+        self._body: Optional[Dict[str, str]] = None
+        self._metas: List[Dict[str, str]] = []
+        self._ld_json: List[str] = []
+        attr_parser = _AttrParser()
+        body_seen = False
+        for m in _TAG_SCAN_RE.finditer(page_text or ''):
+            if m.group(2) is not None:
+                # <script>: only JSON-LD blocks are of interest
+                if 'ld+json' in m.group(1):
+                    attrs = attr_parser.parse(f'<script{m.group(1)}>')
+                    if 'ld+json' in attrs.get('type', ''):
+                        self._ld_json.append(m.group(2))
+            elif m.group(3):
+                tag = m.group(3).lower()
+                attrs = attr_parser.parse(f'<{tag}{m.group(4)}>')
+                if tag == 'meta':
+                    self._metas.append(attrs)
+                elif not body_seen:
+                    body_seen = True
+                    self._body = attrs
+
+    def body_attrs(self) -> Optional[Dict[str, str]]:
+        return self._body
+
+    def meta(self, attr: str, value: str) -> Optional[Dict[str, str]]:
+        """Attributes of the first <meta> whose attr equals value"""
+        for attrs in self._metas:
+            if attrs.get(attr) == value:
+                return attrs
+        return None
+
+    def ld_json_texts(self) -> List[str]:
+        return self._ld_json
+
+
+class SoupPageView(_PageView):
+    """The same lookups answered from a BeautifulSoup tree"""
+
+    def __init__(self, soup):
+        self.soup = soup
+
+    def body_attrs(self) -> Optional[Dict[str, str]]:
+        body = self.soup.find('body')
+        return dict(body.attrs) if body is not None else None
+
+    def meta(self, attr: str, value: str) -> Optional[Dict[str, str]]:
+        tag = self.soup.find('meta', attrs={attr: value})
+        return dict(tag.attrs) if tag is not None else None
+
+    def ld_json_texts(self) -> List[str]:
+        return [s.string or s.get_text() for s in self.soup.find_all('script', type=lambda x: x and 'ld+json' in x)]
@@ -0,0 +1,132 @@
+"""
+Check and time the compiled category engine against the former if/elif chain.
+
+Titles come from a text file (one per line), a courses database, or are
+generated from the rule keywords:
+  python scripts/bench_category.py --titles titles.txt
+  python scripts/bench_category.py --db courses.db
+  python scripts/bench_category.py --generate 50000
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils  # noqa: F401  (import order: utils before scrapers)
+from scrapers.category_engine import CategoryEngine, classify_title
+
+
+def _legacy_category(title: str) -> str:
+    """BaseScraper._determine_category as it was before the engine"""
+    title_lower = title.lower()
+    if any(word in title_lower for word in ['crypto', 'cryptocurrency', 'bitcoin', 'blockchain', 'nft', 'defi', 'trading', 'forex', 'stock', 'investment', 'finance', 'airdrop', 'accounting', 'bookkeeping']):
+        return 'Finance & Accounting'
+    elif any(phrase in title_lower for phrase in ['design with', 'canva', 'graphic design', 'logo design', 'web design', 'ui design', 'ux design']) or \
+         (any(word in title_lower for word in ['design', 'photoshop', 'illustrator', 'figma', 'sketch']) and
+          not any(word in title_lower for word in ['machine learning', 'artificial intelligence', 'data science', 'ai'])):
+        return 'Design'
+    elif any(phrase in title_lower for phrase in ['machine learning', 'deep learning', 'data science', 'data analysis', 'data analytics', 'neural networks', 'tensorflow', 'pytorch', 'pandas', 'numpy']) or \
+         ('artificial intelligence' in title_lower and any(word in title_lower for word in ['python', 'programming', 'algorithm', 'model', 'training'])) or \
+         ('data science' in title_lower):
+        return 'Data Science'
+    elif any(word in title_lower for word in ['aws', 'amazon web services', 'azure', 'google cloud', 'serverless', 'docker', 'kubernetes', 'devops', 'cloud computing']) or \
+         any(word in title_lower for word in ['python', 'javascript', 'java', 'react', 'angular', 'node.js', 'html', 'css', 'sql', 'programming', 'coding', 'software development', 'web development', 'app development', 'full stack']):
+        return 'IT & Software'
+    elif any(phrase in title_lower for phrase in ['artificial intelligence', 'ai for']) or \
+         (any(word in title_lower for word in ['ai', 'chatgpt', 'openai']) and
+          not any(word in title_lower for word in ['programming', 'python', 'coding', 'development'])):
+        return 'Artificial Intelligence'
+    elif any(word in title_lower for word in ['marketing', 'seo', 'social media', 'advertising', 'digital marketing', 'affiliate marketing', 'email marketing', 'content marketing']):
+        return 'Marketing'
+    elif any(word in title_lower for word in ['business', 'management', 'entrepreneur', 'startup', 'leadership', 'project management', 'strategy']):
+        return 'Business'
+    elif any(word in title_lower for word in ['photography', 'video editing', 'filmmaking', 'camera', 'premiere', 'after effects', 'davinci']):
+        return 'Photography & Video'
+    elif any(word in title_lower for word in ['music', 'audio', 'sound design', 'mixing', 'ableton', 'logic pro']) or \
+         ('mastering' in title_lower and any(word in title_lower for word in ['audio', 'music', 'sound', 'track', 'song'])):
+        return 'Music'
+    elif any(word in title_lower for word in ['fitness', 'yoga', 'health', 'nutrition', 'workout', 'meditation', 'wellness']):
+        return 'Health & Fitness'
+    elif any(phrase in title_lower for phrase in ['personal development', 'self improvement', 'productivity', 'time management', 'communication skills', 'public speaking']):
+        return 'Personal Development'
+    elif any(word in title_lower for word in ['teaching', 'education', 'academic', 'research', 'study skills', 'exam prep']):
+        return 'Teaching & Academics'
+    elif any(word in title_lower for word in ['lifestyle', 'cooking', 'travel', 'hobby', 'crafts', 'gardening']):
+        return 'Lifestyle'
+    else:
+        return 'IT & Software'
+
+
+_FILLER = ['Complete', 'Masterclass', 'Beginners', 'Guide', '2025', 'Bootcamp', 'from Zero', 'to Hero', 'Course',
+           'the', 'Practical', 'Advanced', 'Hands-On', 'with', 'Projects', 'Certification', 'Maintain', 'Email',
+           'Soundtrack', 'Sketchbook', 'AIrdrop', 'Said', 'Javanese', 'Stockholm', 'Research-Based']
+
+
+def _generate(n: int, keywords, seed: int = 7):
+    rng = random.Random(seed)
+    words = sorted(keywords)
+    titles = []
+    for _ in range(n):
+        # Most real titles carry zero or one keyword
+        n_keywords = rng.choices((0, 1, 2, 3), weights=(3, 5, 2, 1))[0]
+        parts = rng.sample(_FILLER, rng.randint(2, 5)) + [rng.choice(words) for _ in range(n_keywords)]
+        rng.shuffle(parts)
+        title = ('\n' if rng.random() < 0.01 else ' ').join(parts)
+        titles.append(title.title() if rng.random() < 0.5 else title)
+    return titles
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--titles', help='Text file with one course title per line')
+    ap.add_argument('--db', help='SQLite database with a courses table')
+    ap.add_argument('--generate', type=int, default=0, help='Generate this many titles from the rule keywords')
+    ap.add_argument('--runs', type=int, default=3)
+    args = ap.parse_args()
+
+    engine = CategoryEngine()
+    titles = []
+    if args.titles:
+        with open(args.titles, 'r', encoding='utf-8') as f:
+            titles += [line.rstrip('\n') for line in f if line.strip()]
+    if args.db:
+        with sqlite3.connect(args.db) as conn:
+            titles += [row[0] for row in conn.execute('SELECT title FROM courses WHERE title IS NOT NULL')]
+    if args.generate or not titles:
+        titles += _generate(args.generate or 20000, engine.keywords)
+
+    differ = [t for t in titles if engine.classify(t) != _legacy_category(t)]
+    batch = engine.classify_many(titles)
+    differ += [t for t, c in zip(titles, batch) if c != _legacy_category(t)]
+
+    def timed(fn):
+        best = None
+        for _ in range(max(1, args.runs)):
+            t0 = time.perf_counter()
+            fn()
+            elapsed = time.perf_counter() - t0
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    results = [
+        ('if/elif chain', timed(lambda: [_legacy_category(t) for t in titles])),
+        ('classify', timed(lambda: [engine.classify(t) for t in titles])),
+        ('classify_many', timed(lambda: engine.classify_many(titles))),
+        ('classify_title', timed(lambda: [classify_title(t) for t in titles])),
+    ]
+    print(f'{len(titles)} titles ({len(set(titles))} distinct), {len(engine.keywords)} keywords')
+    for name, elapsed in results:
+        print(f'  {name:15s} {len(titles) / elapsed:12,.0f} titles/s')
+    print(f'  {len(differ)} results differ')
+    for t in differ[:10]:
+        print(f'    differs: {t!r}: engine {engine.classify(t)!r}, chain {_legacy_category(t)!r}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,204 @@
+"""
+Per-call latency of CourseDatabase methods: a fresh connection per call (as
+every method used to do) against the pooled connections.
+
+  python scripts/bench_db.py
+  python scripts/bench_db.py --courses 5000 --calls 2000 --threads 8
+
+A temporary database is filled with generated courses. Each operation is
+timed both ways; the pooled run then repeats the mix from several threads
+to check that concurrent readers and the writer do not fail. Finally a
+scrape result (half already stored with other metadata, some repeated) is
+stored with the former hash/course_exists/add_course loop and with
+store_batch, and the resulting tables are compared.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Config
+from utils.database import CourseDatabase
+
+
+class _PerCallDatabase:
+    """The former call pattern: connect, run one statement, drop the connection"""
+
+    def __init__(self, db_file: str):
+        self.db_file = db_file
+
+    def course_exists(self, course_hash):
+        with sqlite3.connect(self.db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1 FROM courses WHERE course_hash = ? AND is_active = TRUE', (course_hash,))
+            return cursor.fetchone() is not None
+
+    def get_kv(self, key, default=None):
+        with sqlite3.connect(self.db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT v FROM scrape_kv WHERE k = ?', (key,))
+            row = cursor.fetchone()
+            return row[0] if row and row[0] is not None else default
+
+    def set_progress_key(self, key, value):
+        with sqlite3.connect(self.db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                '''INSERT INTO scrape_kv (k, v, updated_at)
+                   VALUES (?, ?, CURRENT_TIMESTAMP)
+                   ON CONFLICT(k) DO UPDATE SET v = excluded.v, updated_at = CURRENT_TIMESTAMP''',
+                (key, str(int(value)))
+            )
+            conn.commit()
+            return True
+
+    def mark_course_posted(self, course_id):
+        with sqlite3.connect(self.db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute('UPDATE courses SET posted_to_channel = TRUE WHERE id = ?', (course_id,))
+            conn.commit()
+            return True
+
+    def get_statistics(self):
+        with sqlite3.connect(self.db_file) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*) FROM courses WHERE is_active = TRUE')
+            total = cursor.fetchone()[0]
+            cursor.execute('SELECT COUNT(*) FROM courses WHERE posted_to_channel = TRUE AND is_active = TRUE')
+            posted = cursor.fetchone()[0]
+            cursor.execute('SELECT COUNT(*) FROM courses WHERE posted_to_channel = FALSE AND is_active = TRUE')
+            pending = cursor.fetchone()[0]
+            cursor.execute('SELECT source_website, COUNT(*) FROM courses WHERE is_active = TRUE GROUP BY source_website')
+            return {'total_courses': total, 'posted_courses': posted, 'pending_courses': pending,
+                    'source_breakdown': dict(cursor.fetchall())}
+
+
+def _operations(db, hashes, n_courses):
+    return {
+        'course_exists': lambda i: db.course_exists(hashes[i % len(hashes)]),
+        'get_kv': lambda i: db.get_kv(f'bench:key:{i % 50}'),
+        'set_progress_key': lambda i: db.set_progress_key(f'bench:key:{i % 50}', i),
+        'mark_course_posted': lambda i: db.mark_course_posted(1 + i % n_courses),
+        'get_statistics': lambda i: db.get_statistics(),
+    }
+
+
+def _time_ops(ops, calls):
+    result = {}
+    for name, op in ops.items():
+        samples = []
+        for i in range(calls):
+            t0 = time.perf_counter()
+            op(i)
+            samples.append(time.perf_counter() - t0)
+        result[name] = statistics.median(samples)
+    return result
+
+
+def _store_loop(db, courses):
+    """The former per-course store loop in main.py"""
+    new_courses, duplicates = [], 0
+    for course in courses:
+        if db.course_exists(db.generate_course_hash(course)):
+            duplicates += 1
+            continue
+        if db.add_course(course):
+            new_courses.append(course)
+    return len(new_courses), duplicates
+
+
+def _table(db_file):
+    with sqlite3.connect(db_file) as conn:
+        cols = [r[1] for r in conn.execute('PRAGMA table_info(courses)') if r[1] not in ('id', 'scraped_at', 'expires_at')]
+        return sorted(conn.execute(f'SELECT {", ".join(cols)} FROM courses').fetchall(), key=repr)
+
+
+def _compare_store(workdir, courses, seeded):
+    results = {}
+    for name in ('loop', 'store_batch'):
+        db = CourseDatabase(os.path.join(workdir, f'store_{name}.db'))
+        db.store_batch(seeded)
+        t0 = time.perf_counter()
+        if name == 'loop':
+            counts = _store_loop(db, courses)
+        else:
+            stored = db.store_batch(courses)
+            counts = (stored['new'], stored['duplicates'])
+        elapsed = time.perf_counter() - t0
+        results[name] = (elapsed, counts, _table(db.db_file))
+        db.close()
+    (t_loop, c_loop, rows_loop), (t_batch, c_batch, rows_batch) = results['loop'], results['store_batch']
+    print(f'Storing {len(courses)} scraped courses ({len(seeded)} already stored):')
+    print(f'  per-course loop {t_loop * 1000:8.1f} ms  new/duplicates {c_loop}')
+    print(f'  store_batch     {t_batch * 1000:8.1f} ms  new/duplicates {c_batch}  ({t_loop / t_batch:.1f}x)')
+    print(f'  tables {"identical" if rows_loop == rows_batch else "DIFFER"}')
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--courses', type=int, default=2000)
+    ap.add_argument('--calls', type=int, default=500, help='Timed calls per operation')
+    ap.add_argument('--threads', type=int, default=4, help='Threads for the concurrent check')
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='bench_db_') as workdir:
+        db_file = os.path.join(workdir, 'bench.db')
+        Config.DB_POOL_ENABLED = True
+        db = CourseDatabase(db_file)
+        courses = [{
+            'title': f'Course {i}', 'course_url': f'https://www.udemy.com/course/course-{i}/?couponCode=X',
+            'instructor': 'Jane Roe', 'source_website': 'bench', 'rating': 4.5, 'students_count': i,
+        } for i in range(args.courses)]
+        for course in courses:
+            db.add_course(course)
+        hashes = [db.generate_course_hash(c) for c in courses]
+
+        per_call = _time_ops(_operations(_PerCallDatabase(db_file), hashes, args.courses), args.calls)
+        pooled = _time_ops(_operations(db, hashes, args.courses), args.calls)
+
+        print(f'{args.courses} courses, median of {args.calls} calls')
+        print(f'  {"operation":20s} {"per call":>10s} {"pooled":>10s}')
+        for name in per_call:
+            print(f'  {name:20s} {per_call[name] * 1e6:8.0f}us {pooled[name] * 1e6:8.0f}us'
+                  f'  ({per_call[name] / pooled[name]:.1f}x)')
+
+        errors = []
+        ops = _operations(db, hashes, args.courses)
+
+        def worker(offset):
+            try:
+                for i in range(args.calls):
+                    for op in ops.values():
+                        op(offset + i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(t * args.calls,)) for t in range(max(1, args.threads))]
+        t0 = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - t0
+        print(f'  {len(threads)} threads x {args.calls} mixed rounds: {elapsed:.2f}s, {len(errors)} errors, '
+              f'pool {db.pool.snapshot()}')
+        db.close()
+
+        # Re-scraped courses come back with different (synthesized) metadata; stored rows must not change
+        scraped = [dict(c, rating=3.9, students_count=1, instructor='Someone Else') for c in courses[:args.courses // 2]] + [
+            dict(c, course_url=c['course_url'].replace('course-', 'new-course-')) for c in courses[:args.courses // 2]
+        ]
+        scraped += scraped[:args.courses // 10]
+        _compare_store(workdir, scraped, courses[:args.courses // 2])
+
+
+if __name__ == '__main__':
+    main()
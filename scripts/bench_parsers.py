@@ -0,0 +1,191 @@
+"""
+Compare BeautifulSoup tree builders on saved pages: speed and extraction results.
+
+Pages come from saved HTML files/directories or from a fixture bundle, by
+default the saved pages under tests/fixtures/pages:
+  python scripts/bench_parsers.py
+  python scripts/bench_parsers.py pages/ listing.html
+  python scripts/bench_parsers.py --bundle fixtures/discudemy.jsonl.gz --runs 5
+
+For every installed backend the script times building the tree, then runs the
+listing-card, course-page (discBtn) and /go/ extraction plus Udemy metadata
+parsing and reports any page where a backend disagrees with html.parser.
+Listing pages are also run through the streaming card parser and compared
+(result, time, peak memory) with the tree-based extraction.
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import json
+import statistics
+import sys
+import os
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Config
+from utils.html_parser import FALLBACK_PARSER, available_parsers, make_soup, resolve_parser
+
+# Saved pages laid out by URL (host/path/name.html), so the source path tells the page kind
+FIXTURE_PAGES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'fixtures', 'pages')
+
+
+def _load_files(paths):
+    pages = []
+    for path in paths:
+        if os.path.isdir(path):
+            names = sorted(os.path.join(root, n) for root, _, files in os.walk(path)
+                           for n in files if n.endswith(('.html', '.htm')))
+        else:
+            names = [path]
+        for name in names:
+            with open(name, 'r', encoding='utf-8', errors='replace') as f:
+                pages.append((name, f.read()))
+    return pages
+
+
+def _load_bundle(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    pages = []
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            content_type = (entry.get('headers') or {}).get('Content-Type', '')
+            if 'html' not in content_type.lower():
+                continue
+            body = base64.b64decode(entry.get('body_b64') or '')
+            pages.append((entry['url'], body.decode('utf-8', errors='replace')))
+    return pages
+
+
+def _tree_listing_cards(soup):
+    """Tree-based listing extraction the streaming card parser replaced (reference result)"""
+    course_links = []
+    cards_root = soup.find('article', class_='ui four stackable cards') or soup
+    for card in cards_root.find_all('section', class_='card'):
+        label = card.find('label', class_='ui green disc-fee label')
+        if label and label.get_text(strip=True).lower() == 'ads':
+            continue
+        if card.find('ins', class_='adsbygoogle'):
+            continue
+        header_a = card.find('a', class_='card-header')
+        if not header_a or not header_a.get('href'):
+            continue
+        href = header_a['href']
+        if href.startswith('/'):
+            abs_href = 'https://www.discudemy.com' + href
+        elif href.startswith('http'):
+            abs_href = href
+        else:
+            continue
+        course_links.append((header_a.get_text(strip=True), abs_href))
+    return course_links
+
+
+def _extract(scraper, source, text):
+    """Everything the scrapers pull out of a page (with the currently configured parser)"""
+    soup = make_soup(text)
+    disc_btn = soup.find('a', class_='discBtn')
+    result = {
+        'cards': _tree_listing_cards(soup),
+        'disc_btn': disc_btn.get('href') if disc_btn else None,
+    }
+    if '/go/' in source:
+        result['go'] = scraper._extract_udemy_from_go_html(source, text)
+    if 'udemy.com' in source:
+        result['udemy_meta'] = scraper._parse_udemy_metadata(text, source)
+    return result
+
+
+def _use_parser(name):
+    Config.HTML_PARSER = name
+    resolve_parser.cache_clear()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('paths', nargs='*', help='Saved HTML files or directories of .html files (default: the test fixtures)')
+    ap.add_argument('--bundle', help='Fixture bundle (.jsonl or .jsonl.gz) recorded with HTTP_RECORD_BUNDLE')
+    ap.add_argument('--runs', type=int, default=3, help='Timed passes over all pages per parser')
+    args = ap.parse_args()
+
+    pages = _load_files(args.paths or ([] if args.bundle else [FIXTURE_PAGES]))
+    if args.bundle:
+        pages += _load_bundle(args.bundle)
+    if not pages:
+        print('No pages given (pass HTML files/directories or --bundle)')
+        return
+
+    with tempfile.TemporaryDirectory(prefix='bench_parsers_') as workdir:
+        Config.DATABASE_FILE = os.path.join(workdir, 'bench.db')
+        from scrapers.discudemy_scraper import DiscUdemyScraper
+        scraper = DiscUdemyScraper()
+
+        parsers = available_parsers()
+        total_kb = sum(len(text) for _, text in pages) / 1024
+        print(f'{len(pages)} pages ({total_kb:.0f} KiB), parsers: {", ".join(parsers)}')
+
+        baseline = {}
+        _use_parser(FALLBACK_PARSER)
+        for source, text in pages:
+            baseline[source] = _extract(scraper, source, text)
+
+        for name in parsers:
+            _use_parser(name)
+            timings = []
+            for _ in range(max(1, args.runs)):
+                t0 = time.perf_counter()
+                for _, text in pages:
+                    make_soup(text)
+                timings.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            mismatches = [source for source, text in pages if _extract(scraper, source, text) != baseline[source]]
+            extract_time = time.perf_counter() - t0
+            print(f'{name:12s} parse median {statistics.median(timings) * 1000:8.1f}ms, '
+                  f'parse+extract {extract_time * 1000:8.1f}ms, {len(mismatches)} pages differ')
+            for source in mismatches[:10]:
+                print(f'    differs: {source}')
+
+        # Listing pages: streaming card parser against the tree-based reference
+        listings = [(source, text) for source, text in pages if 'class="card"' in text or "class='card'" in text]
+        if listings:
+            _use_parser(resolve_parser('auto'))
+            timings = {'tree': [], 'stream': []}
+            for _ in range(max(1, args.runs)):
+                t0 = time.perf_counter()
+                for _, text in listings:
+                    _tree_listing_cards(make_soup(text))
+                timings['tree'].append(time.perf_counter() - t0)
+                t0 = time.perf_counter()
+                for _, text in listings:
+                    scraper._extract_listing_cards(text)
+                timings['stream'].append(time.perf_counter() - t0)
+            peaks = {}
+            for kind, fn in (('tree', lambda t: _tree_listing_cards(make_soup(t))),
+                             ('stream', scraper._extract_listing_cards)):
+                tracemalloc.start()
+                for _, text in listings:
+                    fn(text)
+                peaks[kind] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            differ = [source for source, text in listings
+                      if scraper._extract_listing_cards(text) != _tree_listing_cards(make_soup(text))]
+            print(f'{len(listings)} listing pages ({resolve_parser()} tree vs streaming cards):')
+            for kind in ('tree', 'stream'):
+                print(f'  {kind:6s} median {statistics.median(timings[kind]) * 1000:8.1f}ms, '
+                      f'peak {peaks[kind] / 1024:8.0f} KiB')
+            print(f'  {len(differ)} pages differ')
+            for source in differ[:10]:
+                print(f'    differs: {source}')
+        scraper.http.shutdown()
+
+
+if __name__ == '__main__':
+    main()
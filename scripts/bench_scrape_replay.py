@@ -0,0 +1,86 @@
+"""
+Benchmark a full DiscUdemy scrape offline against a recorded fixture bundle.
+
+Record once against the live sites, then replay as often as needed:
+  python scripts/bench_scrape_replay.py --bundle fixtures/discudemy.jsonl.gz --record --limit 20
+  python scripts/bench_scrape_replay.py --bundle fixtures/discudemy.jsonl.gz --runs 5 --latency 0.08
+
+Each replay run uses a fresh temporary database and no page cache, so runs are
+independent and repeatable.
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Config
+from utils.http_fixtures import ReplayAdapter
+
+
+def _fresh_scraper(workdir: str, run: int):
+    from scrapers.discudemy_scraper import DiscUdemyScraper
+    Config.DATABASE_FILE = os.path.join(workdir, f'bench_{run}.db')
+    return DiscUdemyScraper()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--bundle', required=True, help='Fixture bundle path (.jsonl or .jsonl.gz)')
+    ap.add_argument('--record', action='store_true', help='Scrape the live sites once and record the bundle')
+    ap.add_argument('--runs', type=int, default=3, help='Replay runs to time')
+    ap.add_argument('--limit', type=int, default=None, help='Courses per run (default MAX_COURSES_PER_RUN)')
+    ap.add_argument('--latency', type=float, default=0.0, help='Seconds of latency added to each replayed response')
+    ap.add_argument('--recorded-latency', action='store_true', help='Also replay the latency seen while recording')
+    ap.add_argument('--no-politeness', action='store_true', help='Disable per-host minimum request gaps')
+    args = ap.parse_args()
+
+    Config.UDEMY_CACHE_ENABLE = False
+    if args.no_politeness:
+        Config.HOST_MIN_INTERVALS = {}
+        Config.HOST_DEFAULT_MIN_INTERVAL = 0.0
+
+    with tempfile.TemporaryDirectory(prefix='bench_replay_') as workdir:
+        if args.record:
+            if os.path.exists(args.bundle):
+                os.remove(args.bundle)
+            Config.HTTP_RECORD_BUNDLE = args.bundle
+            Config.HTTP_REPLAY_BUNDLE = ''
+            scraper = _fresh_scraper(workdir, 0)
+            t0 = time.perf_counter()
+            courses = scraper.scrape_courses(args.limit)
+            print(f'Recorded {len(courses)} courses in {time.perf_counter() - t0:.2f}s -> {args.bundle}')
+            scraper.http.shutdown()
+            return
+
+        if not os.path.exists(args.bundle):
+            print(f'Bundle not found: {args.bundle} (record one with --record)')
+            return
+        Config.HTTP_RECORD_BUNDLE = ''
+        Config.HTTP_REPLAY_BUNDLE = args.bundle
+        Config.HTTP_REPLAY_LATENCY = args.latency
+        Config.HTTP_REPLAY_RECORDED_LATENCY = args.recorded_latency
+
+        timings = []
+        for run in range(1, max(1, args.runs) + 1):
+            scraper = _fresh_scraper(workdir, run)
+            t0 = time.perf_counter()
+            courses = scraper.scrape_courses(args.limit)
+            elapsed = time.perf_counter() - t0
+            timings.append(elapsed)
+            adapter = scraper.session.get_adapter('https://')
+            replay = adapter.get_stats() if isinstance(adapter, ReplayAdapter) else {}
+            print(f'run {run}: {elapsed:.3f}s, {len(courses)} courses, '
+                  f"{replay.get('hits', 0)} replayed, {replay.get('misses', 0)} missing from bundle")
+            scraper.http.shutdown()
+
+        print(f'median {statistics.median(timings):.3f}s, best {min(timings):.3f}s over {len(timings)} runs')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Check and time Udemy landing-page metadata extraction.
+
+  python scripts/bench_udemy_extract.py
+  python scripts/bench_udemy_extract.py pages/udemy/
+  python scripts/bench_udemy_extract.py --bundle fixtures/discudemy.jsonl.gz --runs 20
+
+1. The single-pass inline JSON extractor against the former per-field regex
+   searches, with an empty metadata dict and with each single field pre-filled
+   (as earlier extraction stages would leave it).
+2. _parse_udemy_metadata with the DOM-free fast path (UDEMY_META_FAST_PATH)
+   against the full BeautifulSoup path.
+Any difference is reported. Without arguments the saved landing pages under
+tests/fixtures/pages are used.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import sys
+import os
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Config
+import utils  # noqa: F401  (import order: utils before scrapers)
+from scrapers.udemy_page import _FIELDS, extract_inline_hints
+from scripts.bench_parsers import FIXTURE_PAGES, _load_bundle, _load_files
+
+
+def _legacy_inline_hints(page_text, meta):
+    """Section 3 of _parse_udemy_metadata as it was: one search per field over the page"""
+    mnext = re.search(r'<script id="__NEXT_DATA__" type="application/json">(\{.*?\})</script>', page_text, re.S)
+    if mnext:
+        page_text = mnext.group(1)
+    if 'image_url' not in meta:
+        m = re.search(r'"image_750x422"\s*:\s*"(https:[^"]+)"', page_text)
+        if m:
+            meta['image_url'] = m.group(1).replace('\\u002F', '/').replace('\\/', '/')
+    if 'subtitle' not in meta:
+        m = re.search(r'"headline"\s*:\s*"(.*?)"', page_text)
+        if m:
+            meta['subtitle'] = m.group(1).encode('utf-8', 'ignore').decode('unicode_escape')
+    if 'duration' not in meta:
+        m = re.search(r'"content_info_short"\s*:\s*"(.*?)"', page_text)
+        if m:
+            meta['duration'] = m.group(1)
+    if 'level' not in meta:
+        m = re.search(r'"instructional_level_simple"\s*:\s*"(.*?)"', page_text)
+        if m:
+            meta['level'] = m.group(1)
+    if 'lectures' not in meta:
+        m = re.search(r'"num_lectures"\s*:\s*(\d+)', page_text)
+        if m:
+            meta['lectures'] = int(m.group(1))
+    for field, primary, fallback in (('learn', 'what_you_will_learn_data', 'objectives'),
+                                     ('requirements', 'requirements_data', 'prerequisites'),
+                                     ('audience', 'target_audiences', 'targetAudiences')):
+        if field not in meta:
+            m = re.search(r'"%s"\s*:\s*\[(.*?)\]' % primary, page_text, re.S)
+            if m:
+                meta[field] = re.findall(r'"title"\s*:\s*"(.*?)"', m.group(1))
+        if field not in meta:
+            m = re.search(r'"%s"\s*:\s*\[(.*?)\]' % fallback, page_text, re.S)
+            if m:
+                meta[field] = re.findall(r'"([^"\\]*(?:\\.[^"\\]*)*)"', m.group(1))
+    if 'instructor' not in meta:
+        m = re.search(r'"visible_instructors"\s*:\s*\[(.*?)\]', page_text, re.S)
+        if m:
+            m2 = re.search(r'"title"\s*:\s*"([^"]+)"', m.group(1))
+            if m2:
+                meta['instructor'] = m2.group(1)
+    if 'category' not in meta:
+        m = re.search(r'"primary_category"\s*:\s*\{[^}]*"title"\s*:\s*"([^"]+)"', page_text)
+        if m:
+            meta['category'] = m.group(1)
+    if 'language' not in meta:
+        m = re.search(r'"locale"\s*:\s*\{[^}]*"(simple_english_title|title)"\s*:\s*"([^"]+)"', page_text)
+        if m:
+            meta['language'] = m.group(2)
+    if 'price' not in meta:
+        m = re.search(r'"price_text"\s*:\s*"([^"]+)"', page_text)
+        if m:
+            meta['price'] = m.group(1)
+    if 'currency' not in meta:
+        m = re.search(r'"currency"\s*:\s*"([A-Z]{3})"', page_text)
+        if m:
+            meta['currency'] = m.group(1)
+    if 'rating' not in meta:
+        m = re.search(r'"rating"\s*:\s*(\d+\.?\d*)', page_text)
+        if m:
+            meta['rating'] = float(m.group(1))
+    if 'students_count' not in meta:
+        m = re.search(r'"num_subscribers"\s*:\s*(\d+)', page_text)
+        if m:
+            meta['students_count'] = int(m.group(1))
+    return meta
+
+
+def _run(fn, text, prefill):
+    meta = dict(prefill)
+    try:
+        fn(text, meta)
+    except Exception as e:
+        meta['__error__'] = type(e).__name__
+    return meta
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('paths', nargs='*', help='Saved Udemy landing pages (files or directories; default: the test fixtures)')
+    ap.add_argument('--bundle', help='Fixture bundle; its udemy.com pages are used')
+    ap.add_argument('--runs', type=int, default=10, help='Timed passes over all pages')
+    args = ap.parse_args()
+
+    pages = _load_files(args.paths or ([] if args.bundle else [os.path.join(FIXTURE_PAGES, 'www.udemy.com')]))
+    if args.bundle:
+        pages += [(src, text) for src, text in _load_bundle(args.bundle) if 'udemy.com' in src]
+    if not pages:
+        print('No pages given (pass HTML files/directories or --bundle)')
+        return
+
+    prefills = [{}] + [{field: 'x'} for field, _ in _FIELDS]
+    differ = []
+    for source, text in pages:
+        for prefill in prefills:
+            if _run(extract_inline_hints, text, prefill) != _run(_legacy_inline_hints, text, prefill):
+                differ.append((source, sorted(prefill)))
+
+    timings = {'per-field': [], 'single-pass': []}
+    for _ in range(max(1, args.runs)):
+        for name, fn in (('per-field', _legacy_inline_hints), ('single-pass', extract_inline_hints)):
+            t0 = time.perf_counter()
+            for _, text in pages:
+                _run(fn, text, {})
+            timings[name].append(time.perf_counter() - t0)
+
+    kib = sum(len(t) for _, t in pages) / 1024
+    print(f'{len(pages)} pages ({kib:.0f} KiB), {len(prefills)} metadata states each')
+    for name, values in timings.items():
+        per_page = statistics.median(values) / len(pages) * 1000
+        print(f'  {name:12s} {per_page:8.3f} ms/page')
+    print(f'  speedup {statistics.median(timings["per-field"]) / statistics.median(timings["single-pass"]):.1f}x, '
+          f'{len(differ)} results differ')
+    for source, prefill in differ[:10]:
+        print(f'    differs: {source} (prefilled {prefill})')
+
+    with tempfile.TemporaryDirectory(prefix='bench_udemy_') as workdir:
+        Config.DATABASE_FILE = os.path.join(workdir, 'bench.db')
+        from scrapers.discudemy_scraper import DiscUdemyScraper
+        scraper = DiscUdemyScraper()
+
+        def parse_all(fast):
+            Config.UDEMY_META_FAST_PATH = fast
+            return [scraper._parse_udemy_metadata(text, source) for source, text in pages]
+
+        full, fast = parse_all(False), parse_all(True)
+        differ = [source for (source, _), a, b in zip(pages, full, fast) if a != b]
+        timings = {False: [], True: []}
+        for _ in range(max(1, args.runs)):
+            for mode in (False, True):
+                t0 = time.perf_counter()
+                parse_all(mode)
+                timings[mode].append(time.perf_counter() - t0)
+        scraper.http.shutdown()
+
+    print('_parse_udemy_metadata:')
+    for mode, label in ((False, 'DOM'), (True, 'fast path')):
+        print(f'  {label:12s} {statistics.median(timings[mode]) / len(pages) * 1000:8.3f} ms/page')
+    print(f'  speedup {statistics.median(timings[False]) / statistics.median(timings[True]):.1f}x, '
+          f'{len(differ)} pages differ')
+    for source in differ[:10]:
+        print(f'    differs: {source}')
+
+
+if __name__ == '__main__':
+    main()
@@ -2,11 +2,11 @@
 One-time metadata enrichment for existing DB courses.
 - Loads active, unposted courses
 - For each, fetches Udemy metadata via DiscUdemyScraper/BaseScraper helpers
-- Normalizes with BaseScraper._normalize_course_data
+- Normalizes with BaseScraper._normalize_course_data_many
 - Updates DB row with any newly available real fields
 
 Usage:
-  python scripts/enrich_db_metadata.py [--limit 100]
+  python scripts/enrich_db_metadata.py [--limit 100] [--batch-size 20] [--no-cache]
 """
 from __future__ import annotations
 
@@ -17,6 +17,7 @@ from pathlib import Path
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from config.settings import Config
 from utils.database import CourseDatabase
 from scrapers.discudemy_scraper import DiscUdemyScraper
 
@@ -24,7 +25,11 @@ from scrapers.discudemy_scraper import DiscUdemyScraper
 def main():
     ap = argparse.ArgumentParser()
     ap.add_argument('--limit', type=int, default=150, help='Max courses to attempt to enrich')
+    ap.add_argument('--batch-size', type=int, default=20, help='Courses fetched per batch')
+    ap.add_argument('--no-cache', action='store_true', help='Ignore cached Udemy pages and refetch (cache is still refreshed)')
     args = ap.parse_args()
+    if args.no_cache:
+        Config.UDEMY_CACHE_BYPASS = True
 
     db = CourseDatabase()
     scraper = DiscUdemyScraper()
@@ -38,30 +43,41 @@ def main():
         print('No pending courses found. Nothing to enrich.')
         return
 
+    # Fetch metadata in batches (API batch lookups / concurrent page fetches)
+    urls = [row.get('course_url') for row in pending]
+    valid_urls = [u for u in urls if u and 'udemy.com/course/' in u]
+    metas = {}
+    for i in range(0, len(valid_urls), args.batch_size):
+        chunk = valid_urls[i:i + args.batch_size]
+        metas.update(zip(chunk, scraper._fetch_udemy_metadata_many(chunk)))
+
     count = 0
     enriched = 0
+    bases = []
     for row in pending:
         count += 1
         url = row.get('course_url')
         if not url or 'udemy.com/course/' not in url:
             continue
+        meta = metas.get(url) or {}
+        if not meta:
+            continue
+        # Preserve existing minimal fields
+        base = {
+            'title': row.get('title'),
+            'course_url': url,
+            'discounted_price': 'Free',
+        }
+        # merge meta
+        for k in ['title','image_url','category','instructor','language','price','currency','rating','students_count']:
+            v = meta.get(k)
+            if v:
+                base[k] = v
+        bases.append(base)
+
+    # Normalize using scraper's normalization (handles image upgrade and language mapping)
+    for normalized in scraper._normalize_course_data_many(bases):
         try:
-            meta = scraper._fetch_udemy_metadata(url, referer=url) or {}
-            if not meta:
-                continue
-            # Preserve existing minimal fields
-            base = {
-                'title': row.get('title'),
-                'course_url': url,
-                'discounted_price': 'Free',
-            }
-            # merge meta
-            for k in ['title','image_url','category','instructor','language','price','currency','rating','students_count']:
-                v = meta.get(k)
-                if v:
-                    base[k] = v
-            # Normalize using scraper's normalization (handles image upgrade and language mapping)
-            normalized = scraper._normalize_course_data(base)
             # Push to DB (will update existing row via hash)
             db.enrich_with(normalized)
             enriched += 1
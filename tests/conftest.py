@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import utils  # noqa: F401,E402  (import order: utils before scrapers)
+from config.settings import Config  # noqa: E402
+
+
+@pytest.fixture
+def db_file(tmp_path, monkeypatch):
+    path = str(tmp_path / 'courses.db')
+    monkeypatch.setattr(Config, 'DATABASE_FILE', path)
+    return path
+
+
+@pytest.fixture
+def scraper(db_file, tmp_path, monkeypatch):
+    """DiscUdemyScraper on a temporary database and cache, no network"""
+    monkeypatch.setattr(Config, 'DIAG_DIR', str(tmp_path / 'diag'), raising=False)
+    from scrapers.discudemy_scraper import DiscUdemyScraper
+    s = DiscUdemyScraper()
+    yield s
+    s.http.shutdown()
+    s.close()
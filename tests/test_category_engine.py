@@ -0,0 +1,17 @@
+from scripts.bench_category import _generate, _legacy_category
+from scrapers.category_engine import CategoryEngine, classify_title
+
+_TITLES = [
+    'Bitcoin Trading for Beginners', 'Canva Design with AI', 'Machine Learning A-Z', 'Python for Data Science',
+    'ChatGPT Prompting Masterclass', 'AI for Business Leaders', 'Audio Mastering for Music Producers',
+    'Mastering Excel', 'Said the Javanese Stockholm Research-Based Guide', 'Multi-line\nJava Title', '',
+]
+
+
+def test_engine_matches_the_former_chain():
+    engine = CategoryEngine()
+    titles = _TITLES + _generate(3000, engine.keywords)
+    expected = [_legacy_category(t) for t in titles]
+    assert [engine.classify(t) for t in titles] == expected
+    assert engine.classify_many(titles) == expected
+    assert [classify_title(t) for t in titles] == expected
@@ -0,0 +1,111 @@
+import pytest
+import requests
+
+from scrapers.base_scraper import PLAIN
+from utils.retry_policy import CircuitBreaker, CircuitOpenError
+
+
+def _open(breaker, host='h'):
+    for _ in range(breaker.threshold):
+        breaker.record_failure(host)
+
+
+def test_opens_after_threshold_consecutive_failures():
+    breaker = CircuitBreaker(threshold=3, cooldown=60)
+    breaker.record_failure('h')
+    breaker.record_failure('h')
+    breaker.record_success('h')
+    breaker.record_failure('h')
+    breaker.record_failure('h')
+    assert breaker.state('h') == CircuitBreaker.CLOSED
+    breaker.record_failure('h')
+    assert breaker.state('h') == CircuitBreaker.OPEN
+    assert not breaker.allow('h')
+
+
+def test_half_open_allows_a_single_probe():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    _open(breaker)
+    assert breaker.allow('h')
+    assert breaker.state('h') == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow('h')
+
+
+def test_probe_success_closes_and_failure_reopens():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    _open(breaker)
+    assert breaker.allow('h')
+    breaker.record_failure('h')
+    assert breaker.state('h') == CircuitBreaker.OPEN
+    assert breaker.snapshot()['h']['trips'] == 2
+    assert breaker.allow('h')
+    breaker.record_success('h')
+    assert breaker.state('h') == CircuitBreaker.CLOSED
+    assert breaker.allow('h') and breaker.allow('h')
+
+
+def test_released_probe_can_be_taken_again():
+    breaker = CircuitBreaker(threshold=1, cooldown=0)
+    _open(breaker)
+    assert breaker.allow('h')
+    breaker.release_probe('h')
+    assert breaker.state('h') == CircuitBreaker.HALF_OPEN
+    assert breaker.allow('h')
+
+
+class _RaisingSession:
+    def __init__(self, exc):
+        self.exc = exc
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        raise self.exc
+
+
+class _ProxyPool:
+    def __init__(self):
+        self.in_flight = 0
+
+    def acquire(self, host):
+        self.in_flight += 1
+        return 'http://proxy:1'
+
+    def release(self, proxy, ok, elapsed=None):
+        self.in_flight -= 1
+
+    def snapshot(self):
+        return []
+
+
+def _half_open_scraper(scraper, monkeypatch, exc):
+    scraper.breaker = CircuitBreaker(threshold=1, cooldown=0)
+    scraper.breaker.record_failure('example.com')
+    scraper.proxy_pool = _ProxyPool()
+    session = _RaisingSession(exc)
+    monkeypatch.setattr(scraper.transport, 'session_for', lambda host: (session, PLAIN))
+    monkeypatch.setattr(scraper.scheduler, 'acquire', lambda host: None)
+    return session
+
+
+def test_proxy_error_on_probe_does_not_wedge_the_host(scraper, monkeypatch):
+    session = _half_open_scraper(scraper, monkeypatch, requests.exceptions.ProxyError('dead proxy'))
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.ProxyError):
+            scraper._send('https://example.com/x')
+    # Every request was let through as a probe and none counted against the host
+    assert session.calls == 3
+    assert scraper.breaker.state('example.com') == CircuitBreaker.HALF_OPEN
+    assert scraper.breaker.snapshot()['example.com']['trips'] == 1
+    assert scraper.proxy_pool.in_flight == 0
+
+
+def test_non_requests_error_reopens_and_releases_proxy(scraper, monkeypatch):
+    _half_open_scraper(scraper, monkeypatch, RuntimeError('CloudflareChallengeError'))
+    with pytest.raises(RuntimeError):
+        scraper._send('https://example.com/x')
+    assert scraper.breaker.state('example.com') == CircuitBreaker.OPEN
+    assert scraper.proxy_pool.in_flight == 0
+    scraper.breaker.cooldown = 60
+    with pytest.raises(CircuitOpenError):
+        scraper._send('https://example.com/x')
@@ -0,0 +1,14 @@
+import os
+
+from utils.database import CourseDatabase
+from utils.db_pool import pool_for
+
+
+def test_instances_on_one_file_share_the_writer(db_file, tmp_path):
+    first = CourseDatabase(db_file)
+    second = CourseDatabase(os.path.join(os.path.dirname(db_file), '.', os.path.basename(db_file)))
+    assert first.pool is second.pool is pool_for(db_file)
+    other = CourseDatabase(str(tmp_path / 'other.db'))
+    assert other.pool is not first.pool
+    first.close()
+    other.close()
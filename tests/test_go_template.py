@@ -0,0 +1,74 @@
+import pytest
+
+from config.settings import Config
+from scrapers.discudemy_scraper import GoTemplate, _go_template
+
+COURSE = 'https://www.discudemy.com/english/python-basics'
+TEMPLATE = 'https://www.discudemy.com/go/{slug}'
+
+
+def _trusted(confirmations=3):
+    template = GoTemplate(confirmations)
+    for _ in range(confirmations):
+        template.observe(TEMPLATE)
+    return template
+
+
+def test_template_from_course_and_go_urls():
+    assert _go_template(COURSE, 'https://www.discudemy.com/go/python-basics') == TEMPLATE
+    assert _go_template(COURSE, 'https://www.discudemy.com/go/other') is None
+
+
+def test_trusted_only_after_enough_agreeing_observations():
+    template = GoTemplate(3)
+    template.observe(TEMPLATE)
+    template.observe(TEMPLATE)
+    assert template.derive(COURSE) is None
+    template.observe(TEMPLATE)
+    assert template.derive(COURSE) == 'https://www.discudemy.com/go/python-basics'
+    assert template.snapshot()['trusted']
+
+
+def test_disagreeing_observation_restarts_confirmation():
+    template = _trusted()
+    template.observe('https://www.discudemy.com/out/{slug}')
+    assert template.derive(COURSE) is None
+    assert template.export() == {'template': 'https://www.discudemy.com/out/{slug}', 'confirmed': 1}
+    template.observe(None)
+    assert template.export() == {'template': None, 'confirmed': 0}
+
+
+def test_miss_withdraws_trust_until_reconfirmed():
+    template = _trusted()
+    template.record(True)
+    assert template.derive(COURSE)
+    template.record(False)
+    assert template.derive(COURSE) is None
+    assert template.snapshot()['derived_misses'] == 1
+    for _ in range(3):
+        template.observe(TEMPLATE)
+    assert template.derive(COURSE)
+
+
+def test_export_load_round_trip():
+    restored = GoTemplate(3)
+    restored.load(_trusted().export())
+    assert restored.derive(COURSE)
+    restored.load({'template': None})
+    assert restored.derive(COURSE)
+
+
+@pytest.mark.parametrize('derived', [None, 'https://www.udemy.com/course/python-basics/'])
+def test_failed_derived_url_falls_back_to_course_page(scraper, monkeypatch, derived):
+    monkeypatch.setattr(Config, 'DISCUDEMY_GO_TEMPLATE', True, raising=False)
+    scraper.go_template = _trusted()
+    monkeypatch.setattr(scraper, '_extract_udemy_from_go_page', lambda url: derived)
+    monkeypatch.setattr(scraper, '_extract_real_udemy_url',
+                        lambda url: 'https://www.udemy.com/course/python-basics/?couponCode=X')
+    monkeypatch.setattr(scraper, '_fetch_udemy_metadata', lambda url, referer=None: {})
+
+    result = scraper._resolve_card('Python Basics', COURSE)
+
+    assert result['status'] == 'ok'
+    assert result['course_data']['course_url'] == 'https://www.udemy.com/course/python-basics/?couponCode=X'
+    assert scraper.go_template.derive(COURSE) is None
@@ -0,0 +1,91 @@
+"""Current page extractors against the code they replaced, on the saved pages in tests/fixtures/pages"""
+import os
+
+import pytest
+
+from config.settings import Config
+from scripts.bench_parsers import FIXTURE_PAGES, _extract, _load_files, _tree_listing_cards
+from scripts.bench_udemy_extract import _legacy_inline_hints, _run
+from bs4 import BeautifulSoup
+
+from scrapers.udemy_page import _FIELDS, RawPageView, extract_inline_hints, html_text
+from utils.html_parser import FALLBACK_PARSER, available_parsers, make_soup, resolve_parser
+
+PAGES = _load_files([FIXTURE_PAGES])
+LANDING = [(s, t) for s, t in PAGES if f'{os.sep}www.udemy.com{os.sep}' in s]
+LISTINGS = [(s, t) for s, t in PAGES if f'{os.sep}all{os.sep}' in s]
+
+
+def _name(page):
+    return os.path.relpath(page[0], FIXTURE_PAGES)
+
+
+@pytest.fixture
+def parser(monkeypatch):
+    def use(name):
+        monkeypatch.setattr(Config, 'HTML_PARSER', name, raising=False)
+        resolve_parser.cache_clear()
+    yield use
+    resolve_parser.cache_clear()
+
+
+def test_fixture_pages_present():
+    assert len(LANDING) >= 10 and len(LISTINGS) >= 2
+
+
+@pytest.mark.parametrize('page', LANDING, ids=_name)
+def test_inline_hints_match_per_field_regexes(page):
+    _, text = page
+    for prefill in [{}] + [{field: 'x'} for field, _ in _FIELDS]:
+        # Both raise on the same broken escapes (the caller catches it): compare the error type then
+        assert _run(extract_inline_hints, text, prefill) == _run(_legacy_inline_hints, text, prefill)
+
+
+@pytest.mark.parametrize('page', LANDING, ids=_name)
+def test_metadata_fast_path_matches_soup_path(scraper, monkeypatch, page):
+    source, text = page
+    monkeypatch.setattr(Config, 'UDEMY_META_FAST_PATH', False, raising=False)
+    full = scraper._parse_udemy_metadata(text, source)
+    monkeypatch.setattr(Config, 'UDEMY_META_FAST_PATH', True, raising=False)
+    assert scraper._parse_udemy_metadata(text, source) == full
+
+
+_FRAGMENTS = [
+    '<p>Intro <b>bold</b></p><ul><li>x</li></ul>', 'a<!--c-->b &amp; &nbsp;c', '<script>x=1</script><style>p{}</style>t',
+    '<p>x</p>\n\n<p>y</p>', '  <p> a </p>  ', '<pre>\n\n</pre>', '<br>a<br/>b', '<![CDATA[z]]>q', 'a < b',
+    '<p>unclosed <i>x', '&lt;p&gt; &#233; &eacute &copy2026 &#150; &#x80; &#x81; &#0; &#99999999;', 'a &unknown; b',
+    '<!DOCTYPE html><p>a</p><?php x ?>b', '<p title="a>b">q</p>', 'x</p>y', '',
+]
+
+
+def _descriptions():
+    found = []
+    for _, text in LANDING:
+        args = RawPageView(text).module_args()
+        if isinstance(args, dict):
+            course = args.get('course') or (args.get('serverSideProps') or {}).get('course') or {}
+            if isinstance(course, dict) and course.get('description'):
+                found.append(course['description'])
+    return found
+
+
+@pytest.mark.parametrize('fragment', _FRAGMENTS + _descriptions())
+def test_html_text_matches_get_text(fragment):
+    assert html_text(fragment, '\n') == BeautifulSoup(fragment, 'html.parser').get_text('\n')
+
+
+@pytest.mark.parametrize('page', LISTINGS, ids=_name)
+def test_listing_cards_match_tree_lookups(scraper, parser, page):
+    _, text = page
+    parser('auto')
+    cards = scraper._extract_listing_cards(text)
+    assert cards
+    assert cards == _tree_listing_cards(make_soup(text))
+
+
+@pytest.mark.parametrize('name', [p for p in available_parsers() if p != FALLBACK_PARSER])
+def test_parser_backends_agree_with_html_parser(scraper, parser, name):
+    parser(FALLBACK_PARSER)
+    baseline = [_extract(scraper, source, text) for source, text in PAGES]
+    parser(name)
+    assert [_extract(scraper, source, text) for source, text in PAGES] == baseline
@@ -0,0 +1,82 @@
+import json
+from types import SimpleNamespace
+
+from config.settings import Config
+
+
+def _fake_site(scraper, monkeypatch, cards_per_page=5, unresolved=()):
+    fetched = []
+
+    def fetch(page_url):
+        fetched.append(page_url)
+        return SimpleNamespace(text=page_url), False, {'etag': f'"{page_url}"', 'last_modified': None, 'digest': 'd'}
+
+    def cards(page_text):
+        return [(f'Course {i}', f'{page_text}/c{i}') for i in range(cards_per_page)]
+
+    def resolve(title, href):
+        if href in unresolved:
+            return {'status': 'no_real_url'}
+        slug = href.rsplit('/', 2)[-2] + '-' + href.rsplit('/', 1)[-1]
+        return {'status': 'ok', 'course_data': {
+            'title': title, 'course_url': f'https://www.udemy.com/course/{slug}/?couponCode=X'}}
+
+    monkeypatch.setattr(scraper, '_fetch_listing_page', fetch)
+    monkeypatch.setattr(scraper, '_extract_listing_cards', cards)
+    monkeypatch.setattr(scraper, '_resolve_card', resolve)
+    return fetched
+
+
+def test_quota_met_on_first_page_fetches_at_most_one_more(scraper, monkeypatch):
+    monkeypatch.setattr(Config, 'DISCUDEMY_FRESH_PAGES', 10)
+    monkeypatch.setattr(Config, 'DISCUDEMY_FRESH_SLICE', 5)
+    monkeypatch.setattr(Config, 'FINISH_PAGE_OVERFLOW', 0, raising=False)
+    fetched = _fake_site(scraper, monkeypatch)
+
+    courses = scraper.scrape_courses(limit=5)
+
+    assert len(courses) == 5
+    assert fetched[0] == 'https://www.discudemy.com/all'
+    assert len(fetched) <= 2
+
+
+def test_pages_are_consumed_in_order(scraper, monkeypatch):
+    monkeypatch.setattr(Config, 'DISCUDEMY_FRESH_PAGES', 10)
+    monkeypatch.setattr(Config, 'DISCUDEMY_FRESH_SLICE', 3)
+    monkeypatch.setattr(Config, 'FINISH_PAGE_OVERFLOW', 0, raising=False)
+    fetched = _fake_site(scraper, monkeypatch, cards_per_page=2)
+
+    courses = scraper.scrape_courses(limit=50)
+
+    assert len(set(fetched)) == len(fetched)
+    assert len(fetched) == 4
+    assert [c['title'] for c in courses] == ['Course 0', 'Course 1'] * 4
+
+
+def _saved_validators(scraper, page_url):
+    return scraper._db.get_kv(scraper._listing_kv_key(page_url))
+
+
+def test_validators_are_saved_only_when_committed(scraper, monkeypatch):
+    monkeypatch.setattr(Config, 'DISCUDEMY_FRESH_PAGES', 1)
+    _fake_site(scraper, monkeypatch, cards_per_page=2)
+    page = 'https://www.discudemy.com/all'
+
+    scraper.scrape_courses(limit=50)
+    assert _saved_validators(scraper, page) is None
+
+    assert scraper.commit_listing_validators() == 1
+    assert json.loads(_saved_validators(scraper, page))['etag'] == f'"{page}"'
+    assert scraper.commit_listing_validators() == 0
+
+
+def test_page_with_unresolved_card_keeps_no_validators(scraper, monkeypatch):
+    monkeypatch.setattr(Config, 'DISCUDEMY_FRESH_PAGES', 1)
+    page = 'https://www.discudemy.com/all'
+    _fake_site(scraper, monkeypatch, cards_per_page=3, unresolved={f'{page}/c1'})
+
+    courses = scraper.scrape_courses(limit=50)
+
+    assert len(courses) == 2
+    assert scraper.commit_listing_validators() == 0
+    assert _saved_validators(scraper, page) is None
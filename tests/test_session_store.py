@@ -0,0 +1,37 @@
+import os
+import stat
+import threading
+
+import requests
+
+from utils.session_store import SessionStore
+
+
+def _session(value):
+    session = requests.Session()
+    session.cookies.set('sid', value, domain='example.com')
+    return session
+
+
+def test_saved_file_is_owner_only(tmp_path):
+    store = SessionStore(str(tmp_path / 'sessions.json'))
+    store.save('a:plain', _session('1'), 'UA')
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+    assert os.listdir(tmp_path) == ['sessions.json']
+
+
+def test_concurrent_saves_from_two_stores_do_not_collide(tmp_path, caplog):
+    path = str(tmp_path / 'sessions.json')
+    stores = [SessionStore(path), SessionStore(path)]
+
+    def save(store, key):
+        for i in range(200):
+            store.save(key, _session(str(i)), 'UA')
+
+    threads = [threading.Thread(target=save, args=(s, f'k{i}:plain')) for i, s in enumerate(stores)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert 'Could not save' not in caplog.text
+    assert os.listdir(tmp_path) == ['sessions.json']
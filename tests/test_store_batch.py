@@ -0,0 +1,69 @@
+import sqlite3
+
+from utils.database import CourseDatabase
+
+
+def _course(i, **extra):
+    return dict({
+        'title': f'Course {i}', 'course_url': f'https://www.udemy.com/course/course-{i}/?couponCode=X',
+        'instructor': 'Jane Roe', 'source_website': 'test', 'rating': 4.5, 'students_count': 100 + i,
+    }, **extra)
+
+
+def _rows(db):
+    with sqlite3.connect(db.db_file) as conn:
+        return sorted(conn.execute('SELECT course_hash, title, instructor, rating, students_count FROM courses'))
+
+
+def test_new_courses_are_stored_and_returned(db_file):
+    db = CourseDatabase(db_file)
+    stored = db.store_batch([_course(1), _course(2)])
+    assert stored['new'] == 2
+    assert stored['duplicates'] == 0
+    assert [c['title'] for c in stored['new_courses']] == ['Course 1', 'Course 2']
+    assert len(_rows(db)) == 2
+    db.close()
+
+
+def test_duplicates_are_skipped_and_stored_rows_left_alone(db_file):
+    db = CourseDatabase(db_file)
+    db.store_batch([_course(1), _course(2)])
+    before = _rows(db)
+
+    rescraped = [_course(1, rating=3.9, students_count=7, instructor='Someone Else'), _course(3)]
+    stored = db.store_batch(rescraped)
+
+    assert stored['new'] == 1
+    assert stored['duplicates'] == 1
+    assert [c['title'] for c in stored['new_courses']] == ['Course 3']
+    after = _rows(db)
+    assert [r for r in after if r[1] != 'Course 3'] == before
+    db.close()
+
+
+def test_repeat_within_batch_counts_as_duplicate(db_file):
+    db = CourseDatabase(db_file)
+    stored = db.store_batch([_course(1), _course(1, rating=3.0), _course(2)])
+    assert stored['new'] == 2
+    assert stored['duplicates'] == 1
+    assert [r[3] for r in _rows(db) if r[1] == 'Course 1'] == [4.5]
+    db.close()
+
+
+def test_matches_the_per_course_loop(db_file, tmp_path):
+    seeded = [_course(i) for i in range(5)]
+    scraped = [_course(i, rating=3.9) for i in range(3)] + [_course(i) for i in range(5, 8)]
+
+    loop_db = CourseDatabase(str(tmp_path / 'loop.db'))
+    loop_db.store_batch(seeded)
+    for course in scraped:
+        if not loop_db.course_exists(loop_db.generate_course_hash(course)):
+            loop_db.add_course(course)
+
+    batch_db = CourseDatabase(db_file)
+    batch_db.store_batch(seeded)
+    batch_db.store_batch(scraped)
+
+    assert _rows(batch_db) == _rows(loop_db)
+    loop_db.close()
+    batch_db.close()
@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+from scrapers.discudemy_scraper import _URL_STRATEGIES, _URL_STRATEGY_TIERS
+from utils.strategy_stats import StrategyStats
+
+
+def _simulate(stats, pages, hits, hit_cost=0.6, miss_cost=0.0002):
+    for _ in range(pages):
+        for name in stats.order():
+            if name in hits:
+                stats.record(name, True, hit_cost)
+                break
+            stats.record(name, False, miss_cost)
+
+
+def test_declared_order_without_data():
+    stats = StrategyStats(['a', 'b', 'c'])
+    assert stats.order() == ['a', 'b', 'c']
+
+
+def test_cheap_strategies_that_never_hit_do_not_outrank_the_one_that_does():
+    stats = StrategyStats(_URL_STRATEGIES, tiers=_URL_STRATEGY_TIERS)
+    _simulate(stats, 300, hits={'disc_btn'})
+    order = stats.order()
+    assert order[0] == 'disc_btn'
+
+
+def test_cheap_strategy_that_hits_moves_first():
+    stats = StrategyStats(['slow', 'fast'])
+    for _ in range(20):
+        stats.record('slow', True, 0.6)
+        stats.record('fast', True, 0.001)
+    assert stats.order() == ['fast', 'slow']
+
+
+def test_loose_tier_stays_behind_strict_tier():
+    stats = StrategyStats(_URL_STRATEGIES, tiers=_URL_STRATEGY_TIERS)
+    for _ in range(100):
+        stats.record('form', True, 0.0001)
+        stats.record('disc_btn', False, 0.6)
+    order = stats.order()
+    loose = [n for n in order if _URL_STRATEGY_TIERS.get(n)]
+    assert sorted(loose) == sorted(_URL_STRATEGY_TIERS)
+    assert order[-len(loose):] == loose
+    assert loose[0] == 'form'
+
+
+def test_export_load_round_trip_and_decay():
+    stats = StrategyStats(['a', 'b'], decay_at=10)
+    for _ in range(10):
+        stats.record('a', True, 0.25)
+    assert stats.export()['a'] == {'attempts': 5.0, 'hits': 5.0, 'cost': 1.25}
+    restored = StrategyStats(['a', 'b'])
+    restored.load(dict(stats.export(), unknown={'attempts': 3}))
+    assert restored.export() == stats.export()
+
+
+def test_result_without_coupon_falls_through(scraper, monkeypatch):
+    page = '''<html><head><meta http-equiv="refresh" content="0; url=https://www.udemy.com/"></head>
+    <body><a href="https://www.udemy.com/course/python-x/?couponCode=FREE1">Python</a></body></html>'''
+    monkeypatch.setattr(scraper, '_make_request', lambda url, **kw: SimpleNamespace(text=page))
+    for _ in range(50):
+        scraper.url_strategies.record('meta_refresh', True, 0.0001)
+    assert scraper.url_strategies.order()[0] == 'meta_refresh'
+
+    url = scraper._scan_course_page('https://www.discudemy.com/python/python-x')
+
+    assert url == 'https://www.udemy.com/course/python-x/?couponCode=FREE1'
+    assert scraper.url_strategies.export()['meta_refresh']['attempts'] == 51
+    assert scraper.url_strategies.export()['meta_refresh']['hits'] == 50
+    assert scraper.url_strategies.export()['direct_link']['hits'] == 1
@@ -0,0 +1,73 @@
+import pytest
+
+from scrapers.udemy_api import UdemyApiBackend
+
+
+def _course(course_id):
+    return {'id': course_id, 'title': f'Course {course_id}', 'headline': 'H', 'avg_rating': 4.5}
+
+
+@pytest.fixture
+def backend():
+    return UdemyApiBackend(scraper=None, db=object())
+
+
+def _reply(backend, monkeypatch, data):
+    monkeypatch.setattr(backend, '_get_json', lambda url, referer: data)
+
+
+def test_full_reply_marks_batching_supported(backend, monkeypatch):
+    _reply(backend, monkeypatch, {'results': [_course(1), _course(2)]})
+    assert set(backend._fetch_batch([1, 2], 'r')) == {1, 2}
+    assert backend._batch_supported is True
+
+
+def test_missing_course_keeps_batching(backend, monkeypatch):
+    _reply(backend, monkeypatch, {'results': [_course(1), _course(2)]})
+    assert set(backend._fetch_batch([1, 2, 3], 'r')) == {1, 2}
+    assert backend._batch_supported is True
+
+
+@pytest.mark.parametrize('data', [None, 'not json object'])
+def test_failed_request_is_not_a_verdict(backend, monkeypatch, data):
+    _reply(backend, monkeypatch, data)
+    assert backend._fetch_batch([1, 2], 'r') == {}
+    assert backend._batch_supported is None
+
+
+def test_unrequested_courses_disable_batching(backend, monkeypatch):
+    _reply(backend, monkeypatch, {'results': [_course(1), _course(99)]})
+    assert set(backend._fetch_batch([1, 2], 'r')) == {1}
+    assert backend._batch_supported is False
+
+
+def test_none_of_the_requested_courses_disables_batching(backend, monkeypatch):
+    _reply(backend, monkeypatch, {'results': []})
+    assert backend._fetch_batch([1, 2], 'r') == {}
+    assert backend._batch_supported is False
+
+
+class _KV(dict):
+    def get_kv(self, key):
+        return self.get(key)
+
+    def set_kv(self, key, value):
+        self[key] = value
+
+
+def test_first_fetch_gets_id_and_metadata_in_one_request(monkeypatch):
+    backend = UdemyApiBackend(scraper=None, db=_KV())
+    urls = []
+
+    def get_json(url, referer):
+        urls.append(url)
+        return _course(42)
+
+    monkeypatch.setattr(backend, '_get_json', get_json)
+    url = 'https://www.udemy.com/course/python-basics/?couponCode=X'
+    assert backend.fetch(url)['title'] == 'Course 42'
+    assert len(urls) == 1 and '/courses/python-basics/' in urls[0]
+    assert backend.db == {'udemy:course_id:python-basics': '42'}
+
+    backend.fetch(url)
+    assert len(urls) == 2 and '/courses/42/' in urls[1]
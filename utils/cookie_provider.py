@@ -0,0 +1,115 @@
+"""
+Cookie jar provider for Udemy requests.
+
+Parses the exported cookie file (JSON array or Netscape cookies.txt) once,
+re-reads it only when its mtime/size changes, and applies cookies to a
+session only when the parsed jar is newer than what the session already has.
+"""
+import json
+import os
+import threading
+import logging
+import weakref
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+def parse_cookie_file(path: str) -> List[Dict]:
+    """Read cookies from a JSON array export or a Netscape cookies.txt file"""
+    cookies: List[Dict] = []
+    if not path:
+        return cookies
+    p = Path(path)
+    if not p.exists():
+        return cookies
+    try:
+        text = p.read_text(encoding='utf-8')
+    except Exception:
+        return cookies
+    try:
+        data = json.loads(text)
+        if isinstance(data, list):
+            return data
+    except Exception:
+        pass
+    # try netscape format
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        parts = line.split('\t')
+        if len(parts) >= 7:
+            cookies.append({
+                'domain': parts[0],
+                'path': parts[2],
+                'secure': parts[3].upper() == 'TRUE',
+                'name': parts[5],
+                'value': parts[6]
+            })
+    return cookies
+
+
+class CookieProvider:
+    """Caches the parsed cookie file and tracks which sessions are up to date"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path if path is not None else getattr(Config, 'UDEMY_COOKIES_FILE', '')
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[float, int]] = None
+        self._cookies: List[Dict] = []
+        self.version = 0
+        self.reloads = 0
+        self.applies = 0
+        self._applied: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+    def _file_signature(self) -> Optional[Tuple[float, int]]:
+        try:
+            st = os.stat(self.path)
+            return (st.st_mtime, st.st_size)
+        except OSError:
+            return None
+
+    def cookies(self) -> List[Dict]:
+        """Current cookies, re-parsing the file only if it changed on disk"""
+        if not self.path:
+            return []
+        sig = self._file_signature()
+        with self._lock:
+            if sig != self._signature:
+                self._cookies = parse_cookie_file(self.path) if sig else []
+                self._signature = sig
+                self.version += 1
+                self.reloads += 1
+                logger.debug(f"Loaded {len(self._cookies)} cookies from {self.path}")
+            return self._cookies
+
+    def apply(self, session) -> bool:
+        """Set the cookies on session unless it already has the current version.
+        Returns True when cookies were (re)applied."""
+        cookies = self.cookies()
+        with self._lock:
+            version = self.version
+            if not cookies or self._applied.get(session) == version:
+                return False
+            for c in cookies:
+                try:
+                    session.cookies.set(c.get('name'), c.get('value'),
+                                        domain=c.get('domain', '.udemy.com'), path=c.get('path', '/'))
+                except Exception:
+                    continue
+            self._applied[session] = version
+            self.applies += 1
+            return True
+
+    def get_stats(self) -> Dict:
+        return {
+            'path': self.path,
+            'cookies': len(self._cookies),
+            'reloads': self.reloads,
+            'applies': self.applies,
+        }
@@ -4,16 +4,95 @@ Database utilities for managing course data
 import sqlite3
 import hashlib
 import json
+import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config.settings import Config
+from utils.db_pool import pool_for
 import logging
 
 logger = logging.getLogger(__name__)
 
+_COURSE_SLUG_RE = re.compile(r'/course/([^/?]+)')
+
+_INSERT_COURSE_SQL = '''
+    INSERT OR REPLACE INTO courses (
+        course_hash, title, instructor, original_price, discounted_price,
+        discount_percentage, coupon_code, course_url, image_url, rating,
+        students_count, duration, language, category, subtitle, description,
+        level, lectures, learn, requirements, audience, last_updated,
+        source_website, expires_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_UPDATABLE_FIELDS = [
+    'title', 'instructor', 'original_price', 'discounted_price', 'discount_percentage',
+    'coupon_code', 'image_url', 'rating', 'students_count', 'duration', 'language',
+    'category', 'subtitle', 'description', 'level', 'lectures', 'learn', 'requirements', 'audience', 'last_updated', 'source_website'
+]
+
+# Hashes per IN (...) lookup, well below SQLite's bound-parameter limit
+_HASH_LOOKUP_CHUNK = 500
+
+
+def _to_json(val):
+    """Serialize list-like fields to JSON strings"""
+    try:
+        if isinstance(val, (list, dict)):
+            return json.dumps(val, ensure_ascii=False)
+        return json.dumps(val, ensure_ascii=False) if val not in [None, ''] else None
+    except Exception:
+        return None
+
+
+def _course_row(course_hash: str, course_data: Dict, expires_at: datetime) -> tuple:
+    """Parameters for _INSERT_COURSE_SQL"""
+    return (
+        course_hash,
+        course_data.get('title', ''),
+        course_data.get('instructor', ''),
+        course_data.get('original_price', ''),
+        course_data.get('discounted_price', ''),
+        course_data.get('discount_percentage', ''),
+        course_data.get('coupon_code', ''),
+        course_data.get('course_url', ''),
+        course_data.get('image_url', ''),
+        course_data.get('rating'),
+        course_data.get('students_count'),
+        course_data.get('duration', ''),
+        course_data.get('language', ''),
+        course_data.get('category', ''),
+        course_data.get('subtitle', ''),
+        course_data.get('description', ''),
+        course_data.get('level', ''),
+        course_data.get('lectures'),
+        _to_json(course_data.get('learn')),
+        _to_json(course_data.get('requirements')),
+        _to_json(course_data.get('audience')),
+        course_data.get('last_updated', ''),
+        course_data.get('source_website', ''),
+        expires_at
+    )
+
+
+def _enrichment_update(course_hash: str, course_data: Dict) -> Optional[Tuple[str, list]]:
+    """UPDATE for the non-empty updatable fields of course_data (None when there are none)"""
+    # Build dynamic SET clause only for fields present in course_data and non-empty
+    sets = []
+    values = []
+    for f in _UPDATABLE_FIELDS:
+        if f in course_data and course_data.get(f) not in [None, '', []]:
+            sets.append(f"{f} = ?")
+            values.append(course_data.get(f))
+    if not sets:
+        return None
+    values.append(course_hash)
+    return f"UPDATE courses SET {', '.join(sets)} WHERE course_hash = ?", values
+
+
 class CourseDatabase:
     """Handles all database operations for courses"""
     
@@ -23,20 +102,18 @@ class CourseDatabase:
         if not os.path.isabs(self.db_file):
             project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
             self.db_file = os.path.join(project_root, self.db_file)
+        self.pool = pool_for(self.db_file)
         self.init_database()
+
+    def close(self):
+        """Close the file's pooled connections, shared with other instances on it (reopened on next use)"""
+        self.pool.close()
     
     def init_database(self):
         """Initialize the database with required tables"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                # Pragmas for reliability and performance on long-running bots
-                try:
-                    conn.execute('PRAGMA journal_mode=WAL')
-                    conn.execute('PRAGMA synchronous=NORMAL')
-                    conn.execute('PRAGMA temp_store=MEMORY')
-                    conn.execute('PRAGMA foreign_keys=ON')
-                except Exception:
-                    pass
+            # Pragmas for reliability and performance on long-running bots are applied by the pool
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 
                 # Create courses table
@@ -176,13 +253,9 @@ class CourseDatabase:
         # Extract course slug from URL for more reliable matching
         course_slug = ''
         if 'udemy.com/course/' in course_url:
-            try:
-                import re
-                match = re.search(r'/course/([^/?]+)', course_url)
-                if match:
-                    course_slug = match.group(1)
-            except:
-                pass
+            match = _COURSE_SLUG_RE.search(course_url)
+            if match:
+                course_slug = match.group(1)
         
         # Use title + course_slug for uniqueness (more reliable than full URL with changing coupon codes)
         hash_string = f"{title}|{course_slug}|{course_url.split('?')[0]}"  # URL without query params
@@ -191,7 +264,7 @@ class CourseDatabase:
     def course_exists(self, course_hash: str) -> bool:
         """Check if a course already exists in the database"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
                 try:
                     cursor.execute('SELECT 1 FROM courses WHERE course_hash = ? AND is_active = TRUE', (course_hash,))
@@ -209,31 +282,20 @@ class CourseDatabase:
             logger.error(f"Error checking course existence: {e}")
             return False
 
-    def _enrich_existing_course(self, course_hash: str, course_data: Dict) -> None:
+    def _enrich_existing_course(self, course_hash: str, course_data: Dict) -> bool:
         """Update existing course row with any newly provided real metadata fields."""
         try:
-            updatable_fields = [
-                'title', 'instructor', 'original_price', 'discounted_price', 'discount_percentage',
-                'coupon_code', 'image_url', 'rating', 'students_count', 'duration', 'language',
-                'category', 'subtitle', 'description', 'level', 'lectures', 'learn', 'requirements', 'audience', 'last_updated', 'source_website'
-            ]
-            # Build dynamic SET clause only for fields present in course_data and non-empty
-            sets = []
-            values = []
-            for f in updatable_fields:
-                if f in course_data and course_data.get(f) not in [None, '', []]:
-                    sets.append(f"{f} = ?")
-                    values.append(course_data.get(f))
-            if not sets:
-                return
-            values.append(course_hash)
-            query = f"UPDATE courses SET {', '.join(sets)} WHERE course_hash = ?"
-            with sqlite3.connect(self.db_file) as conn:
+            update = _enrichment_update(course_hash, course_data)
+            if update is None:
+                return False
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
-                cursor.execute(query, values)
+                cursor.execute(*update)
                 conn.commit()
+                return cursor.rowcount > 0
         except Exception as e:
             logger.debug(f"No enrichment applied (or failed) for course_hash {course_hash}: {e}")
+            return False
     
     def enrich_with(self, course_data: Dict) -> None:
         """Public helper: compute hash and enrich existing course if present."""
@@ -259,51 +321,9 @@ class CourseDatabase:
             # Calculate expiry time
             expires_at = datetime.now() + timedelta(hours=Config.COURSE_EXPIRY_HOURS)
             
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
-                # Serialize list-like fields to JSON strings
-                def _to_json(val):
-                    try:
-                        if isinstance(val, (list, dict)):
-                            return json.dumps(val, ensure_ascii=False)
-                        return json.dumps(val, ensure_ascii=False) if val not in [None, ''] else None
-                    except Exception:
-                        return None
-
-                cursor.execute('''
-                    INSERT OR REPLACE INTO courses (
-                        course_hash, title, instructor, original_price, discounted_price,
-                        discount_percentage, coupon_code, course_url, image_url, rating,
-                        students_count, duration, language, category, subtitle, description,
-                        level, lectures, learn, requirements, audience, last_updated,
-                        source_website, expires_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    course_hash,
-                    course_data.get('title', ''),
-                    course_data.get('instructor', ''),
-                    course_data.get('original_price', ''),
-                    course_data.get('discounted_price', ''),
-                    course_data.get('discount_percentage', ''),
-                    course_data.get('coupon_code', ''),
-                    course_data.get('course_url', ''),
-                    course_data.get('image_url', ''),
-                    course_data.get('rating'),
-                    course_data.get('students_count'),
-                    course_data.get('duration', ''),
-                    course_data.get('language', ''),
-                    course_data.get('category', ''),
-                    course_data.get('subtitle', ''),
-                    course_data.get('description', ''),
-                    course_data.get('level', ''),
-                    course_data.get('lectures'),
-                    _to_json(course_data.get('learn')),
-                    _to_json(course_data.get('requirements')),
-                    _to_json(course_data.get('audience')),
-                    course_data.get('last_updated', ''),
-                    course_data.get('source_website', ''),
-                    expires_at
-                ))
+                cursor.execute(_INSERT_COURSE_SQL, _course_row(course_hash, course_data, expires_at))
                 conn.commit()
                 logger.info(f"Added new course: {course_data.get('title', 'Unknown')}")
                 return True
@@ -312,12 +332,70 @@ class CourseDatabase:
             logger.error(f"Error adding course to database: {e}")
             return False
     
+    def store_batch(self, courses: List[Dict]) -> Dict:
+        """
+        Store scraped courses in one transaction, skipping those already active.
+        Each course is hashed once, existing hashes are looked up with one IN query
+        per chunk and new rows go in with executemany. Stored rows are left as they
+        are (a re-scrape carries synthesized fallbacks, not better metadata). A
+        course repeated within the batch counts as a duplicate of its first occurrence.
+        Returns counts 'new', 'duplicates' and the 'new_courses' stored.
+        """
+        result = {'new': 0, 'duplicates': 0, 'new_courses': []}
+        batch = []
+        seen = set()
+        for course in courses:
+            try:
+                course_hash = self.generate_course_hash(course)
+            except Exception as e:
+                logger.error(f"Error hashing course for storage: {e}")
+                continue
+            if course_hash in seen:
+                result['duplicates'] += 1
+                continue
+            seen.add(course_hash)
+            batch.append((course_hash, course))
+        if not batch:
+            return result
+
+        expires_at = datetime.now() + timedelta(hours=Config.COURSE_EXPIRY_HOURS)
+        try:
+            with self.pool.writer() as conn:
+                existing = set()
+                for i in range(0, len(batch), _HASH_LOOKUP_CHUNK):
+                    chunk = [h for h, _ in batch[i:i + _HASH_LOOKUP_CHUNK]]
+                    placeholders = ', '.join('?' * len(chunk))
+                    rows = conn.execute(
+                        f'SELECT course_hash FROM courses WHERE is_active = TRUE AND course_hash IN ({placeholders})',
+                        chunk
+                    )
+                    existing.update(row[0] for row in rows)
+                new = [(h, c) for h, c in batch if h not in existing]
+                conn.executemany(_INSERT_COURSE_SQL, [_course_row(h, c, expires_at) for h, c in new])
+        except Exception as e:
+            # One bad row fails the whole transaction: store course by course instead
+            logger.warning(f"Batch store failed ({e}); storing {len(batch)} courses one by one")
+            for course_hash, course in batch:
+                if self.course_exists(course_hash):
+                    result['duplicates'] += 1
+                elif self.add_course(course):
+                    result['new'] += 1
+                    result['new_courses'].append(course)
+            return result
+
+        for _, course in new:
+            logger.info(f"Added new course: {course.get('title', 'Unknown')}")
+        result['new'] = len(new)
+        result['new_courses'] = [c for _, c in new]
+        result['duplicates'] += len(batch) - len(new)
+        return result
+    
     def get_unposted_courses(self, limit: int = None) -> List[Dict]:
         """Get courses that haven't been posted to the channel yet"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 
                 query = '''
                     SELECT * FROM courses 
@@ -340,9 +418,9 @@ class CourseDatabase:
     def get_active_courses(self, limit: int = None) -> List[Dict]:
         """Get active, non-expired courses"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row
                 query = '''
                     SELECT * FROM courses
                     WHERE is_active = TRUE
@@ -360,7 +438,7 @@ class CourseDatabase:
     def mark_course_posted(self, course_id: int) -> bool:
         """Mark a course as posted to the channel"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     'UPDATE courses SET posted_to_channel = TRUE WHERE id = ?',
@@ -375,7 +453,7 @@ class CourseDatabase:
     def cleanup_expired_courses(self) -> int:
         """Remove expired courses from the database"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     'UPDATE courses SET is_active = FALSE WHERE expires_at < CURRENT_TIMESTAMP'
@@ -392,7 +470,7 @@ class CourseDatabase:
     def get_scrape_progress(self, source: str) -> int:
         """Return last_page cursor for a given source, or 0 if none."""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT last_page FROM scrape_progress WHERE source = ?', (source,))
                 row = cursor.fetchone()
@@ -404,7 +482,7 @@ class CourseDatabase:
     def set_scrape_progress(self, source: str, last_page: int) -> bool:
         """Upsert last_page cursor for a given source."""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     '''INSERT INTO scrape_progress (source, last_page, updated_at)
@@ -421,7 +499,7 @@ class CourseDatabase:
     # ---------------- Generic KV helpers ----------------
     def get_progress_key(self, key: str, default: int = 0) -> int:
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute('SELECT v FROM scrape_kv WHERE k = ?', (key,))
                 row = cursor.fetchone()
@@ -437,7 +515,7 @@ class CourseDatabase:
 
     def set_progress_key(self, key: str, value: int) -> bool:
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     '''INSERT INTO scrape_kv (k, v, updated_at)
@@ -451,10 +529,39 @@ class CourseDatabase:
             logger.error(f"Error writing KV progress for {key}: {e}")
             return False
 
+    def get_kv(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        """Read a raw text value from scrape_kv (e.g. JSON blobs)."""
+        try:
+            with self.pool.reader() as conn:
+                cursor = conn.cursor()
+                cursor.execute('SELECT v FROM scrape_kv WHERE k = ?', (key,))
+                row = cursor.fetchone()
+                return row[0] if row and row[0] is not None else default
+        except Exception as e:
+            logger.error(f"Error reading KV value for {key}: {e}")
+            return default
+
+    def set_kv(self, key: str, value: str) -> bool:
+        """Upsert a raw text value into scrape_kv."""
+        try:
+            with self.pool.writer() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    '''INSERT INTO scrape_kv (k, v, updated_at)
+                       VALUES (?, ?, CURRENT_TIMESTAMP)
+                       ON CONFLICT(k) DO UPDATE SET v = excluded.v, updated_at = CURRENT_TIMESTAMP''',
+                    (key, value)
+                )
+                conn.commit()
+                return True
+        except Exception as e:
+            logger.error(f"Error writing KV value for {key}: {e}")
+            return False
+
     def purge_inactive_courses(self, older_than_days: int = 30) -> int:
         """Hard-delete inactive courses older than retention window to keep DB lean."""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
                 cursor = conn.cursor()
                 cursor.execute(
                     '''DELETE FROM courses
@@ -474,10 +581,14 @@ class CourseDatabase:
     def vacuum(self) -> bool:
         """Compact the database to reclaim disk space (safe to run periodically)."""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.writer() as conn:
+                conn.commit()
+                previous = conn.isolation_level
                 conn.isolation_level = None  # Required by VACUUM in some contexts
-                cursor = conn.cursor()
-                cursor.execute('VACUUM')
+                try:
+                    conn.execute('VACUUM')
+                finally:
+                    conn.isolation_level = previous
             logger.info("Database VACUUM completed")
             return True
         except Exception as e:
@@ -487,7 +598,7 @@ class CourseDatabase:
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         try:
-            with sqlite3.connect(self.db_file) as conn:
+            with self.pool.reader() as conn:
                 cursor = conn.cursor()
                 
                 # Total courses
@@ -539,7 +650,7 @@ class CourseDatabase:
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 backup_file = f"backup_{timestamp}.db"
             
-            with sqlite3.connect(self.db_file) as source:
+            with self.pool.reader() as source:
                 with sqlite3.connect(backup_file) as backup:
                     source.backup(backup)
             
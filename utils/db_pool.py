@@ -0,0 +1,170 @@
+"""
+Process-wide SQLite connections: one writer plus a few readers per database file
+"""
+import queue
+import sqlite3
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, Sequence, Tuple
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+# Applied once when a connection is opened (journal_mode is persistent, the rest per connection)
+DEFAULT_PRAGMAS: Tuple[str, ...] = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA foreign_keys=ON',
+)
+
+
+class SQLitePool:
+    """
+    Keeps connections to one database file open instead of reconnecting per call.
+    Writes go through a single connection behind a re-entrant lock (SQLite allows
+    one writer at a time anyway); reads check out one of up to `readers`
+    connections, which WAL lets run alongside the writer. Connections are shared
+    across threads but only ever used by one thread at a time. Each keeps its
+    own prepared-statement cache. close() releases everything; the pool reopens
+    connections on the next use. With persistent=False every checkout opens and
+    closes its own connection (the old per-call behaviour).
+    """
+
+    def __init__(self, db_file: str, readers: int = 4, cached_statements: int = 256, timeout: float = 5.0,
+                 pragmas: Sequence[str] = DEFAULT_PRAGMAS, persistent: bool = True):
+        self.db_file = db_file
+        self.readers = max(1, int(readers))
+        self.cached_statements = max(0, int(cached_statements))
+        self.timeout = timeout
+        self.pragmas = tuple(pragmas)
+        self.persistent = persistent
+        self._lock = threading.Lock()
+        self._writer_lock = threading.RLock()
+        self._writer = None
+        self._writer_depth = 0
+        self._reader_slots = threading.BoundedSemaphore(self.readers)
+        self._idle: 'queue.LifoQueue[Tuple[int, sqlite3.Connection]]' = queue.LifoQueue()
+        # Bumped by close(): connections from an older generation are closed when returned
+        self._generation = 0
+        self.stats = {'connects': 0, 'reads': 0, 'writes': 0}
+
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_file, timeout=self.timeout, check_same_thread=False,
+                               cached_statements=self.cached_statements)
+        for pragma in self.pragmas:
+            try:
+                conn.execute(pragma)
+            except Exception:
+                pass
+        if read_only:
+            conn.execute('PRAGMA query_only=ON')
+        with self._lock:
+            self.stats['connects'] += 1
+        return conn
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """The writer connection; commits on success and rolls back on error (outermost use only)"""
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+            conn = self._writer
+            self._writer_depth += 1
+            try:
+                yield conn
+                if self._writer_depth == 1:
+                    conn.commit()
+            except BaseException:
+                if self._writer_depth == 1:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        pass
+                raise
+            finally:
+                self._writer_depth -= 1
+                with self._lock:
+                    self.stats['writes'] += 1
+                if self._writer_depth == 0 and not self.persistent:
+                    self._writer = None
+                    conn.close()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """A read-only connection for the duration of the block"""
+        self._reader_slots.acquire()
+        try:
+            try:
+                generation, conn = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    generation = self._generation
+                conn = self._connect(read_only=True)
+            try:
+                yield conn
+            finally:
+                with self._lock:
+                    self.stats['reads'] += 1
+                    keep = self.persistent and generation == self._generation
+                if conn.in_transaction:
+                    conn.rollback()
+                if keep:
+                    self._idle.put((generation, conn))
+                else:
+                    conn.close()
+        finally:
+            self._reader_slots.release()
+
+    def close(self):
+        """Close all idle connections and the writer (readers in use close when returned)"""
+        with self._lock:
+            self._generation += 1
+        while True:
+            try:
+                _, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except Exception:
+                pass
+        with self._writer_lock:
+            if self._writer is not None and self._writer_depth == 0:
+                try:
+                    self._writer.close()
+                except Exception:
+                    pass
+                self._writer = None
+
+    def snapshot(self) -> Dict[str, int]:
+        """Connection and checkout counters"""
+        with self._lock:
+            return dict(self.stats, idle_readers=self._idle.qsize(), writer_open=int(self._writer is not None))
+
+
+_pools: Dict[str, SQLitePool] = {}
+_pools_lock = threading.Lock()
+
+
+def pool_for(db_file: str) -> SQLitePool:
+    """
+    The pool for db_file, configured from Config (DB_POOL_*, DB_CACHED_STATEMENTS).
+    Every caller asking for the same file (by resolved path) shares one pool, so
+    the process has a single writer connection per database.
+    """
+    key = os.path.realpath(db_file)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = SQLitePool(
+                db_file,
+                readers=getattr(Config, 'DB_POOL_READERS', 4),
+                cached_statements=getattr(Config, 'DB_CACHED_STATEMENTS', 256),
+                persistent=getattr(Config, 'DB_POOL_ENABLED', True),
+            )
+        return pool
@@ -0,0 +1,84 @@
+"""
+Per-host politeness scheduler for scraper traffic
+"""
+import time
+import threading
+import logging
+from typing import Dict, Optional
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+class HostScheduler:
+    """
+    Enforces a minimum gap between request starts to the same host.
+
+    Each call reserves the host's next free slot, so a thread only sleeps when
+    that host's budget is exhausted; requests to other hosts are never delayed.
+    Intervals are matched by domain suffix ('udemy.com' covers 'www.udemy.com').
+    """
+
+    def __init__(self, intervals: Optional[Dict[str, float]] = None, default_interval: Optional[float] = None):
+        conf = intervals if intervals is not None else getattr(Config, 'HOST_MIN_INTERVALS', {})
+        self.intervals = {k.lower().lstrip('.'): max(0.0, float(v)) for k, v in (conf or {}).items()}
+        self.default_interval = max(0.0, float(
+            default_interval if default_interval is not None else getattr(Config, 'HOST_DEFAULT_MIN_INTERVAL', 0.0)
+        ))
+        self._lock = threading.Lock()
+        self._next_free: Dict[str, float] = {}
+        self._stats: Dict[str, Dict] = {}
+
+    def interval_for(self, host: str) -> float:
+        """Configured gap for a host (longest matching domain suffix wins)"""
+        host = (host or '').lower()
+        best, best_len = self.default_interval, -1
+        for domain, gap in self.intervals.items():
+            if (host == domain or host.endswith('.' + domain)) and len(domain) > best_len:
+                best, best_len = gap, len(domain)
+        return best
+
+    def reserve(self, host: str) -> float:
+        """Claim the host's next slot and return how long the caller must wait for it"""
+        gap = self.interval_for(host)
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_free.get(host, 0.0))
+            self._next_free[host] = slot + gap
+            delay = slot - now
+            st = self._stats.setdefault(host, {'requests': 0, 'waits': 0, 'waited_s': 0.0})
+            st['requests'] += 1
+            if delay > 0:
+                st['waits'] += 1
+                st['waited_s'] += delay
+            return delay
+
+    def acquire(self, host: str) -> float:
+        """Block until the host may be contacted; returns the time slept"""
+        delay = self.reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def defer(self, host: str, seconds: float):
+        """Push the host's next slot out (backoff) without blocking the caller or other hosts"""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._next_free[host] = max(self._next_free.get(host, 0.0), time.monotonic() + seconds)
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-host request/wait counters"""
+        with self._lock:
+            return {
+                host: {
+                    'interval': self.interval_for(host),
+                    'requests': st['requests'],
+                    'waits': st['waits'],
+                    'waited_s': round(st['waited_s'], 2),
+                }
+                for host, st in self._stats.items()
+            }
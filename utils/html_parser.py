@@ -0,0 +1,55 @@
+"""
+HTML parser backend selection for BeautifulSoup.
+
+Config.HTML_PARSER picks the tree builder ('lxml', 'html.parser', 'html5lib'
+or 'auto' = fastest installed). A backend whose library is missing falls back
+to the stdlib 'html.parser' so the scrapers keep working on minimal installs.
+"""
+import logging
+from functools import lru_cache
+from typing import List, Optional
+from bs4 import BeautifulSoup, FeatureNotFound
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_PARSER = 'html.parser'
+# Fastest first; 'auto' takes the first one that is installed
+_PREFERENCE = ['lxml', FALLBACK_PARSER]
+
+
+@lru_cache(maxsize=None)
+def _parser_available(name: str) -> bool:
+    try:
+        BeautifulSoup('<p></p>', name)
+        return True
+    except FeatureNotFound:
+        return False
+
+
+def available_parsers() -> List[str]:
+    """Tree builders usable in this environment"""
+    return [name for name in ('lxml', 'html5lib', FALLBACK_PARSER) if _parser_available(name)]
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(requested: Optional[str] = None) -> str:
+    """Parser name to hand to BeautifulSoup for the requested (or configured) backend"""
+    name = (requested or getattr(Config, 'HTML_PARSER', 'auto') or 'auto').strip().lower()
+    if name == 'auto':
+        for candidate in _PREFERENCE:
+            if _parser_available(candidate):
+                return candidate
+        return FALLBACK_PARSER
+    if _parser_available(name):
+        return name
+    logger.warning(f"HTML parser '{name}' is not installed; falling back to {FALLBACK_PARSER}")
+    return FALLBACK_PARSER
+
+
+def make_soup(html_content: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """BeautifulSoup tree built with the configured backend"""
+    return BeautifulSoup(html_content, resolve_parser(parser))
@@ -0,0 +1,180 @@
+"""
+Concurrent HTTP engine shared by the scrapers.
+
+Scrapers run inside a background thread and talk to sites through a blocking
+requests/cloudscraper session, so concurrency is provided by a bounded worker
+pool instead of an event loop. Each host gets its own in-flight cap, adapted
+to how the host is responding, and the session's connection pools are sized
+for the largest cap, so keep-alive connections are
+reused instead of being opened and dropped per request.
+"""
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Callable, Dict, Iterable, List, Optional, Any
+from urllib.parse import urlparse
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+def host_of(url: str) -> str:
+    """Return the lowercase host name of a URL ('' when it cannot be parsed)"""
+    try:
+        return (urlparse(url).hostname or '').lower()
+    except Exception:
+        return ''
+
+
+def configure_connection_pool(session, pool_connections: int, pool_maxsize: int) -> None:
+    """Resize the keep-alive pools of every adapter mounted on a requests session.
+
+    Works for plain requests adapters and cloudscraper's cipher-suite adapter
+    (which forwards to HTTPAdapter.init_poolmanager with its SSL context).
+    """
+    for prefix, adapter in list(getattr(session, 'adapters', {}).items()):
+        if not hasattr(adapter, 'init_poolmanager'):
+            continue
+        try:
+            adapter.init_poolmanager(pool_connections, pool_maxsize, block=False)
+        except Exception as e:
+            logger.debug(f"Could not resize connection pool for {prefix}: {e}")
+
+
+class AdaptiveHostLimiter:
+    """
+    Per-host in-flight cap that adapts with AIMD (additive increase, multiplicative decrease).
+
+    Each host starts at `initial` concurrent requests. Every healthy response adds
+    1/window, so the window grows by about one per window's worth of successes.
+    A blocked response (403/429/challenge/overload) scales the window down by
+    `decrease_factor`, at most once per `cooldown` seconds so one burst of failures
+    from requests already in flight only counts once. Setting min_window equal to
+    max_window gives a fixed cap.
+    """
+
+    def __init__(self, initial: Optional[int] = None, min_window: Optional[int] = None,
+                 max_window: Optional[int] = None, decrease_factor: Optional[float] = None,
+                 cooldown: Optional[float] = None):
+        self.min_window = max(1, int(min_window or getattr(Config, 'AIMD_MIN_WINDOW', 1)))
+        self.max_window = max(self.min_window, int(max_window or getattr(Config, 'AIMD_MAX_WINDOW', 12)))
+        start = int(initial or getattr(Config, 'HTTP_MAX_PER_HOST', 4))
+        self.initial = float(min(self.max_window, max(self.min_window, start)))
+        self.decrease_factor = min(0.95, max(0.05, float(
+            decrease_factor if decrease_factor is not None else getattr(Config, 'AIMD_DECREASE_FACTOR', 0.5)
+        )))
+        self.cooldown = float(cooldown if cooldown is not None else getattr(Config, 'AIMD_DECREASE_COOLDOWN', 5.0))
+        self._cond = threading.Condition()
+        self._hosts: Dict[str, Dict] = {}
+
+    def _entry(self, host: str) -> Dict:
+        st = self._hosts.get(host)
+        if st is None:
+            st = {'window': self.initial, 'in_flight': 0, 'last_decrease': 0.0,
+                  'increases': 0, 'decreases': 0, 'ok': 0, 'blocked': 0}
+            self._hosts[host] = st
+        return st
+
+    @contextmanager
+    def slot(self, host: str):
+        """Hold one of the host's request slots for the duration of the block"""
+        with self._cond:
+            st = self._entry(host)
+            while st['in_flight'] >= int(st['window']):
+                self._cond.wait()
+            st['in_flight'] += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                st['in_flight'] -= 1
+                self._cond.notify_all()
+
+    def feedback(self, host: str, ok: bool):
+        """Report a healthy (ok=True) or blocked (ok=False) response from host"""
+        with self._cond:
+            st = self._entry(host)
+            if ok:
+                st['ok'] += 1
+                if st['window'] < self.max_window:
+                    before = int(st['window'])
+                    st['window'] = min(float(self.max_window), st['window'] + 1.0 / st['window'])
+                    if int(st['window']) > before:
+                        st['increases'] += 1
+                        self._cond.notify_all()
+                return
+            st['blocked'] += 1
+            now = time.monotonic()
+            if now - st['last_decrease'] < self.cooldown:
+                return
+            st['last_decrease'] = now
+            new_window = max(float(self.min_window), st['window'] * self.decrease_factor)
+            if new_window < st['window']:
+                st['decreases'] += 1
+                logger.info(f"Reducing concurrency for {host}: {st['window']:.1f} -> {new_window:.1f}")
+            st['window'] = new_window
+
+    def window(self, host: str) -> int:
+        with self._cond:
+            return int(self._entry(host)['window'])
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Current window, in-flight count and AIMD counters per host"""
+        with self._cond:
+            return {
+                host: {
+                    'window': int(st['window']),
+                    'max': self.max_window,
+                    'in_flight': st['in_flight'],
+                    'increases': st['increases'],
+                    'decreases': st['decreases'],
+                    'ok': st['ok'],
+                    'blocked': st['blocked'],
+                }
+                for host, st in self._hosts.items()
+            }
+
+
+class HttpEngine:
+    """Bounded worker pool plus adaptive per-host limits for running fetches concurrently"""
+
+    def __init__(self, max_workers: Optional[int] = None, per_host: Optional[int] = None):
+        self.max_workers = max(1, int(max_workers or getattr(Config, 'HTTP_MAX_WORKERS', 16)))
+        self.limiter = AdaptiveHostLimiter(initial=per_host)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='http')
+            return self._executor
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Schedule fn(*args, **kwargs) on the worker pool"""
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def map(self, fn: Callable, items: Iterable[Any]) -> List[Any]:
+        """Run fn over items concurrently and return results in input order.
+        Exceptions raised by fn are returned as None for that item."""
+        futures = [self.submit(fn, item) for item in items]
+        results = []
+        for fut in futures:
+            try:
+                results.append(fut.result())
+            except Exception as e:
+                logger.debug(f"Concurrent fetch failed: {e}")
+                results.append(None)
+        return results
+
+    def shutdown(self, wait: bool = False):
+        """Stop the worker pool (a new one is created on next use)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
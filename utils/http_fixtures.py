@@ -0,0 +1,174 @@
+"""
+Record/replay transport adapters for offline scraper runs.
+
+Recording wraps the session's real adapters and appends every exchange to a
+JSONL fixture bundle (one JSON object per line, optionally gzip-compressed
+when the path ends in .gz). Replay serves those exchanges back from memory,
+with optional injected latency, so a full scrape can be benchmarked
+deterministically without network access.
+"""
+import base64
+import gzip
+import io
+import json
+import threading
+import time
+import logging
+from typing import Dict, List, Optional
+import requests
+from requests.adapters import BaseAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+# Body is stored decoded, so transfer/compression headers would no longer be true
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def _open_bundle(path: str, mode: str):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def load_bundle(path: str) -> List[Dict]:
+    """Read all recorded exchanges from a fixture bundle"""
+    entries = []
+    with _open_bundle(path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
+
+
+class RecordingAdapter(BaseAdapter):
+    """Delegates to a real adapter and records each request/response pair"""
+
+    def __init__(self, inner: BaseAdapter, bundle_path: str):
+        super().__init__()
+        self.inner = inner
+        self.bundle_path = bundle_path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(bundle_path)), exist_ok=True)
+
+    def send(self, request, **kwargs):
+        started = time.monotonic()
+        response = self.inner.send(request, **kwargs)
+        # Reading the body here keeps it available to the caller (iter_content replays _content)
+        body = response.content or b''
+        entry = {
+            'method': request.method,
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'body_b64': base64.b64encode(body).decode('ascii'),
+            'elapsed': round(time.monotonic() - started, 4),
+            'recorded_at': time.time(),
+        }
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            with _open_bundle(self.bundle_path, 'a') as f:
+                f.write(line + '\n')
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Serves responses from a fixture bundle instead of the network.
+
+    Exchanges are matched on method + URL; repeated requests for the same URL
+    walk through the recorded responses in order and then keep returning the
+    last one. Unknown URLs get a 404 so scrapers take their normal error path.
+    """
+
+    def __init__(self, bundle_path: str, latency: Optional[float] = None, use_recorded_latency: Optional[bool] = None):
+        super().__init__()
+        self.bundle_path = bundle_path
+        self.latency = float(latency if latency is not None else getattr(Config, 'HTTP_REPLAY_LATENCY', 0.0))
+        self.use_recorded_latency = bool(
+            use_recorded_latency if use_recorded_latency is not None
+            else getattr(Config, 'HTTP_REPLAY_RECORDED_LATENCY', False)
+        )
+        self._lock = threading.Lock()
+        self._exchanges: Dict[tuple, List[Dict]] = {}
+        self._served: Dict[tuple, int] = {}
+        for entry in load_bundle(bundle_path):
+            self._exchanges.setdefault((entry['method'].upper(), entry['url']), []).append(entry)
+        self.hits = 0
+        self.misses = 0
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        key = (request.method.upper(), request.url)
+        with self._lock:
+            recorded = self._exchanges.get(key)
+            if recorded:
+                idx = self._served.get(key, 0)
+                self._served[key] = idx + 1
+                entry = recorded[min(idx, len(recorded) - 1)]
+                self.hits += 1
+            else:
+                entry = None
+                self.misses += 1
+        if entry is None:
+            logger.debug(f"Replay miss: {request.method} {request.url}")
+        delay = self.latency + (float(entry.get('elapsed', 0.0)) if entry and self.use_recorded_latency else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        return self._build_response(request, entry)
+
+    def _build_response(self, request, entry: Optional[Dict]) -> Response:
+        response = Response()
+        if entry is None:
+            response.status_code = 404
+            response.reason = 'Not In Fixture Bundle'
+            body = b''
+        else:
+            response.status_code = int(entry['status'])
+            response.reason = entry.get('reason') or ''
+            response.headers = CaseInsensitiveDict(entry.get('headers') or {})
+            body = base64.b64decode(entry.get('body_b64') or '')
+        response.raw = io.BytesIO(body)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {'bundle': self.bundle_path, 'exchanges': sum(len(v) for v in self._exchanges.values()),
+                    'hits': self.hits, 'misses': self.misses}
+
+
+def install_fixture_adapters(session: requests.Session) -> Optional[str]:
+    """Mount replay or recording adapters on session according to Config.
+    Returns 'replay', 'record' or None."""
+    replay_path = getattr(Config, 'HTTP_REPLAY_BUNDLE', '')
+    record_path = getattr(Config, 'HTTP_RECORD_BUNDLE', '')
+    if replay_path:
+        adapter = ReplayAdapter(replay_path)
+        for prefix in ('https://', 'http://'):
+            session.mount(prefix, adapter)
+        logger.info(f"Replaying HTTP from fixture bundle {replay_path}")
+        return 'replay'
+    if record_path:
+        for prefix, adapter in list(session.adapters.items()):
+            if not isinstance(adapter, RecordingAdapter):
+                session.mount(prefix, RecordingAdapter(adapter, record_path))
+        logger.info(f"Recording HTTP exchanges to fixture bundle {record_path}")
+        return 'record'
+    return None
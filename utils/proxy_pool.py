@@ -0,0 +1,177 @@
+"""
+Optional rotating proxy pool for scraper traffic.
+
+Proxies are scored from an exponentially weighted success rate and latency;
+each request goes to the best-scoring healthy proxy (penalised by how busy it
+already is). A proxy that fails several times in a row is quarantined for a
+while. Hosts whose cookies are tied to the client IP (Cloudflare clearance)
+keep a sticky proxy for as long as it stays healthy.
+"""
+import time
+import threading
+import logging
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+import requests
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+_EWMA_ALPHA = 0.3
+
+
+def _normalize_proxy(line: str) -> Optional[str]:
+    line = line.strip()
+    if not line or line.startswith('#'):
+        return None
+    if '://' not in line:
+        line = 'http://' + line
+    return line
+
+
+def display_name(proxy: str) -> str:
+    """Proxy URL without credentials (safe for logs and /status)"""
+    try:
+        u = urlparse(proxy)
+        return f"{u.scheme}://{u.hostname}:{u.port}" if u.port else f"{u.scheme}://{u.hostname}"
+    except Exception:
+        return '<proxy>'
+
+
+class ProxyPool:
+    """Health-scored proxy selection with quarantine and per-host stickiness"""
+
+    def __init__(self, proxies: Iterable[str], sticky_hosts: Optional[Iterable[str]] = None,
+                 quarantine_after: Optional[int] = None, quarantine_seconds: Optional[float] = None,
+                 allow_direct: Optional[bool] = None):
+        self._lock = threading.Lock()
+        self._proxies: Dict[str, Dict] = {}
+        for p in proxies:
+            p = _normalize_proxy(p)
+            if p and p not in self._proxies:
+                self._proxies[p] = {'success': 1.0, 'latency': 0.5, 'in_flight': 0, 'fails_in_row': 0,
+                                    'quarantined_until': 0.0, 'requests': 0, 'failures': 0, 'quarantines': 0}
+        conf_sticky = getattr(Config, 'PROXY_STICKY_HOSTS', '') if sticky_hosts is None else sticky_hosts
+        if isinstance(conf_sticky, str):
+            conf_sticky = conf_sticky.split(',')
+        self.sticky_domains = [d.strip().lower().lstrip('.') for d in conf_sticky if d and d.strip()]
+        self.quarantine_after = max(1, int(quarantine_after or getattr(Config, 'PROXY_QUARANTINE_AFTER', 3)))
+        self.quarantine_seconds = float(
+            quarantine_seconds if quarantine_seconds is not None else getattr(Config, 'PROXY_QUARANTINE_SECONDS', 300)
+        )
+        self.allow_direct = bool(allow_direct if allow_direct is not None else getattr(Config, 'PROXY_ALLOW_DIRECT', True))
+        self._sticky: Dict[str, str] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> 'ProxyPool':
+        """Load proxies from a file: one URL (or host:port) per line, '#' for comments"""
+        with open(path, 'r', encoding='utf-8') as f:
+            proxies = [line for line in f]
+        pool = cls(proxies, **kwargs)
+        logger.info(f"Loaded {len(pool)} proxies from {path}")
+        return pool
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def _is_sticky(self, host: str) -> bool:
+        return any(host == d or host.endswith('.' + d) for d in self.sticky_domains)
+
+    def _healthy(self, st: Dict, now: float) -> bool:
+        return st['quarantined_until'] <= now
+
+    @staticmethod
+    def _score(st: Dict) -> float:
+        return st['success'] / (st['latency'] + 0.1) / (1 + st['in_flight'])
+
+    def acquire(self, host: str) -> Optional[str]:
+        """Proxy URL to use for a request to host (None = connect directly)"""
+        now = time.monotonic()
+        with self._lock:
+            if not self._proxies:
+                return None
+            choice = None
+            if self._is_sticky(host):
+                pinned = self._sticky.get(host)
+                if pinned and self._healthy(self._proxies[pinned], now):
+                    choice = pinned
+            if choice is None:
+                healthy = [(p, st) for p, st in self._proxies.items() if self._healthy(st, now)]
+                untried = [p for p, st in healthy if st['requests'] == 0 and st['in_flight'] == 0]
+                if untried:
+                    # Measure every proxy at least once before trusting the scores
+                    choice = untried[0]
+                elif healthy:
+                    choice = max(healthy, key=lambda item: self._score(item[1]))[0]
+                elif self.allow_direct:
+                    return None
+                else:
+                    # Everything quarantined: use the proxy that comes back first
+                    choice = min(self._proxies.items(), key=lambda item: item[1]['quarantined_until'])[0]
+                if self._is_sticky(host):
+                    self._sticky[host] = choice
+            self._proxies[choice]['in_flight'] += 1
+            return choice
+
+    def release(self, proxy: Optional[str], ok: bool, elapsed: Optional[float] = None):
+        """Report the outcome of a request made through proxy"""
+        if proxy is None:
+            return
+        with self._lock:
+            st = self._proxies.get(proxy)
+            if st is None:
+                return
+            st['in_flight'] = max(0, st['in_flight'] - 1)
+            st['requests'] += 1
+            st['success'] = (1 - _EWMA_ALPHA) * st['success'] + _EWMA_ALPHA * (1.0 if ok else 0.0)
+            if elapsed is not None:
+                st['latency'] = (1 - _EWMA_ALPHA) * st['latency'] + _EWMA_ALPHA * elapsed
+            if ok:
+                st['fails_in_row'] = 0
+                return
+            st['failures'] += 1
+            st['fails_in_row'] += 1
+            if st['fails_in_row'] >= self.quarantine_after:
+                st['quarantined_until'] = time.monotonic() + self.quarantine_seconds
+                st['fails_in_row'] = 0
+                st['quarantines'] += 1
+                for host in [h for h, p in self._sticky.items() if p == proxy]:
+                    del self._sticky[host]
+                logger.warning(f"Quarantining proxy {display_name(proxy)} for {self.quarantine_seconds:.0f}s")
+
+    def probe(self, url: str, timeout: float = 10.0) -> Dict[str, bool]:
+        """Fetch url through every proxy once and feed the results into the scores"""
+        results = {}
+        for proxy in list(self._proxies):
+            started = time.monotonic()
+            try:
+                r = requests.get(url, proxies={'http': proxy, 'https': proxy}, timeout=timeout)
+                ok = r.status_code < 400
+            except requests.exceptions.RequestException:
+                ok = False
+            with self._lock:
+                self._proxies[proxy]['in_flight'] += 1
+            self.release(proxy, ok, time.monotonic() - started)
+            results[display_name(proxy)] = ok
+        return results
+
+    def snapshot(self) -> List[Dict]:
+        """Per-proxy health (credentials stripped)"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'proxy': display_name(p),
+                    'healthy': self._healthy(st, now),
+                    'success': round(st['success'], 2),
+                    'latency_ms': round(st['latency'] * 1000),
+                    'requests': st['requests'],
+                    'failures': st['failures'],
+                    'quarantines': st['quarantines'],
+                    'sticky_hosts': sorted(h for h, sp in self._sticky.items() if sp == p),
+                }
+                for p, st in self._proxies.items()
+            ]
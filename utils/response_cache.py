@@ -0,0 +1,177 @@
+"""
+Persistent on-disk cache for fetched Udemy course pages.
+
+Bodies are gzip-compressed and stored content-addressed (sha256 of the page),
+so identical pages share one blob. A small SQLite index maps the canonical
+course URL to its blob with fetch/access times, which gives TTL expiry and
+LRU eviction under a size cap. SQLite locking plus atomic blob renames make
+the cache safe to share between the bot and scripts/enrich_db_metadata.py.
+"""
+import gzip
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import logging
+from typing import Dict, Optional
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+_COURSE_SLUG_RE = re.compile(r'udemy\.com/course/([^/?#]+)', re.IGNORECASE)
+
+
+def canonical_course_url(url: str) -> str:
+    """Canonical key for a Udemy course URL (drops coupon, locale and other query params)"""
+    m = _COURSE_SLUG_RE.search(url or '')
+    if m:
+        return f"https://www.udemy.com/course/{m.group(1).lower()}/"
+    return (url or '').split('#')[0].split('?')[0]
+
+
+class ResponseCache:
+    """Compressed, content-addressed page cache with TTL and LRU size cap"""
+
+    def __init__(self, directory: Optional[str] = None, ttl: Optional[int] = None, max_bytes: Optional[int] = None):
+        directory = directory or getattr(Config, 'UDEMY_CACHE_DIR', 'cache/udemy')
+        # Resolve relative paths against the project root so every entry point shares one cache
+        if not os.path.isabs(directory):
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            directory = os.path.join(project_root, directory)
+        self.directory = directory
+        self.blob_dir = os.path.join(directory, 'blobs')
+        self.index_file = os.path.join(directory, 'index.db')
+        self.ttl = int(ttl if ttl is not None else getattr(Config, 'UDEMY_CACHE_TTL', 6 * 3600))
+        self.max_bytes = int(max_bytes if max_bytes is not None else getattr(Config, 'UDEMY_CACHE_MAX_MB', 200) * 1024 * 1024)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(self.blob_dir, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    blob TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_blob ON entries(blob)')
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_file, timeout=10)
+        try:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+        except Exception:
+            pass
+        return conn
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.gz")
+
+    def get(self, url: str) -> Optional[str]:
+        """Cached page text for url, or None when missing or older than the TTL"""
+        key = canonical_course_url(url)
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute('SELECT blob, fetched_at FROM entries WHERE key = ?', (key,)).fetchone()
+                if not row or (self.ttl > 0 and now - row[1] > self.ttl):
+                    with self._lock:
+                        self.misses += 1
+                    return None
+                with gzip.open(self._blob_path(row[0]), 'rb') as f:
+                    text = f.read().decode('utf-8')
+                conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (now, key))
+            with self._lock:
+                self.hits += 1
+            return text
+        except Exception as e:
+            # Blob evicted by another process, corrupt file, locked index...: treat as a miss
+            logger.debug(f"Response cache read failed for {key}: {e}")
+            with self._lock:
+                self.misses += 1
+            return None
+
+    def put(self, url: str, text: str) -> None:
+        """Store page text for url and evict least recently used entries over the size cap"""
+        key = canonical_course_url(url)
+        raw = text.encode('utf-8')
+        digest = hashlib.sha256(raw).hexdigest()
+        path = self._blob_path(digest)
+        now = time.time()
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp, 'wb') as f:
+                    f.write(gzip.compress(raw))
+                os.replace(tmp, path)
+            size = os.path.getsize(path)
+            with self._connect() as conn:
+                conn.execute(
+                    '''INSERT INTO entries (key, blob, size, fetched_at, accessed_at)
+                       VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT(key) DO UPDATE SET blob = excluded.blob, size = excluded.size,
+                           fetched_at = excluded.fetched_at, accessed_at = excluded.accessed_at''',
+                    (key, digest, size, now, now)
+                )
+                self._evict(conn)
+        except Exception as e:
+            logger.debug(f"Response cache write failed for {key}: {e}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        if self.max_bytes <= 0:
+            return
+        total = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY blob)'
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, digest, size in conn.execute('SELECT key, blob, size FROM entries ORDER BY accessed_at ASC').fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+            self.evictions += 1
+            still_used = conn.execute('SELECT 1 FROM entries WHERE blob = ? LIMIT 1', (digest,)).fetchone()
+            if not still_used:
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+                total -= size
+
+    def clear(self) -> None:
+        """Drop every entry and blob"""
+        with self._connect() as conn:
+            for (digest,) in conn.execute('SELECT DISTINCT blob FROM entries').fetchall():
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+            conn.execute('DELETE FROM entries')
+
+    def get_stats(self) -> Dict:
+        """Hit/miss counters for this process plus on-disk totals"""
+        try:
+            with self._connect() as conn:
+                entries, size = conn.execute(
+                    'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM (SELECT blob, MAX(size) AS size FROM entries GROUP BY blob)'
+                ).fetchone()
+        except Exception:
+            entries, size = 0, 0
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'blobs': entries,
+            'bytes': size,
+        }
@@ -0,0 +1,180 @@
+"""
+Retry policy and per-host circuit breaker for scraper HTTP traffic
+"""
+import random
+import time
+import threading
+import logging
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+import requests
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504, 520, 521, 522, 523, 524})
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while the host's breaker is open"""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is worth repeating and how long to back off.
+
+    Only transient failures are retried (timeouts, connection errors, 408/429/5xx);
+    other 4xx answers are final. Delays grow exponentially with full jitter, and a
+    server-supplied Retry-After takes precedence when present.
+    """
+
+    def __init__(self, attempts: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None, max_retry_after: Optional[float] = None):
+        self.attempts = max(1, int(attempts or getattr(Config, 'HTTP_RETRY_ATTEMPTS', 3)))
+        self.base_delay = float(base_delay if base_delay is not None else getattr(Config, 'HTTP_RETRY_BASE_DELAY', 1.0))
+        self.max_delay = float(max_delay if max_delay is not None else getattr(Config, 'HTTP_RETRY_MAX_DELAY', 30.0))
+        self.max_retry_after = float(
+            max_retry_after if max_retry_after is not None else getattr(Config, 'HTTP_RETRY_AFTER_MAX', 120.0)
+        )
+
+    @staticmethod
+    def status_of(exc: Optional[BaseException] = None, response: Optional[requests.Response] = None) -> Optional[int]:
+        resp = response if response is not None else getattr(exc, 'response', None)
+        return getattr(resp, 'status_code', None)
+
+    def is_retryable(self, exc: Optional[BaseException] = None, response: Optional[requests.Response] = None) -> bool:
+        """True for transient failures: connection problems, timeouts, 408/429/5xx"""
+        if isinstance(exc, CircuitOpenError):
+            return False
+        status = self.status_of(exc, response)
+        if status is not None:
+            return status in RETRYABLE_STATUS
+        return isinstance(exc, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                                requests.exceptions.ChunkedEncodingError))
+
+    def retry_after(self, exc: Optional[BaseException] = None, response: Optional[requests.Response] = None) -> Optional[float]:
+        resp = response if response is not None else getattr(exc, 'response', None)
+        if resp is None:
+            return None
+        return parse_retry_after(resp.headers.get('Retry-After'))
+
+    def delay(self, attempt: int, exc: Optional[BaseException] = None,
+              response: Optional[requests.Response] = None) -> Optional[float]:
+        """Backoff before retry number `attempt` (0-based), or None when the server
+        asks us to wait longer than we are willing to"""
+        hinted = self.retry_after(exc, response)
+        if hinted is not None:
+            return hinted if hinted <= self.max_retry_after else None
+        ceiling = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+
+class CircuitBreaker:
+    """
+    Per-host breaker: after `threshold` consecutive failures the host is skipped
+    for `cooldown` seconds, then a single probe request decides whether it closes
+    again or re-opens for another cool-down.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, threshold: Optional[int] = None, cooldown: Optional[float] = None):
+        self.threshold = max(1, int(threshold or getattr(Config, 'BREAKER_FAILURE_THRESHOLD', 5)))
+        self.cooldown = float(cooldown if cooldown is not None else getattr(Config, 'BREAKER_COOLDOWN', 120))
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, Dict] = {}
+
+    def _entry(self, host: str) -> Dict:
+        st = self._hosts.get(host)
+        if st is None:
+            st = {'state': self.CLOSED, 'failures': 0, 'opened_at': 0.0, 'probing': False,
+                  'trips': 0, 'rejected': 0}
+            self._hosts[host] = st
+        return st
+
+    def allow(self, host: str) -> bool:
+        """Whether a request to host may be sent now"""
+        with self._lock:
+            st = self._entry(host)
+            if st['state'] == self.CLOSED:
+                return True
+            if st['state'] == self.OPEN and time.monotonic() - st['opened_at'] >= self.cooldown:
+                st['state'] = self.HALF_OPEN
+                st['probing'] = False
+            if st['state'] == self.HALF_OPEN and not st['probing']:
+                st['probing'] = True
+                return True
+            st['rejected'] += 1
+            return False
+
+    def record_success(self, host: str):
+        with self._lock:
+            st = self._entry(host)
+            if st['state'] != self.CLOSED:
+                logger.info(f"Circuit closed for {host}")
+            st['state'] = self.CLOSED
+            st['failures'] = 0
+            st['probing'] = False
+
+    def record_failure(self, host: str):
+        with self._lock:
+            st = self._entry(host)
+            st['failures'] += 1
+            if st['state'] == self.HALF_OPEN or (st['state'] == self.CLOSED and st['failures'] >= self.threshold):
+                st['state'] = self.OPEN
+                st['opened_at'] = time.monotonic()
+                st['probing'] = False
+                st['trips'] += 1
+                logger.warning(f"Circuit opened for {host} after {st['failures']} consecutive failures; "
+                               f"pausing {self.cooldown:.0f}s")
+
+    def release_probe(self, host: str):
+        """Hand back a half-open probe whose request said nothing about the host (e.g. a dead proxy)"""
+        with self._lock:
+            st = self._entry(host)
+            if st['state'] == self.HALF_OPEN:
+                st['probing'] = False
+
+    def state(self, host: str) -> str:
+        with self._lock:
+            return self._entry(host)['state']
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-host breaker state"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                host: {
+                    'state': st['state'],
+                    'failures': st['failures'],
+                    'trips': st['trips'],
+                    'rejected': st['rejected'],
+                    'retry_in': round(max(0.0, self.cooldown - (now - st['opened_at'])), 1)
+                    if st['state'] == self.OPEN else 0.0,
+                }
+                for host, st in self._hosts.items()
+            }
@@ -57,6 +57,7 @@ class ScraperManager:
                     logger.error(f"Scraper {scraper_name} failed: {e}")
         
         logger.info(f"Total courses scraped from all sources: {len(all_courses)}")
+        self.save_sessions()
         return all_courses
     
     def scrape_single_source(self, source_name: str, limit: int = None) -> List[Dict]:
@@ -69,6 +70,7 @@ class ScraperManager:
             scraper = self.scrapers[source_name]
             courses = scraper.scrape_courses(limit)
             logger.info(f"Scraped {len(courses)} courses from {source_name}")
+            self.save_sessions()
             return courses
             
         except Exception as e:
@@ -84,6 +86,61 @@ class ScraperManager:
         
         return stats
     
+    def get_circuit_states(self) -> Dict[str, Dict]:
+        """Per-host circuit breaker state across all scrapers (worst state wins per host)"""
+        rank = {'closed': 0, 'half_open': 1, 'open': 2}
+        merged: Dict[str, Dict] = {}
+        for scraper in self.scrapers.values():
+            for host, st in scraper.breaker.snapshot().items():
+                cur = merged.get(host)
+                if cur is None or rank.get(st['state'], 0) > rank.get(cur['state'], 0):
+                    merged[host] = dict(st)
+        return merged
+    
+    def get_transport_states(self) -> Dict[str, Dict]:
+        """Per-host transport choice and latency across all scrapers"""
+        merged: Dict[str, Dict] = {}
+        for scraper in self.scrapers.values():
+            for host, st in scraper.transport.snapshot().items():
+                cur = merged.get(host)
+                if cur is None or st['transport'] == 'cloudscraper':
+                    merged[host] = dict(st)
+        return merged
+    
+    def get_concurrency_windows(self) -> Dict[str, Dict]:
+        """Per-host adaptive concurrency window across all scrapers (smallest window wins)"""
+        merged: Dict[str, Dict] = {}
+        for scraper in self.scrapers.values():
+            for host, st in scraper.http.limiter.snapshot().items():
+                cur = merged.get(host)
+                if cur is None or st['window'] < cur['window']:
+                    merged[host] = dict(st)
+        return merged
+    
+    def save_sessions(self, force: bool = False):
+        """Persist scraper session cookies (periodic unless forced, e.g. on shutdown)"""
+        for name, scraper in self.scrapers.items():
+            try:
+                scraper.save_session_state(force=force)
+            except Exception as e:
+                logger.warning(f"Could not save session state for {name}: {e}")
+    
+    def commit_listing_validators(self):
+        """Let scrapers skip unchanged listing pages next run (call after the scraped courses are stored)"""
+        for name, scraper in self.scrapers.items():
+            try:
+                scraper.commit_listing_validators()
+            except Exception as e:
+                logger.warning(f"Could not save listing validators for {name}: {e}")
+    
+    def close(self):
+        """Release resources scrapers keep across runs (database connections)"""
+        for name, scraper in self.scrapers.items():
+            try:
+                scraper.close()
+            except Exception as e:
+                logger.warning(f"Could not close {name}: {e}")
+    
     def reset_all_statistics(self):
         """Reset statistics for all scrapers"""
         for scraper in self.scrapers.values():
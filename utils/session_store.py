@@ -0,0 +1,139 @@
+"""
+Disk persistence for scraper HTTP sessions.
+
+Cookie jars (including Cloudflare clearance cookies) are saved per scraper and
+transport together with the User-Agent they were issued to, and restored when
+the scraper starts so a restart does not have to solve challenges again.
+Expired cookies are dropped on load, and clearance cookies are only restored
+when the User-Agent still matches.
+"""
+import json
+import time
+import threading
+import logging
+from typing import Dict, List, Optional
+import requests
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+# Cookies Cloudflare ties to the client fingerprint (User-Agent)
+_UA_BOUND_PREFIXES = ('cf_clearance', '__cf_bm', 'cf_chl', '__cflb')
+
+
+def _is_ua_bound(name: str) -> bool:
+    return any((name or '').startswith(p) for p in _UA_BOUND_PREFIXES)
+
+
+class SessionStore:
+    """JSON file of cookie jars keyed by '<scraper>:<transport>'"""
+
+    def __init__(self, path: Optional[str] = None, max_age: Optional[int] = None):
+        path = path or getattr(Config, 'SESSION_STORE_FILE', 'cache/sessions.json')
+        if not os.path.isabs(path):
+            project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            path = os.path.join(project_root, path)
+        self.path = path
+        self.max_age = int(max_age if max_age is not None else getattr(Config, 'SESSION_STORE_MAX_AGE', 7 * 86400))
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable session store {self.path}: {e}")
+            return {}
+
+    def _write(self, data: Dict):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # One temp file per writer thread; owner-only because it holds cookies
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with os.fdopen(os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def _dump_cookies(session: requests.Session) -> List[Dict]:
+        now = time.time()
+        cookies = []
+        for c in session.cookies:
+            if c.expires is not None and c.expires <= now:
+                continue
+            cookies.append({
+                'name': c.name,
+                'value': c.value,
+                'domain': c.domain,
+                'path': c.path,
+                'secure': bool(c.secure),
+                'expires': c.expires,
+                'rest': {k: v for k, v in getattr(c, '_rest', {}).items() if isinstance(v, (str, type(None)))},
+            })
+        return cookies
+
+    def save(self, key: str, session: requests.Session, user_agent: str, extra: Optional[Dict] = None):
+        """Persist session's cookies (and optional extra state) under key"""
+        entry = {
+            'user_agent': user_agent,
+            'saved_at': time.time(),
+            'cookies': self._dump_cookies(session),
+        }
+        if extra:
+            entry.update(extra)
+        with self._lock:
+            data = self._read()
+            data[key] = entry
+            try:
+                self._write(data)
+            except Exception as e:
+                logger.warning(f"Could not save session state for {key}: {e}")
+
+    def load(self, key: str) -> Optional[Dict]:
+        """Stored entry for key, or None when missing or older than max_age"""
+        with self._lock:
+            entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        if self.max_age > 0 and time.time() - float(entry.get('saved_at', 0)) > self.max_age:
+            return None
+        return entry
+
+    def restore(self, key: str, session: requests.Session, user_agent: str) -> int:
+        """Load unexpired cookies for key into session; returns how many were restored.
+        Clearance cookies are skipped when they were issued to a different User-Agent."""
+        entry = self.load(key)
+        if not entry:
+            return 0
+        same_ua = entry.get('user_agent') == user_agent
+        now = time.time()
+        restored = 0
+        for c in entry.get('cookies') or []:
+            expires = c.get('expires')
+            if expires is not None and expires <= now:
+                continue
+            if not same_ua and _is_ua_bound(c.get('name', '')):
+                continue
+            try:
+                session.cookies.set(
+                    c['name'], c['value'], domain=c.get('domain', ''), path=c.get('path', '/'),
+                    secure=c.get('secure', False), expires=expires, rest=c.get('rest') or {}
+                )
+                restored += 1
+            except Exception:
+                continue
+        if restored:
+            logger.info(f"Restored {restored} cookies for {key}")
+        return restored
@@ -0,0 +1,103 @@
+"""
+Singleflight: collapse identical concurrent or repeated calls into one
+"""
+import time
+import threading
+import logging
+from typing import Any, Callable, Dict, Hashable, Optional
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Runs fn once per key: callers arriving while it is in flight wait for and
+    share its result (or exception). Successful (truthy) results are also
+    remembered, so later callers in the same run reuse them. Call new_run() at
+    the start of each run; with a ttl > 0 remembered results survive across
+    runs until they are ttl seconds old.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = float(ttl if ttl is not None else getattr(Config, 'SINGLEFLIGHT_TTL', 0))
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._memo: Dict[Hashable, tuple] = {}
+        self.calls = 0
+        self.executed = 0
+        self.joined = 0
+        self.memo_hits = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any], memo: bool = True) -> Any:
+        """Return fn() for key, sharing one execution between overlapping callers"""
+        with self._lock:
+            self.calls += 1
+            if memo and key in self._memo:
+                self.memo_hits += 1
+                return self._memo[key][1]
+            call = self._in_flight.get(key)
+            if call is not None:
+                self.joined += 1
+                leader = False
+            else:
+                call = _Call()
+                self._in_flight[key] = call
+                self.executed += 1
+                leader = True
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                # Failures are not remembered so a later caller can try again
+                if memo and call.error is None and call.result:
+                    self._memo[key] = (time.monotonic(), call.result)
+            call.done.set()
+        return call.result
+
+    def new_run(self):
+        """Forget remembered results (keeping those younger than ttl, if set)"""
+        with self._lock:
+            if self.ttl <= 0:
+                self._memo.clear()
+                return
+            cutoff = time.monotonic() - self.ttl
+            for key in [k for k, (ts, _) in self._memo.items() if ts < cutoff]:
+                del self._memo[key]
+
+    @property
+    def saved(self) -> int:
+        """Calls answered without doing the work themselves"""
+        return self.joined + self.memo_hits
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'executed': self.executed,
+                'joined_in_flight': self.joined,
+                'memo_hits': self.memo_hits,
+                'saved': self.joined + self.memo_hits,
+                'remembered': len(self._memo),
+            }
@@ -0,0 +1,92 @@
+"""
+Hit rate and cost bookkeeping for a set of interchangeable extraction strategies.
+
+Strategies are ordered by expected hits per second of work: the smoothed hit
+rate divided by the smoothed average cost plus a fixed per-attempt overhead
+(without it a near-free strategy that never hits would outrank a slow one
+that always does). Until a strategy has data the
+priors make all scores equal, so the declared order is kept; counts are
+halved once a strategy passes decay_at attempts so the order keeps adapting
+when a site changes its markup. Optional tiers pin groups of strategies ahead
+of others (e.g. validated extractions before loose fallbacks); scores only
+reorder strategies within the same tier.
+"""
+import threading
+from typing import Dict, Iterable, List, Optional
+
+
+class StrategyStats:
+    """Per-strategy attempts/hits/cost with an adaptive execution order"""
+
+    def __init__(self, names: Iterable[str], prior_hits: float = 1.0, prior_attempts: float = 2.0,
+                 prior_cost: float = 0.05, decay_at: int = 1000, tiers: Optional[Dict[str, int]] = None,
+                 attempt_overhead: float = 0.05):
+        self.names: List[str] = list(names)
+        # name -> tier; lower tiers always run first (unlisted names go in tier 0)
+        self.tiers: Dict[str, int] = {n: int((tiers or {}).get(n, 0)) for n in self.names}
+        self.prior_hits = prior_hits
+        self.prior_attempts = prior_attempts
+        self.prior_cost = prior_cost
+        self.decay_at = max(10, int(decay_at))
+        self.attempt_overhead = max(0.0, attempt_overhead)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {n: {'attempts': 0.0, 'hits': 0.0, 'cost': 0.0} for n in self.names}
+
+    def _score(self, st: Dict[str, float]) -> float:
+        hit_rate = (st['hits'] + self.prior_hits) / (st['attempts'] + self.prior_attempts)
+        avg_cost = (st['cost'] + self.prior_cost * self.prior_attempts) / (st['attempts'] + self.prior_attempts)
+        return hit_rate / max(avg_cost + self.attempt_overhead, 1e-6)
+
+    def order(self) -> List[str]:
+        """Strategy names by tier, most hits per second first within a tier (declared order breaks ties)"""
+        with self._lock:
+            scores = {n: self._score(self._stats[n]) for n in self.names}
+        return sorted(self.names, key=lambda n: (self.tiers[n], -scores[n]))
+
+    def record(self, name: str, hit: bool, elapsed: float):
+        """Account one attempt of strategy name"""
+        with self._lock:
+            st = self._stats.get(name)
+            if st is None:
+                return
+            st['attempts'] += 1
+            st['hits'] += 1 if hit else 0
+            st['cost'] += max(0.0, elapsed)
+            if st['attempts'] >= self.decay_at:
+                for key in st:
+                    st[key] /= 2
+
+    def export(self) -> Dict[str, Dict[str, float]]:
+        """Raw counters (for persisting)"""
+        with self._lock:
+            return {n: dict(st) for n, st in self._stats.items()}
+
+    def load(self, data: Optional[Dict]):
+        """Restore counters saved by export (unknown names are ignored)"""
+        if not isinstance(data, dict):
+            return
+        with self._lock:
+            for name, st in data.items():
+                if name in self._stats and isinstance(st, dict):
+                    for key in ('attempts', 'hits', 'cost'):
+                        try:
+                            self._stats[name][key] = max(0.0, float(st.get(key, 0.0)))
+                        except (TypeError, ValueError):
+                            pass
+
+    def snapshot(self) -> List[Dict]:
+        """Per-strategy hit rate, average cost and score, in current execution order"""
+        order = self.order()
+        with self._lock:
+            return [
+                {
+                    'strategy': n,
+                    'tier': self.tiers[n],
+                    'attempts': round(self._stats[n]['attempts'], 1),
+                    'hits': round(self._stats[n]['hits'], 1),
+                    'hit_rate': round(self._stats[n]['hits'] / self._stats[n]['attempts'], 3) if self._stats[n]['attempts'] else None,
+                    'avg_ms': round(self._stats[n]['cost'] / self._stats[n]['attempts'] * 1000, 1) if self._stats[n]['attempts'] else None,
+                    'score': round(self._score(self._stats[n]), 2),
+                }
+                for n in order
+            ]
@@ -0,0 +1,184 @@
+"""
+Per-host transport selection: plain requests first, cloudscraper only when challenged.
+
+Most hosts answer a plain requests session just fine; cloudscraper adds
+challenge-detection work to every response. The selector starts every host
+on the plain session, recognises Cloudflare challenge responses, and moves
+that host to the cloudscraper session for a while (TRANSPORT_ESCALATION_TTL)
+before trying plain again.
+"""
+import time
+import threading
+import logging
+from typing import Callable, Dict, Optional, Tuple
+import requests
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config.settings import Config
+
+logger = logging.getLogger(__name__)
+
+PLAIN = 'plain'
+CLOUDSCRAPER = 'cloudscraper'
+
+_CHALLENGE_STATUS = {403, 429, 503}
+_CHALLENGE_MARKERS = (
+    'cf-browser-verification', 'challenge-platform', '_cf_chl_opt', 'cf_chl_',
+    'Just a moment...', 'Attention Required! | Cloudflare', 'cf-challenge', 'jschl-answer',
+)
+
+
+def is_challenge(response: requests.Response, body_available: bool = True) -> bool:
+    """Whether a response is a Cloudflare challenge/interstitial rather than real content"""
+    if response is None:
+        return False
+    mitigated = (response.headers.get('cf-mitigated') or '').lower()
+    if mitigated == 'challenge':
+        return True
+    if response.status_code not in _CHALLENGE_STATUS:
+        return False
+    if 'cloudflare' not in (response.headers.get('Server') or '').lower():
+        return False
+    if not body_available:
+        # Streaming: do not consume the body; a Cloudflare 403/503 is almost always a challenge
+        return True
+    try:
+        head = response.text[:20000]
+    except Exception:
+        return False
+    return any(marker in head for marker in _CHALLENGE_MARKERS)
+
+
+class TransportSelector:
+    """Hands out the plain or cloudscraper session per host and tracks their latency"""
+
+    def __init__(self, session_factory: Callable[[bool], Optional[requests.Session]],
+                 mode: Optional[str] = None, escalation_ttl: Optional[float] = None):
+        self._factory = session_factory
+        self.mode = (mode or getattr(Config, 'HTTP_TRANSPORT', 'auto')).lower()
+        self.escalation_ttl = float(
+            escalation_ttl if escalation_ttl is not None else getattr(Config, 'TRANSPORT_ESCALATION_TTL', 3600)
+        )
+        self._lock = threading.Lock()
+        self._challenge_session: Optional[requests.Session] = None
+        self._challenge_unavailable = False
+        self._escalated_until: Dict[str, float] = {}
+        self._stats: Dict[str, Dict] = {}
+        if self.mode == CLOUDSCRAPER:
+            self.plain = self._get_challenge_session() or session_factory(False)
+        else:
+            self.plain = session_factory(False)
+
+    def _get_challenge_session(self) -> Optional[requests.Session]:
+        with self._lock:
+            if self._challenge_session is None and not self._challenge_unavailable:
+                session = self._factory(True)
+                if session is None:
+                    self._challenge_unavailable = True
+                    logger.warning("cloudscraper is not installed; challenged hosts stay on plain requests")
+                else:
+                    # Carry over cookies gathered so far (site sessions, Udemy login cookies)
+                    if getattr(self, 'plain', None) is not None:
+                        session.cookies.update(self.plain.cookies)
+                    self._challenge_session = session
+            return self._challenge_session
+
+    def session_for(self, host: str) -> Tuple[requests.Session, str]:
+        """Session to use for host and its transport name"""
+        if self.mode == PLAIN:
+            return self.plain, PLAIN
+        if self.mode == CLOUDSCRAPER:
+            return self.plain, CLOUDSCRAPER if self._challenge_session is not None else PLAIN
+        with self._lock:
+            until = self._escalated_until.get(host, 0.0)
+        if until > time.monotonic():
+            challenge = self._get_challenge_session()
+            if challenge is not None:
+                return challenge, CLOUDSCRAPER
+        return self.plain, PLAIN
+
+    def escalate(self, host: str) -> bool:
+        """Move host onto cloudscraper for the escalation TTL; False when that is not possible"""
+        if self.mode != 'auto':
+            return False
+        session = self._get_challenge_session()
+        if session is None:
+            return False
+        with self._lock:
+            self._escalated_until[host] = time.monotonic() + self.escalation_ttl
+            st = self._entry(host)
+            st['escalations'] += 1
+        logger.info(f"Challenge detected on {host}; using cloudscraper for {self.escalation_ttl:.0f}s")
+        return True
+
+    def _entry(self, host: str) -> Dict:
+        st = self._stats.get(host)
+        if st is None:
+            st = {'escalations': 0, 'challenges': 0, PLAIN: [0, 0.0], CLOUDSCRAPER: [0, 0.0]}
+            self._stats[host] = st
+        return st
+
+    def record(self, host: str, transport: str, elapsed: float, challenged: bool = False):
+        """Account one request's latency (and whether it was a challenge) to host/transport"""
+        with self._lock:
+            st = self._entry(host)
+            st[transport][0] += 1
+            st[transport][1] += elapsed
+            if challenged:
+                st['challenges'] += 1
+
+    def all_sessions(self):
+        """Every session created so far (for cookie updates and shutdown)"""
+        sessions = [self.plain]
+        if self._challenge_session is not None and self._challenge_session is not self.plain:
+            sessions.append(self._challenge_session)
+        return sessions
+
+    def sessions_by_transport(self) -> Dict[str, requests.Session]:
+        """Created sessions keyed by transport name"""
+        if self.mode == CLOUDSCRAPER and self._challenge_session is not None:
+            return {CLOUDSCRAPER: self.plain}
+        sessions = {PLAIN: self.plain}
+        if self._challenge_session is not None:
+            sessions[CLOUDSCRAPER] = self._challenge_session
+        return sessions
+
+    def export_escalations(self) -> Dict[str, float]:
+        """Hosts currently on cloudscraper with their expiry as a wall-clock timestamp"""
+        now_mono, now_wall = time.monotonic(), time.time()
+        with self._lock:
+            return {host: now_wall + (until - now_mono)
+                    for host, until in self._escalated_until.items() if until > now_mono}
+
+    def import_escalations(self, escalations: Optional[Dict[str, float]]):
+        """Re-apply escalations saved by export_escalations (expired ones are ignored)"""
+        if self.mode != 'auto' or not escalations:
+            return
+        now_mono, now_wall = time.monotonic(), time.time()
+        with self._lock:
+            for host, until_wall in escalations.items():
+                remaining = float(until_wall) - now_wall
+                if remaining > 0:
+                    self._escalated_until[host] = now_mono + remaining
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Per-host transport in use, escalation state and average latency per transport"""
+        now = time.monotonic()
+        with self._lock:
+            out = {}
+            for host, st in self._stats.items():
+                remaining = self._escalated_until.get(host, 0.0) - now
+                if self.mode == 'auto':
+                    current = CLOUDSCRAPER if remaining > 0 and self._challenge_session is not None else PLAIN
+                else:
+                    current = CLOUDSCRAPER if self.mode == CLOUDSCRAPER and self._challenge_session is not None else PLAIN
+                out[host] = {
+                    'transport': current,
+                    'escalated_for': round(max(0.0, remaining), 1) if self.mode == 'auto' else 0.0,
+                    'escalations': st['escalations'],
+                    'challenges': st['challenges'],
+                    'requests': {t: st[t][0] for t in (PLAIN, CLOUDSCRAPER) if st[t][0]},
+                    'avg_ms': {t: round(st[t][1] / st[t][0] * 1000) for t in (PLAIN, CLOUDSCRAPER) if st[t][0]},
+                }
+            return out